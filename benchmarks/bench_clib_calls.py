@@ -0,0 +1,48 @@
+"""
+Measure the per-call overhead of getting the GMT API functions via ctypes.
+
+Compares setting the ctypes prototypes on every call (what Session methods
+used to do) against the prototypes bound once when the library is loaded.
+"""
+import ctypes as ctp
+import timeit
+
+from pygmt.clib import Session
+
+NUMBER = 100_000
+
+
+def old_get_libgmt_func(lib, name, argtypes=None, restype=None):
+    """
+    The previous implementation: assign argtypes and restype on every call.
+    """
+    function = getattr(lib._libgmt, name)  # pylint: disable=protected-access
+    if argtypes is not None:
+        function.argtypes = argtypes
+    if restype is not None:
+        function.restype = restype
+    return function
+
+
+def main():
+    """
+    Run the benchmark and print the time per call.
+    """
+    with Session() as lib:
+        lib.get_libgmt_func("GMT_Call_Module")  # load the library
+        argtypes = [ctp.c_void_p, ctp.c_char_p, ctp.c_int, ctp.c_void_p]
+        cases = {
+            "before: set prototype on each call": lambda: old_get_libgmt_func(
+                lib, "GMT_Call_Module", argtypes=argtypes, restype=ctp.c_int
+            ),
+            "after: prebound prototype": lambda: lib.get_libgmt_func("GMT_Call_Module"),
+            "constant lookup (Session.__getitem__)": lambda: lib["GMT_MODULE_CMD"],
+            "GMT_Get_Default round trip": lambda: lib.get_default("API_VERSION"),
+        }
+        for label, func in cases.items():
+            seconds = timeit.timeit(func, number=NUMBER)
+            print(f"{label:40s} {seconds / NUMBER * 1e6:8.3f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure passing a 10-million-row time series to GMT.
+
+Compares converting the datetimes to ISO strings (what Session.put_vector
+used to do, with GMT parsing the strings back) against converting them to
+numbers in the GMT time system, both for the conversion alone and for a full
+time-series plot.
+"""
+import time
+
+import numpy as np
+import pygmt
+from pygmt.clib.conversion import array_to_datetime, datetime_to_numeric
+
+NROWS = 10_000_000
+
+
+def best_of(func, repeat=3):
+    """
+    The shortest run time of a function, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def plot(x, y, region):
+    """
+    Plot a time series in a new figure.
+    """
+    fig = pygmt.Figure()
+    fig.plot(x=x, y=y, region=region, projection="X20c/10c", frame=True, pen="1p")
+
+
+def main():
+    """
+    Run the benchmark and print the timings.
+    """
+    times = np.datetime64("2000-01-01") + np.arange(NROWS).astype("timedelta64[s]")
+    values = np.sin(np.linspace(0, 100, NROWS))
+    region = [times[0], times[-1], -1, 1]
+    strings = np.datetime_as_string(times)
+
+    cases = {
+        "convert: ISO strings (before)": lambda: np.char.encode(
+            np.datetime_as_string(array_to_datetime(times))
+        ),
+        "convert: numbers (after)": lambda: datetime_to_numeric(times),
+        # Passing the strings themselves is what GMT had to parse before
+        "plot: ISO strings (before)": lambda: plot(strings, values, region),
+        "plot: datetime64 (after)": lambda: plot(times, values, region),
+    }
+    for label, func in cases.items():
+        print(f"{label:32s} {best_of(func):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measure converting 10-million-row pandas extension type columns for GMT.
+
+Compares the usual workaround (converting the column to an object array and
+then to a numpy type) against the conversions done by
+pygmt.clib.conversion.vectors_to_arrays for nullable integers, text
+categories and Arrow strings (if pyarrow is installed). Also times passing
+each column to GMT with info.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+from pygmt import clib
+from pygmt.clib.conversion import (
+    categorical_to_codes,
+    strings_to_ctypes_array,
+    vectors_to_arrays,
+)
+from pygmt.helpers import GMTTempFile
+
+NROWS = 10_000_000
+
+
+def best_of(func, repeat=3):
+    """
+    The shortest run time of a function, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def object_round_trip(series):
+    """
+    Convert a column through an object array, like users had to.
+    """
+    values = series.astype(object)
+    if pd.api.types.is_string_dtype(series.dtype):
+        return strings_to_ctypes_array(values.fillna("").to_numpy(dtype=str))
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels = series.cat.categories.tolist()
+        return np.array([np.nan if pd.isna(v) else labels.index(v) for v in values])
+    return values.where(values.notna(), np.nan).to_numpy(dtype=np.float64)
+
+
+def fast_path(series):
+    """
+    Convert a column with the extension type fast paths.
+    """
+    (array,) = vectors_to_arrays([series])
+    if pd.api.types.is_string_dtype(series.dtype):
+        return strings_to_ctypes_array(array)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return categorical_to_codes(array)[0]
+    return array
+
+
+def info(series):
+    """
+    Pass a numeric column to GMT (as the y of an x/y table).
+    """
+    x = np.arange(NROWS, dtype=np.float64)
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, series) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("info", f"{vfile} ->{outfile.name}")
+
+
+def main():
+    """
+    Run the benchmark and print the timings.
+    """
+    rng = np.random.default_rng(seed=0)
+    integers = pd.Series(rng.integers(0, 1000, NROWS), dtype="Int64")
+    integers[rng.random(NROWS) < 0.1] = None
+    labels = np.array(["sand", "silt", "clay", "gravel"], dtype=object)
+    categories = pd.Series(
+        pd.Categorical.from_codes(rng.integers(-1, len(labels), NROWS), labels)
+    )
+    columns = {"Int64 with NA": integers, "category": categories}
+    try:
+        columns["string[pyarrow]"] = categories.astype(str).astype("string[pyarrow]")
+    except ImportError:
+        print("pyarrow isn't installed, skipping string[pyarrow]")
+
+    for name, series in columns.items():
+        for label, func in [
+            ("object round-trip (before)", object_round_trip),
+            ("fast path (after)", fast_path),
+        ]:
+            timing = best_of(lambda: func(series), repeat=1 if "before" in label else 3)
+            print(f"{name:16s} convert: {label:28s} {timing:8.3f} s")
+    timing = best_of(lambda: categorical_to_codes(categories))
+    print(f"{'category':16s} codes and labels: {timing:8.3f} s")
+    for name in ["Int64 with NA", "category"]:
+        print(f"{name:16s} info: {best_of(lambda: info(columns[name])):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
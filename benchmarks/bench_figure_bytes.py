@@ -0,0 +1,55 @@
+"""
+Measure rendering a figure to PNG bytes, like a map server would.
+
+Compares saving the figure to a file in the current directory and reading it
+back (what users had to do before) against Figure.to_bytes, which renders in
+shared memory.
+"""
+import os
+import time
+
+import pygmt
+
+FNAME = "bench_figure_bytes.png"
+
+
+def best_of(func, repeat=5):
+    """
+    The shortest run time of a function, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def savefig_and_read(fig, dpi):
+    """
+    Save the figure to a file and read the bytes back.
+    """
+    fig.savefig(FNAME, dpi=dpi)
+    with open(FNAME, "rb") as image:
+        png = image.read()
+    os.remove(FNAME)
+    return png
+
+
+def main():
+    """
+    Run the benchmark and print the timings.
+    """
+    fig = pygmt.Figure()
+    fig.coast(region=[-30, 30, 30, 70], projection="M15c", land="gray", frame=True)
+    for dpi in [100, 300]:
+        cases = {
+            f"savefig + read, dpi={dpi} (before)": lambda: savefig_and_read(fig, dpi),
+            f"to_bytes, dpi={dpi} (after)": lambda: fig.to_bytes(fmt="png", dpi=dpi),
+        }
+        for label, func in cases.items():
+            print(f"{label:36s} {best_of(func):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Measure the time it takes to "import pygmt" in a fresh interpreter.
+
+Also lists the heavy modules loaded by the import, which should be none.
+"""
+import statistics
+import subprocess
+import sys
+
+REPEAT = 10
+HEAVY = ["numpy", "pandas", "xarray", "pygmt.clib", "pygmt.src"]
+CODE = f"""
+import sys, time
+start = time.perf_counter()
+import pygmt
+elapsed = time.perf_counter() - start
+loaded = [m for m in {HEAVY!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def main():
+    """
+    Run the benchmark and print the median import time.
+    """
+    times = []
+    for _ in range(REPEAT):
+        output = subprocess.check_output([sys.executable, "-c", CODE], encoding="utf-8")
+        elapsed, *loaded = output.split()
+        times.append(float(elapsed))
+    print(f"import pygmt: {statistics.median(times) * 1e3:.1f} ms (median of {REPEAT})")
+    print(f"heavy modules loaded: {loaded[0] if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,41 +18,100 @@ Here are just a few of the things that PyGMT does well:
   - Generate publication-quality illustrations and make animations
 """
 
-import atexit as _atexit
-
-from pkg_resources import get_distribution
-
-# Import modules to make the high-level GMT Python API
-from pygmt import datasets
-from pygmt.accessors import GMTDataArrayAccessor
-from pygmt.figure import Figure, set_display
-from pygmt.session_management import begin as _begin
-from pygmt.session_management import end as _end
-from pygmt.src import (
-    blockmean,
-    blockmedian,
-    config,
-    grd2cpt,
-    grdcut,
-    grdfilter,
-    grdinfo,
-    grdtrack,
-    info,
-    makecpt,
-    surface,
-    which,
-    x2sys_cross,
-    x2sys_init,
-)
-
-# Get semantic version through setuptools-scm
-__version__ = f'v{get_distribution("pygmt").version}'  # e.g. v0.1.2.dev3+g0ab3cd78
-__commit__ = __version__.split("+g")[-1] if "+g" in __version__ else ""  # 0ab3cd78
-
-# Start our global modern mode session
-_begin()
-# Tell Python to run _end when shutting down
-_atexit.register(_end)
+import importlib as _importlib
+import sys as _sys
+
+# The public API is imported lazily (see __getattr__ below) so that
+# "import pygmt" is fast and doesn't load numpy, pandas, xarray or libgmt until
+# they are needed. Maps the public names to the modules defining them.
+_LAZY_ATTRIBUTES = {
+    "GMTDataArrayAccessor": "pygmt.accessors",
+    "Figure": "pygmt.figure",
+    "Palette": "pygmt.palette",
+    "set_display": "pygmt.figure",
+    "session": "pygmt.session_management",
+    **{
+        name: "pygmt.src"
+        for name in [
+            "blockmean",
+            "blockmedian",
+            "config",
+            "grd2cpt",
+            "grdcut",
+            "grdfilter",
+            "grdinfo",
+            "grdtrack",
+            "info",
+            "makecpt",
+            "surface",
+            "which",
+            "x2sys_cross",
+            "x2sys_init",
+        ]
+    },
+}
+_LAZY_SUBMODULES = ["accessors", "clib", "datasets", "exceptions", "helpers", "src"]
+
+__all__ = [
+    *_LAZY_ATTRIBUTES,
+    *_LAZY_SUBMODULES,
+    "print_clib_info",
+    "show_versions",
+    "test",
+]
+
+
+def _get_version():
+    """
+    Get the semantic version through the package metadata (setuptools-scm).
+    """
+    try:
+        from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+            version,
+        )
+    except ImportError:  # Python 3.7
+        # pylint: disable=import-outside-toplevel
+        from pkg_resources import get_distribution
+
+        return f'v{get_distribution("pygmt").version}'
+    return f'v{version("pygmt")}'  # e.g. v0.1.2.dev3+g0ab3cd78
+
+
+def __getattr__(name):
+    """
+    Import the public API and the version information on first access.
+
+    The first access to the public API also registers the "gmt" accessor of
+    :class:`xarray.DataArray` (see :mod:`pygmt.accessors`).
+    """
+    if name in _LAZY_ATTRIBUTES or name in _LAZY_SUBMODULES:
+        _importlib.import_module("pygmt.accessors")
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = _importlib.import_module(f"{__name__}.{name}")
+    elif name == "__version__":
+        value = _get_version()
+    elif name == "__commit__":
+        version = __getattr__("__version__")
+        value = version.split("+g")[-1] if "+g" in version else ""  # 0ab3cd78
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the module attributes, including the lazily imported ones.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+# Register the "gmt" accessor right away if xarray is loaded already (it's
+# cheap then). Otherwise, it's registered with the public API or pygmt.clib.
+if "xarray" in _sys.modules:
+    _importlib.import_module("pygmt.accessors")
 
 
 def print_clib_info():
@@ -147,7 +206,7 @@ def show_versions():
     deps = ["numpy", "pandas", "xarray", "netCDF4", "packaging"]
 
     print("PyGMT information:")
-    print(f"  version: {__version__}")
+    print(f"  version: {_get_version()}")
 
     print("System information:")
     for key, val in sys_info.items():
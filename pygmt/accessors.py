@@ -3,7 +3,6 @@ GMT accessor methods.
 """
 import xarray as xr
 from pygmt.exceptions import GMTInvalidInput
-from pygmt.src.grdinfo import grdinfo
 
 
 @xr.register_dataarray_accessor("gmt")
@@ -26,6 +25,10 @@ class GMTDataArrayAccessor:
     """
 
     def __init__(self, xarray_obj):
+        # Imported here because this module is imported by pygmt.clib, possibly
+        # while pygmt.src is being imported
+        from pygmt.src.grdinfo import grdinfo  # pylint: disable=import-outside-toplevel
+
         self._obj = xarray_obj
         try:
             self._source = self._obj.encoding["source"]  # filepath to NetCDF source
@@ -72,3 +75,31 @@ class GMTDataArrayAccessor:
                 f"Invalid coordinate system type: {value}, should be a boolean of "
                 "either 0 for Cartesian or 1 for Geographic"
             )
+
+    def padded(self, pad=2):
+        """
+        Copy the grid into a buffer laid out like the grids of GMT.
+
+        The data of the returned grid is a float32 view of a buffer with
+        *pad* extra rows and columns around the data, as in the grids of
+        GMT. Passed to PyGMT functions and methods (repeatedly), it is used
+        directly by GMT instead of being copied into a padded grid on each
+        call. Changing the values in place keeps this ability but assigning
+        new data (e.g., ``grid.values = ...``) doesn't.
+
+        See :func:`pygmt.clib.conversion.padded_grid`.
+
+        Parameters
+        ----------
+        pad : int
+            The number of extra rows and columns on each side. GMT uses 2.
+
+        Returns
+        -------
+        padded : :class:`xarray.DataArray`
+            A float32 copy of the grid.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pygmt.clib.conversion import padded_grid
+
+        return padded_grid(self._obj, pad=pad)
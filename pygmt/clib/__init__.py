@@ -5,4 +5,7 @@
 # The pygmt.clib.Session class wraps the GMT C shared library (libgmt) with a
 # pythonic interface. Access to the C library is done through ctypes.
 
+# Register the "gmt" accessor for the grids read from GMT, even when the
+# submodules are imported directly (e.g., "from pygmt.datasets import ...")
+import pygmt.accessors
 from pygmt.clib.session import Session
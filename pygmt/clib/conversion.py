@@ -1,9 +1,19 @@
 """
 Functions to convert data types into ctypes friendly formats.
 """
+import ctypes as ctp
+import warnings
+import weakref
+
 import numpy as np
 import pandas as pd
-from pygmt.exceptions import GMTInvalidInput
+from pygmt.exceptions import GMTCopyWarning, GMTInvalidInput
+
+# Lazily loaded grids that hold the unchanged data of a file, keyed by id
+_FILE_BACKED_GRIDS = {}
+# Grids whose data is a view of a padded buffer laid out like the grids of
+# GMT, keyed by id
+_PADDED_GRIDS = {}
 
 
 def dataarray_to_matrix(grid):
@@ -14,12 +24,15 @@ def dataarray_to_matrix(grid):
     increment for the grid.
 
     Only allows grids with two dimensions and constant grid spacing (GMT
-    doesn't allow variable grid spacing). If the latitude and/or longitude
-    increments of the input grid are negative, the output matrix will be
-    sorted by the DataArray coordinates to yield positive increments.
+    doesn't allow variable grid spacing). GMT matrices go from North to South
+    and from West to East, so the rows and/or columns of the data are reversed
+    (as views, without copying) when the coordinates go the other way. The
+    increments are always positive.
 
-    If the underlying data array is not C contiguous, for example if it's a
-    slice of a larger grid, a copy will need to be generated.
+    The data is only copied if the resulting array is not C contiguous, for
+    example if the rows go from South to North (as in most netCDF files) or
+    if it's a slice of a larger grid. A
+    :class:`~pygmt.exceptions.GMTCopyWarning` is issued when that happens.
 
     Parameters
     ----------
@@ -60,7 +73,12 @@ def dataarray_to_matrix(grid):
     True
     >>> # Using a slice of the grid, the matrix will be copied to guarantee
     >>> # that it's C-contiguous in memory. The increment should be unchanged.
-    >>> matrix, region, inc = dataarray_to_matrix(grid[10:41, 30:101])
+    >>> with warnings.catch_warnings(record=True) as copies:
+    ...     warnings.simplefilter("always", GMTCopyWarning)
+    ...     matrix, region, inc = dataarray_to_matrix(grid[10:41, 30:101])
+    ...
+    >>> len(copies)
+    1
     >>> matrix.flags.c_contiguous
     True
     >>> print(matrix.shape)
@@ -79,6 +97,65 @@ def dataarray_to_matrix(grid):
     [-150.5, -78.5, -80.5, -48.5]
     >>> print(inc)
     [2.0, 2.0]
+    >>> # Grids going from North to South are passed without copies
+    >>> import xarray as xr
+    >>> grid = xr.DataArray(
+    ...     np.arange(12.0).reshape(3, 4),
+    ...     coords=[("lat", [2, 1, 0]), ("lon", [0, 1, 2, 3])],
+    ... )
+    >>> matrix, region, inc = dataarray_to_matrix(grid)
+    >>> np.shares_memory(matrix, grid.values)
+    True
+    >>> print(region)
+    [0.0, 3.0, 0.0, 2.0]
+    >>> print(inc)
+    [1, 1]
+    """
+    region, inc = _grid_region_inc(grid)
+
+    # Flip views of the data instead of sorting the grid (which copies it) to
+    # get the North to South rows and West to East columns expected by GMT
+    matrix = grid.values
+    if inc[1] > 0:
+        matrix = matrix[::-1]
+    if inc[0] < 0:
+        matrix = matrix[:, ::-1]
+    inc = [abs(i) for i in inc]
+
+    if not matrix.flags.c_contiguous:
+        # GMT matrices can't have negative or non-unit strides
+        warnings.warn(
+            f"Copying the {'x'.join(map(str, matrix.shape))} grid data to pass "
+            "it to GMT because it isn't C contiguous from North to South "
+            "(e.g., the rows go from South to North or it's a slice).",
+            category=GMTCopyWarning,
+            stacklevel=2,
+        )
+        matrix = as_c_contiguous(matrix)
+    return matrix, region, inc
+
+
+def _grid_region_inc(grid):
+    """
+    Get the region and the (signed) increments of a 2D grid.
+
+    Parameters
+    ----------
+    grid : xarray.DataArray
+        The grid.
+
+    Returns
+    -------
+    region : list
+        The West, East, South, North boundaries of the grid.
+    inc : list
+        The grid spacing in East-West and North-South, respectively. The
+        increments are negative if the coordinates are decreasing.
+
+    Raises
+    ------
+    GMTInvalidInput
+        If the grid has more than two dimensions or variable grid spacing.
     """
     if len(grid.dims) != 2:
         raise GMTInvalidInput(
@@ -108,12 +185,340 @@ def dataarray_to_matrix(grid):
         )
         inc.append(coord_inc)
 
-    if any(i < 0 for i in inc):  # Sort grid when there are negative increments
-        inc = [abs(i) for i in inc]
-        grid = grid.sortby(variables=list(grid.dims), ascending=True)
+    return region, inc
 
-    matrix = as_c_contiguous(grid[::-1].values)
-    return matrix, region, inc
+
+def register_file_backed_grid(grid, fname):
+    """
+    Remember that a lazily loaded grid holds the data of a grid file.
+
+    As long as the data and coordinates of the grid aren't modified (or
+    loaded into memory), :func:`file_backed_grid_source` returns the file name
+    so that the file can be passed to GMT instead of the data. GMT then only
+    reads the parts of the file it needs.
+
+    Parameters
+    ----------
+    grid : xarray.DataArray
+        A grid opened lazily from *fname* (e.g., with
+        :func:`xarray.open_dataarray`), without any change.
+    fname : str
+        The grid file.
+    """
+    key = id(grid)
+    data = grid.variable._data  # pylint: disable=protected-access
+    _FILE_BACKED_GRIDS[key] = (
+        weakref.ref(grid),
+        fname,
+        _wrapped_arrays(data),
+        getattr(data, "name", None),  # dask arrays get a new name when changed
+        dict(grid.coords.variables),
+    )
+    weakref.finalize(grid, _FILE_BACKED_GRIDS.pop, key, None)
+
+
+def _wrapped_arrays(data):
+    """
+    List the nested array wrappers xarray uses for lazily loaded data.
+
+    Writing to (or caching) lazily loaded data swaps one of the wrappers for
+    an array in memory, even if the outermost wrapper stays the same.
+    """
+    arrays = [data]
+    while hasattr(arrays[-1], "array") and len(arrays) < 16:
+        arrays.append(arrays[-1].array)
+    return arrays
+
+
+def file_backed_grid_source(grid):
+    """
+    Get the file holding the data of a grid, if the grid is unchanged.
+
+    Parameters
+    ----------
+    grid : xarray.DataArray
+        The grid.
+
+    Returns
+    -------
+    fname : str or None
+        The file registered with :func:`register_file_backed_grid`, or None
+        if the grid wasn't registered, has been modified or loaded into memory
+        since (in which case the data in memory should be used).
+    """
+    entry = _FILE_BACKED_GRIDS.get(id(grid))
+    if entry is None:
+        return None
+    ref, fname, arrays, name, coords = entry
+    variable = grid.variable
+    # pylint: disable=protected-access
+    current = _wrapped_arrays(variable._data)
+    unchanged = (
+        ref() is grid
+        and len(current) == len(arrays)
+        and all(new is old for new, old in zip(current, arrays))
+        and not variable._in_memory
+        and getattr(variable._data, "name", None) == name
+        and len(grid.coords.variables) == len(coords)
+        and all(grid.coords.variables.get(k) is v for k, v in coords.items())
+    )
+    return fname if unchanged else None
+
+
+def padded_grid(grid, pad=2):
+    """
+    Copy a grid into a buffer laid out like the grids of GMT.
+
+    GMT grids are float32, go from North to South and have a *pad* of extra
+    rows and columns around the data (used by modules that need boundary
+    conditions, e.g., for derivatives or filters). Grids passed to GMT as
+    plain matrices have no pad, so GMT makes its own padded copy of the data
+    each time. The data of the returned grid is a view of a padded buffer
+    instead, which is passed as is to GMT (see
+    :meth:`pygmt.clib.Session.virtualfile_from_grid`) as long as the grid
+    isn't replaced by another array. Changing values in place is fine.
+
+    Parameters
+    ----------
+    grid : xarray.DataArray
+        The 2D grid.
+    pad : int
+        The number of extra rows and columns on each side. GMT uses 2.
+
+    Returns
+    -------
+    padded : xarray.DataArray
+        A copy of the grid, as float32, with the same coordinates and
+        attributes (in the same order).
+
+    Examples
+    --------
+
+    >>> import xarray as xr
+    >>> grid = xr.DataArray(
+    ...     np.arange(6.0).reshape(2, 3),
+    ...     coords=[("lat", [0, 1]), ("lon", [0, 1, 2])],
+    ... )
+    >>> padded = padded_grid(grid)
+    >>> padded.dtype
+    dtype('float32')
+    >>> buffer, pad = padded_grid_buffer(padded)
+    >>> print(buffer.shape, pad)
+    (6, 7) 2
+    >>> print(buffer[pad:-pad, pad:-pad])
+    [[3. 4. 5.]
+     [0. 1. 2.]]
+    >>> padded_grid_buffer(grid) is None
+    True
+    """
+    _, inc = _grid_region_inc(grid)
+    nrows, ncols = grid.shape
+    buffer = np.zeros((nrows + 2 * pad, ncols + 2 * pad), dtype=np.float32)
+    # The data in the orientation of the grid, stored North to South in the
+    # buffer
+    data = buffer[pad : pad + nrows, pad : pad + ncols]
+    if inc[1] > 0:
+        data = data[::-1]
+    if inc[0] < 0:
+        data = data[:, ::-1]
+    data[...] = grid.values
+    padded = grid.copy(deep=False, data=data)
+    padded.gmt.registration = grid.gmt.registration
+    padded.gmt.gtype = grid.gmt.gtype
+
+    key = id(padded)
+    _PADDED_GRIDS[key] = (
+        weakref.ref(padded),
+        buffer,
+        pad,
+        data,
+        dict(padded.coords.variables),
+    )
+    weakref.finalize(padded, _PADDED_GRIDS.pop, key, None)
+    return padded
+
+
+def padded_grid_buffer(grid):
+    """
+    Get the padded buffer holding the data of a grid made by
+    :func:`padded_grid`.
+
+    Parameters
+    ----------
+    grid : xarray.DataArray
+        The grid.
+
+    Returns
+    -------
+    padded : tuple or None
+        The buffer (a C contiguous float32 array, North to South) and the
+        size of the pad. None if the grid wasn't made by :func:`padded_grid`
+        or its data or coordinates have been replaced since.
+    """
+    entry = _PADDED_GRIDS.get(id(grid))
+    if entry is None:
+        return None
+    ref, buffer, pad, data, coords = entry
+    unchanged = (
+        ref() is grid
+        and grid.variable._data is data  # pylint: disable=protected-access
+        and len(grid.coords.variables) == len(coords)
+        and all(grid.coords.variables.get(k) is v for k, v in coords.items())
+    )
+    return (buffer, pad) if unchanged else None
+
+
+def table_to_columns(data):
+    """
+    Get the columns of a columnar table as 1d numpy arrays.
+
+    Supports :class:`pyarrow.Table` (and ``RecordBatch``), polars
+    ``DataFrame`` and numpy structured (or record) arrays, without importing
+    pyarrow or polars. The columns are views of the buffers of the table
+    when possible, so they can be passed to GMT without copying. Columns with
+    missing values (nulls) are converted by pyarrow, with NaN (or NaT) in
+    place of the nulls (integers become floats).
+
+    Parameters
+    ----------
+    data : object
+        The table.
+
+    Returns
+    -------
+    columns : list of 1d arrays or None
+        None if *data* isn't one of the supported table types.
+
+    Examples
+    --------
+
+    >>> data = np.array([(1.0, 2), (3.0, 4)], dtype=[("x", "f8"), ("n", "i4")])
+    >>> x, n = table_to_columns(data)
+    >>> x, n
+    (array([1., 3.]), array([2, 4], dtype=int32))
+    >>> np.shares_memory(x, data)
+    True
+    >>> table_to_columns(np.arange(4)) is None
+    True
+    """
+    package = type(data).__module__.split(".")[0]
+    if package == "pyarrow" and hasattr(data, "schema"):
+        return [_arrow_to_numpy(column) for column in data.columns]
+    if package == "polars" and hasattr(data, "get_columns"):
+        # Polars columns are Arrow arrays
+        return [_arrow_to_numpy(series.to_arrow()) for series in data.get_columns()]
+    if isinstance(data, np.ndarray) and data.dtype.names:
+        return [data[name] for name in data.dtype.names]
+    return None
+
+
+def _arrow_to_numpy(array):
+    """
+    Convert a pyarrow (chunked) array to numpy, without copying if possible.
+    """
+    if hasattr(array, "num_chunks"):  # pyarrow.ChunkedArray
+        array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+    if array.null_count == 0:
+        try:
+            return array.to_numpy(zero_copy_only=True)
+        except ValueError:  # pyarrow.ArrowInvalid, e.g., for strings
+            pass
+    return array.to_numpy(zero_copy_only=False)
+
+
+def structured_to_matrix(data):
+    """
+    View a structured array with fields of the same numeric type as a matrix.
+
+    Parameters
+    ----------
+    data : object
+        A 1d structured (or record) array.
+
+    Returns
+    -------
+    matrix : 2d array or None
+        A C contiguous view of the data with one column per field, or None if
+        *data* isn't a structured array, or the fields don't have the same
+        integer or floating point type or aren't packed next to each other in
+        memory.
+
+    Examples
+    --------
+
+    >>> data = np.zeros(3, dtype=[("x", "f8"), ("y", "f8")])
+    >>> structured_to_matrix(data).shape
+    (3, 2)
+    >>> data = np.zeros(3, dtype=[("x", "f8"), ("n", "i8")])
+    >>> structured_to_matrix(data) is None
+    True
+    >>> structured_to_matrix(np.zeros((3, 2))) is None
+    True
+    """
+    # pylint: disable=import-outside-toplevel
+    from numpy.lib.recfunctions import structured_to_unstructured
+
+    if not (isinstance(data, np.ndarray) and data.dtype.names):
+        return None
+    dtypes = {data.dtype.fields[name][0] for name in data.dtype.names}
+    if len(dtypes) != 1 or dtypes.pop().kind not in "iuf" or data.ndim != 1:
+        return None
+    matrix = structured_to_unstructured(np.asarray(data), copy=False)
+    if not (matrix.flags.c_contiguous and np.shares_memory(matrix, data)):
+        return None
+    return matrix
+
+
+def chunk_to_matrix(chunk):
+    """
+    Convert a chunk of a streamed table into a float64 matrix.
+
+    Parameters
+    ----------
+    chunk : 2d array, pandas.DataFrame or columnar table
+        Rows of the table. Columnar tables are the ones supported by
+        :func:`table_to_columns`.
+
+    Returns
+    -------
+    matrix : 2d array
+        The chunk as a C contiguous float64 array (not a copy if it already
+        was one).
+
+    Examples
+    --------
+
+    >>> chunk_to_matrix([[1, 2], [3, 4]])
+    array([[1., 2.],
+           [3., 4.]])
+    >>> import pandas as pd
+    >>> chunk_to_matrix(pd.DataFrame({"x": [1, 2], "y": [3.5, 4.5]}))
+    array([[1. , 3.5],
+           [2. , 4.5]])
+    >>> data = np.zeros((3, 2))
+    >>> chunk_to_matrix(data) is data
+    True
+    """
+    columns = table_to_columns(chunk)
+    if columns is None and hasattr(chunk, "items"):
+        # pandas.DataFrame and xarray.Dataset types
+        columns = [array for _, array in chunk.items()]
+    try:
+        if columns is not None:
+            matrix = np.column_stack(
+                [np.asarray(column, dtype=np.float64) for column in columns]
+            )
+        else:
+            matrix = np.ascontiguousarray(chunk, dtype=np.float64)
+    except (TypeError, ValueError) as error:
+        raise GMTInvalidInput(
+            f"Streamed tables must be numeric, got chunk of type {type(chunk)}."
+        ) from error
+    if matrix.ndim != 2:
+        raise GMTInvalidInput(
+            f"Chunks of streamed tables must be 2d, got {matrix.ndim} dimensions."
+        )
+    return matrix
 
 
 def vectors_to_arrays(vectors):
@@ -158,10 +563,106 @@ def vectors_to_arrays(vectors):
     >>> all(isinstance(i, np.ndarray) for i in vectors_to_arrays(data))
     True
     """
-    arrays = [as_c_contiguous(np.asarray(i)) for i in vectors]
+    arrays = [_vector_to_array(i) for i in vectors]
     return arrays
 
 
+def _vector_to_array(vector):
+    """
+    Convert a vector to a C contiguous array, with fast paths for the pandas
+    extension types.
+
+    Nullable integers, floats and booleans become float64 with NaN for the
+    missing values (or keep their numpy type if none are missing). Categorical
+    vectors become their values if the categories are numbers, or are returned
+    as a :class:`pandas.Categorical` otherwise, to be passed as their codes
+    (see :func:`categorical_to_codes`) in numeric columns or as their labels
+    in trailing text columns. Strings stored in Arrow are returned as is, for
+    :func:`strings_to_ctypes_array` to read the Arrow buffers directly.
+    Converting these through object arrays is much slower.
+    """
+    dtype = getattr(vector, "dtype", None)
+    if not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return as_c_contiguous(np.asarray(vector))
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = dtype.categories
+        if pd.api.types.is_numeric_dtype(categories.dtype):
+            codes = np.asarray(pd.Categorical(vector).codes)
+            values = np.asarray(categories, dtype=np.float64)[codes]
+            values[codes == -1] = np.nan
+            return values
+        return _extension_array(vector)
+    if _is_arrow_strings(vector):
+        return _extension_array(vector)
+    if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        vector = _extension_array(vector)
+        numpy_dtype = getattr(dtype, "numpy_dtype", None)
+        if not vector.isna().any() and getattr(numpy_dtype, "kind", "") in "iuf":
+            return as_c_contiguous(vector.to_numpy(dtype=numpy_dtype))
+        return vector.to_numpy(dtype=np.float64, na_value=np.nan)
+    return as_c_contiguous(np.asarray(vector))
+
+
+def categorical_to_codes(vector):
+    """
+    Convert a categorical vector to integer codes and a table of labels.
+
+    GMT can't read text categories, but it can color (or otherwise map) the
+    codes with a categorical CPT, labeled with the categories.
+
+    Parameters
+    ----------
+    vector : pandas.Categorical or pandas.Series of category type
+        The categorical data.
+
+    Returns
+    -------
+    codes : 1d array of float64
+        The index of the category of each value, and NaN for missing values.
+    labels : 1d array
+        The categories, so that ``labels[int(code)]`` is the category of a
+        code.
+
+    Examples
+    --------
+
+    >>> codes, labels = categorical_to_codes(
+    ...     pd.Series(["b", "a", None, "b"], dtype="category")
+    ... )
+    >>> codes
+    array([ 1.,  0., nan,  1.])
+    >>> labels
+    array(['a', 'b'], dtype=object)
+    """
+    categorical = pd.Categorical(vector)
+    codes = categorical.codes.astype(np.float64)
+    codes[categorical.codes == -1] = np.nan
+    return codes, np.asarray(categorical.categories)
+
+
+def _is_arrow_strings(array):
+    """
+    Check if an array is a pandas array of strings stored in Arrow (i.e.,
+    ``string[pyarrow]``).
+    """
+    dtype = getattr(array, "dtype", None)
+    if not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return False
+    # pd.StringDtype("pyarrow"), or pd.ArrowDtype(pyarrow.string()) in pandas 2
+    return (
+        getattr(dtype, "storage", None) == "pyarrow" or str(dtype) == "string[pyarrow]"
+    ) and hasattr(_extension_array(array), "__arrow_array__")
+
+
+def _extension_array(vector):
+    """
+    Get the pandas extension array of a Series or Index (without copying).
+    """
+    if isinstance(vector, (pd.Series, pd.Index)):
+        return vector.array
+    return vector
+
+
 def as_c_contiguous(array):
     """
     Ensure a numpy array is C contiguous in memory.
@@ -204,6 +705,129 @@ def as_c_contiguous(array):
     return array
 
 
+def join_strings(arrays, sep=" "):
+    """
+    Join arrays of strings element-wise, without a Python loop over the rows.
+
+    Parameters
+    ----------
+    arrays : list of 1d arrays
+        The columns to join. Non-string columns are converted to strings.
+    sep : str
+        The separator between the columns.
+
+    Returns
+    -------
+    joined : 1d array of str
+
+    Examples
+    --------
+
+    >>> join_strings([np.array(["a", "bc"]), np.array([1, 22]), ["x", "y"]])
+    array(['a 1 x', 'bc 22 y'], dtype='<U7')
+    """
+    # Adding object arrays concatenates the Python strings in a C loop, which
+    # is faster than np.char.add on fixed-width unicode arrays
+    joined = np.asarray(arrays[0], dtype=str).astype(object)
+    for array in arrays[1:]:
+        joined = joined + sep + np.asarray(array, dtype=str).astype(object)
+    return joined.astype(str)
+
+
+def strings_to_ctypes_array(strings):
+    """
+    Build a ``char**`` array pointing to the strings, stored in a single block.
+
+    The strings are encoded (as ASCII if possible, which is vectorized, or as
+    UTF-8 otherwise) into one NUL-terminated, fixed-width block of bytes.
+    Both returned arrays must be kept alive while GMT uses the pointers.
+
+    Parameters
+    ----------
+    strings : 1d array
+        The strings.
+
+    Returns
+    -------
+    pointers : ctypes array of :class:`ctypes.c_char_p`
+        The pointers to each string.
+    block : 2d array of uint8
+        The encoded strings, one per row.
+
+    Examples
+    --------
+
+    >>> pointers, block = strings_to_ctypes_array(np.array(["a", "bcd", "é"]))
+    >>> pointers[:]
+    [b'a', b'bcd', b'\xc3\xa9']
+    >>> block.shape
+    (3, 4)
+    """
+    if _is_arrow_strings(strings):
+        strings = _extension_array(strings).__arrow_array__()
+        return _arrow_strings_to_ctypes_array(strings)
+    strings = np.asarray(strings)
+    if strings.dtype.kind != "S":
+        strings = strings.astype(str)
+        try:
+            strings = strings.astype("S")
+        except UnicodeEncodeError:
+            strings = np.char.encode(strings, "utf-8")
+    # The strings are viewed as bytes, which needs a contiguous block (e.g.,
+    # not a slice with a step)
+    strings = np.ascontiguousarray(strings)
+    nstrings = len(strings)
+    width = strings.dtype.itemsize + 1
+    block = np.zeros((nstrings, width), dtype=np.uint8)
+    block[:, :-1] = strings.view(np.uint8).reshape(nstrings, width - 1)
+    addresses = block.ctypes.data + width * np.arange(nstrings, dtype=np.uintp)
+    pointers = (ctp.c_char_p * nstrings).from_buffer(addresses)
+    return pointers, block
+
+
+def _arrow_strings_to_ctypes_array(array):
+    """
+    Build a ``char**`` array pointing to the strings of an Arrow array.
+
+    Arrow stores the UTF-8 strings back to back in one buffer, with their
+    offsets in another. The strings are copied in one go into a block with a
+    NUL inserted after each one, without encoding or converting them to Python
+    objects. Missing strings are empty.
+
+    Parameters
+    ----------
+    array : pyarrow.Array or pyarrow.ChunkedArray
+        The strings, of type ``string`` or ``large_string``.
+
+    Returns
+    -------
+    pointers : ctypes array of :class:`ctypes.c_char_p`
+        The pointers to each string.
+    block : 1d array of uint8
+        The NUL-terminated strings.
+    """
+    if hasattr(array, "num_chunks"):  # pyarrow.ChunkedArray
+        array = array.combine_chunks()
+    nstrings = len(array)
+    _, offsets, data = array.buffers()
+    offset_type = np.int64 if str(array.type) == "large_string" else np.int32
+    offsets = np.frombuffer(offsets, dtype=offset_type)[
+        array.offset : array.offset + nstrings + 1
+    ].astype(np.intp)
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else None
+    starts = offsets[:-1] - offsets[0]
+    if data is None:
+        block = np.zeros(nstrings, dtype=np.uint8)
+    else:
+        block = np.insert(
+            data[offsets[0] : offsets[-1]], offsets[1:] - offsets[0], 0
+        ).astype(np.uint8, copy=False)
+    # Each string moves by the number of NULs inserted before it
+    addresses = block.ctypes.data + (starts + np.arange(nstrings)).astype(np.uintp)
+    pointers = (ctp.c_char_p * nstrings).from_buffer(addresses)
+    return pointers, block
+
+
 def kwargs_to_ctypes_array(argument, kwargs, dtype):
     """
     Convert an iterable argument from kwargs into a ctypes array variable.
@@ -318,3 +942,98 @@ def array_to_datetime(array):
                   dtype='datetime64[ns]', freq=None)
     """
     return pd.to_datetime(array)
+
+
+# Length of each GMT time unit (the TIME_UNIT default) in seconds. GMT uses
+# years of 365.2425 days and months of equal length.
+TIME_UNIT_SECONDS = {
+    "y": 365.2425 * 86400,
+    "o": 365.2425 * 86400 / 12,
+    "w": 7 * 86400,
+    "d": 86400,
+    "h": 3600,
+    "m": 60,
+    "s": 1,
+}
+
+
+def datetime_to_numeric(array, epoch="1970-01-01T00:00:00", unit="s"):
+    """
+    Convert an array of datetimes to numbers in a GMT time system.
+
+    GMT stores absolute times as the time elapsed since ``TIME_EPOCH`` in
+    ``TIME_UNIT`` units, so these numbers can be passed to GMT as is instead of
+    formatting (and GMT parsing) ISO datetime strings.
+
+    Parameters
+    ----------
+    array : 1d array
+        The datetimes, in any format accepted by :func:`array_to_datetime`.
+    epoch : str
+        The origin of the times (the ``TIME_EPOCH`` GMT setting).
+    unit : str
+        The unit of the times (the ``TIME_UNIT`` GMT setting), one of the
+        keys of ``TIME_UNIT_SECONDS`` (e.g., ``"d"`` or ``"s"``).
+
+    Returns
+    -------
+    numbers : 1d array
+        A new C contiguous float64 array. Missing times (NaT) become NaN.
+
+    Examples
+    --------
+
+    >>> x = np.array(["1970-01-02", "NaT", "2000-01-01T00:00:01"], "M8[s]")
+    >>> datetime_to_numeric(x)
+    array([8.64000000e+04,            nan, 9.46684801e+08])
+    >>> datetime_to_numeric(x[:1], epoch="1970-01-01T00:00:00", unit="h")
+    array([24.])
+    """
+    if unit not in TIME_UNIT_SECONDS:
+        raise GMTInvalidInput(f"Invalid GMT time unit '{unit}'.")
+    times = np.asarray(array)
+    if times.dtype.kind != "M":
+        times = np.asarray(array_to_datetime(times))
+    elapsed = times.astype("datetime64[ns]") - np.datetime64(epoch, "ns")
+    return elapsed / np.timedelta64(1, "ns") / (TIME_UNIT_SECONDS[unit] * 1e9)
+
+
+def relative_time_to_datetime(values, epoch, unit):
+    """
+    Convert GMT relative times into numpy.datetime64.
+
+    GMT stores absolute times as the number of time units (``TIME_UNIT``)
+    since an epoch (``TIME_EPOCH``).
+
+    Parameters
+    ----------
+    values : 1d array
+        The relative times.
+    epoch : str
+        The value of the ``TIME_EPOCH`` default (e.g.,
+        ``"1970-01-01T00:00:00"``).
+    unit : str
+        The value of the ``TIME_UNIT`` default (e.g., ``"s"``).
+
+    Returns
+    -------
+    array : 1d array of numpy.datetime64
+
+    Examples
+    --------
+    >>> times = [0, 86400.5, np.nan]
+    >>> relative_time_to_datetime(times, "1970-01-01T00:00:00", "s")
+    ... # doctest: +NORMALIZE_WHITESPACE
+    array(['1970-01-01T00:00:00.000000000', '1970-01-02T00:00:00.500000000',
+           'NaT'], dtype='datetime64[ns]')
+    >>> relative_time_to_datetime([1.5], "2000-01-01T00:00:00", "d")
+    array(['2000-01-02T12:00:00.000000000'], dtype='datetime64[ns]')
+    """
+    nanoseconds = np.round(
+        np.asarray(values, dtype=np.float64) * (TIME_UNIT_SECONDS[unit] * 1e9)
+    )
+    invalid = np.isnan(nanoseconds)
+    deltas = np.where(invalid, 0, nanoseconds).astype(np.int64).view("timedelta64[ns]")
+    array = pd.Timestamp(epoch).to_datetime64().astype("datetime64[ns]") + deltas
+    array[invalid] = np.datetime64("NaT")
+    return array
@@ -8,10 +8,159 @@ import ctypes
 import os
 import subprocess as sp
 import sys
+import threading
 from ctypes.util import find_library
 from pathlib import Path
 
+from pygmt.clib.prototypes import bind_prototypes
 from pygmt.exceptions import GMTCLibError, GMTCLibNotFoundError, GMTOSError
+from pygmt.helpers.caching import cache_dir, read_json_cache, write_json_cache
+
+# Process-wide cache of the loaded libgmt, keyed by the environment variables
+# that influence the library discovery. See get_libgmt().
+_LIBGMT_CACHE = {}
+_LIBGMT_LOCK = threading.Lock()
+
+
+def _reset_libgmt_lock():
+    """
+    Replace the lock in a forked child process.
+
+    The lock might have been held by another thread of the parent at the time
+    of the fork, in which case it would never be released in the child. The
+    cached CDLL handles remain valid since the child inherits the mappings.
+    """
+    global _LIBGMT_LOCK  # pylint: disable=global-statement
+    _LIBGMT_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_libgmt_lock)
+
+
+def _libgmt_cache_key(env):
+    """
+    Build the key used to cache the library for a given environment.
+    """
+    return "|".join(
+        [sys.platform, env.get("GMT_LIBRARY_PATH", ""), env.get("PATH", "")]
+    )
+
+
+def get_libgmt(env=None):
+    """
+    Return the process-wide shared ``libgmt`` :py:class:`ctypes.CDLL`.
+
+    Unlike :func:`load_libgmt`, the library discovery (which may spawn a
+    ``gmt --show-library`` subprocess) and the loading only happen once per
+    process and environment. The result is cached in memory, keyed by the
+    values of the ``GMT_LIBRARY_PATH`` and ``PATH`` environment variables.
+
+    If the ``PYGMT_CACHE_DIR`` environment variable is set, the full path of
+    the resolved library is also stored on disk so that new processes can skip
+    the discovery. A stale entry (e.g., the library was removed) falls back to
+    the normal discovery.
+
+    Parameters
+    ----------
+    env : dict or None
+        A dictionary containing the environment variables. If ``None``, will
+        default to ``os.environ``.
+
+    Returns
+    -------
+    :py:class:`ctypes.CDLL` object
+        The loaded shared library.
+
+    Raises
+    ------
+    GMTCLibNotFoundError
+        If there was any problem loading the library.
+    """
+    if env is None:
+        env = os.environ
+    key = _libgmt_cache_key(env)
+    libgmt = _LIBGMT_CACHE.get(key)
+    if libgmt is not None:
+        return libgmt
+
+    with _LIBGMT_LOCK:
+        # Another thread might have loaded the library while we were waiting
+        libgmt = _LIBGMT_CACHE.get(key)
+        if libgmt is not None:
+            return libgmt
+
+        cachedir = cache_dir()
+        cachefile = cachedir / "libgmt.json" if cachedir is not None else None
+        if cachefile is not None:
+            libpath = read_json_cache(cachefile).get(key)
+            if libpath and Path(libpath).exists():
+                try:
+                    libgmt = load_libgmt(lib_fullnames=[libpath])
+                except GMTCLibNotFoundError:
+                    libgmt = None
+        if libgmt is None:
+            libgmt = load_libgmt(lib_fullnames=clib_full_names(env=env))
+            if cachefile is not None:
+                libpath = _resolved_path(libgmt)
+                if libpath is not None:
+                    content = read_json_cache(cachefile)
+                    content[key] = libpath
+                    write_json_cache(cachefile, content)
+        bind_prototypes(libgmt)
+        _LIBGMT_CACHE[key] = libgmt
+    return libgmt
+
+
+def _resolved_path(libgmt):
+    """
+    Return the absolute path of a loaded library or None if it is unknown.
+
+    Bare library names (e.g. ``libgmt.so``) found through the default search
+    path are not persisted since their resolution is cheap.
+    """
+    name = getattr(libgmt, "_name", None)
+    if isinstance(name, str) and os.path.isabs(name):
+        return name
+    return None
+
+
+def libgmt_fingerprint(libgmt):
+    """
+    Return a string identifying the build of a loaded library.
+
+    Made of the full path, size, and modification time of the library file, so
+    that rebuilding or upgrading GMT changes the fingerprint.
+
+    Parameters
+    ----------
+    libgmt : :py:class:`ctypes.CDLL`
+        The loaded library.
+
+    Returns
+    -------
+    fingerprint : str or None
+        ``None`` if the library wasn't loaded from a known path.
+    """
+    libpath = _resolved_path(libgmt)
+    if libpath is None:
+        return None
+    try:
+        stat = os.stat(libpath)
+    except OSError:
+        return None
+    return f"{libpath}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def clear_libgmt_cache():
+    """
+    Forget the libraries cached in memory by :func:`get_libgmt`.
+
+    The next call will run the library discovery again. Doesn't touch the
+    on-disk cache.
+    """
+    with _LIBGMT_LOCK:
+        _LIBGMT_CACHE.clear()
 
 
 def load_libgmt(lib_fullnames=None):
@@ -0,0 +1,100 @@
+"""
+Declarations of the ctypes prototypes of the GMT API functions used by PyGMT.
+
+The prototypes are bound to the functions once, when the library is loaded by
+:func:`pygmt.clib.loading.get_libgmt`, so that the wrappers in
+:class:`pygmt.clib.Session` don't need to set them on every call.
+"""
+import ctypes as ctp
+
+# Maps the name of the API function to its argument types and return type.
+PROTOTYPES = {
+    "GMT_Create_Session": (
+        [ctp.c_char_p, ctp.c_uint, ctp.c_uint, ctp.c_void_p],
+        ctp.c_void_p,
+    ),
+    "GMT_Destroy_Session": ([ctp.c_void_p], ctp.c_int),
+    "GMT_Get_Enum": ([ctp.c_void_p, ctp.c_char_p], ctp.c_int),
+    "GMT_Get_Default": ([ctp.c_void_p, ctp.c_char_p, ctp.c_char_p], ctp.c_int),
+    "GMT_Call_Module": (
+        [ctp.c_void_p, ctp.c_char_p, ctp.c_int, ctp.c_void_p],
+        ctp.c_int,
+    ),
+    "GMT_Create_Data": (
+        [
+            ctp.c_void_p,  # API
+            ctp.c_uint,  # family
+            ctp.c_uint,  # geometry
+            ctp.c_uint,  # mode
+            ctp.POINTER(ctp.c_uint64),  # dim
+            ctp.POINTER(ctp.c_double),  # range
+            ctp.POINTER(ctp.c_double),  # inc
+            ctp.c_uint,  # registration
+            ctp.c_int,  # pad
+            ctp.c_void_p,  # data
+        ],
+        ctp.c_void_p,
+    ),
+    "GMT_Put_Vector": (
+        [ctp.c_void_p, ctp.c_void_p, ctp.c_uint, ctp.c_uint, ctp.c_void_p],
+        ctp.c_int,
+    ),
+    "GMT_Put_Strings": (
+        [ctp.c_void_p, ctp.c_uint, ctp.c_void_p, ctp.POINTER(ctp.c_char_p)],
+        ctp.c_int,
+    ),
+    "GMT_Put_Matrix": (
+        [ctp.c_void_p, ctp.c_void_p, ctp.c_uint, ctp.c_int, ctp.c_void_p],
+        ctp.c_int,
+    ),
+    "GMT_Write_Data": (
+        [
+            ctp.c_void_p,
+            ctp.c_uint,
+            ctp.c_uint,
+            ctp.c_uint,
+            ctp.c_uint,
+            ctp.POINTER(ctp.c_double),
+            ctp.c_char_p,
+            ctp.c_void_p,
+        ],
+        ctp.c_int,
+    ),
+    "GMT_Open_VirtualFile": (
+        [
+            ctp.c_void_p,
+            ctp.c_uint,
+            ctp.c_uint,
+            ctp.c_uint,
+            ctp.c_void_p,
+            ctp.c_char_p,
+        ],
+        ctp.c_int,
+    ),
+    "GMT_Close_VirtualFile": ([ctp.c_void_p, ctp.c_char_p], ctp.c_int),
+    "GMT_Read_VirtualFile": ([ctp.c_void_p, ctp.c_char_p], ctp.c_void_p),
+    "GMT_Extract_Region": (
+        [ctp.c_void_p, ctp.c_char_p, ctp.POINTER(ctp.c_double)],
+        ctp.c_int,
+    ),
+}
+
+
+def bind_prototypes(libgmt):
+    """
+    Set the argument and return types of the GMT API functions.
+
+    Functions missing from the library (e.g., added in newer GMT versions) are
+    skipped.
+
+    Parameters
+    ----------
+    libgmt : :py:class:`ctypes.CDLL`
+        The loaded GMT library.
+    """
+    for name, (argtypes, restype) in PROTOTYPES.items():
+        function = getattr(libgmt, name, None)
+        if function is None:
+            continue
+        function.argtypes = argtypes
+        function.restype = restype
@@ -5,27 +5,45 @@ access to the API functions.
 Uses ctypes to wrap most of the core functions from the C API.
 """
 import ctypes as ctp
+import itertools
+import os
+import re
+import shutil
 import sys
+import tempfile
+import threading
+import weakref
 from contextlib import contextmanager
 
 import numpy as np
 import pandas as pd
 from packaging.version import Version
 from pygmt.clib.conversion import (
-    array_to_datetime,
+    _grid_region_inc,
     as_c_contiguous,
+    categorical_to_codes,
+    chunk_to_matrix,
     dataarray_to_matrix,
+    datetime_to_numeric,
+    file_backed_grid_source,
+    join_strings,
     kwargs_to_ctypes_array,
+    padded_grid_buffer,
+    strings_to_ctypes_array,
+    structured_to_matrix,
+    table_to_columns,
     vectors_to_arrays,
 )
-from pygmt.clib.loading import load_libgmt
+from pygmt.clib.loading import get_libgmt, libgmt_fingerprint
+from pygmt.clib.structures import _GMT_DATASET, _GMT_GRID
 from pygmt.exceptions import (
     GMTCLibError,
     GMTCLibNoSessionError,
     GMTInvalidInput,
     GMTVersionError,
 )
-from pygmt.helpers import data_kind, dummy_context
+from pygmt.helpers import data_kind, dummy_context, iter_chunks
+from pygmt.helpers.caching import cache_dir, read_json_cache, write_json_cache
 
 FAMILIES = [
     "GMT_IS_DATASET",
@@ -59,10 +77,153 @@ DTYPES = {
     np.int32: "GMT_INT",
     np.uint64: "GMT_ULONG",
     np.uint32: "GMT_UINT",
+    np.int16: "GMT_SHORT",
+    np.uint16: "GMT_USHORT",
+    np.int8: "GMT_CHAR",
+    np.uint8: "GMT_UCHAR",
     np.datetime64: "GMT_DATETIME",
     np.str_: "GMT_TEXT",
 }
 
+# All the constants used by the Session methods. They are resolved in bulk the
+# first time a constant is needed (see Session.__getitem__).
+CONSTANTS = sorted(
+    set(
+        FAMILIES
+        + VIAS
+        + GEOMETRIES
+        + METHODS
+        + MODES
+        + REGISTRATIONS
+        + list(DTYPES.values())
+        + [
+            "GMT_GRID_IS_CARTESIAN",
+            "GMT_GRID_IS_GEO",
+            "GMT_IN",
+            "GMT_IS_FILE",
+            "GMT_MODULE_CMD",
+            "GMT_OUT",
+            "GMT_PAD_DEFAULT",
+            "GMT_SESSION_EXTERNAL",
+            "GMT_VF_LEN",
+            "GMT_X",
+            "GMT_Y",
+            "GMT_Z",
+        ]
+    )
+)
+
+# Tables of constant values for each loaded library, keyed by library name
+_ENUM_TABLES = {}
+
+# Holds the ambient session of each thread (see pygmt.session)
+_AMBIENT = threading.local()
+
+# The global modern mode session is started right before the first session of
+# the process is created (see pygmt.session_management.begin_global_session).
+_GLOBAL_SESSION = {"pending": True, "starting": False, "lock": threading.RLock()}
+
+
+def _begin_global_session():
+    """
+    Start the global modern mode session if it hasn't been started yet.
+
+    Other threads wait (on the lock) until it has started. The sessions
+    created to start it (in the same thread) don't start it again.
+    """
+    with _GLOBAL_SESSION["lock"]:
+        if not _GLOBAL_SESSION["pending"] or _GLOBAL_SESSION["starting"]:
+            return
+        _GLOBAL_SESSION["starting"] = True
+        try:
+            # pylint: disable=import-outside-toplevel
+            from pygmt.session_management import begin_global_session
+
+            begin_global_session()
+            _GLOBAL_SESSION["pending"] = False
+        finally:
+            _GLOBAL_SESSION["starting"] = False
+
+
+def get_ambient_session():
+    """
+    Return the ambient session of the current thread or None.
+
+    The ambient session is a long-lived :class:`pygmt.clib.Session` opened by
+    :func:`pygmt.session`. While it is set, new sessions entered in the same
+    thread borrow its GMT API session instead of creating their own.
+    """
+    return getattr(_AMBIENT, "session", None)
+
+
+def set_ambient_session(session):
+    """
+    Set (or unset with None) the ambient session of the current thread.
+
+    Parameters
+    ----------
+    session : :class:`pygmt.clib.Session` or None
+        An open session.
+    """
+    _AMBIENT.session = session
+
+
+# GMT API sessions whose memory is no longer viewed by any array, waiting to
+# be destroyed (see _MemoryKeeper)
+_RELEASED_SESSIONS = []
+
+
+class _MemoryKeeper:
+    """
+    Keep a GMT API session alive while arrays view the memory it owns.
+
+    The output containers of GMT modules (e.g., grids) are freed when the
+    session that created them is destroyed. Numpy arrays viewing this memory
+    hold a reference to the keeper of the session. Once the session is done,
+    :meth:`pygmt.clib.Session.destroy` hands the destruction over to the
+    keeper. When the last view is garbage collected, the session is queued
+    and destroyed by the next :meth:`pygmt.clib.Session.create` or
+    :meth:`pygmt.clib.Session.destroy` (GMT isn't thread-safe, so it can't be
+    called at whatever moment and thread the garbage collector runs on).
+    """
+
+    def release(self, c_destroy_session, session_pointer, callback):
+        """
+        Queue the GMT API session for destruction when the keeper is garbage
+        collected.
+
+        Parameters
+        ----------
+        c_destroy_session : ctypes function
+            The ``GMT_Destroy_Session`` function.
+        session_pointer : ctypes.c_void_p
+            The session to destroy.
+        callback : ctypes function or None
+            The print callback of the session. Must stay alive until the
+            session is destroyed.
+        """
+        finalizer = weakref.finalize(
+            self,
+            _RELEASED_SESSIONS.append,
+            (c_destroy_session, session_pointer, callback),
+        )
+        # The process is ending anyway
+        finalizer.atexit = False
+
+
+def _destroy_released_sessions():
+    """
+    Destroy the GMT API sessions queued by :class:`_MemoryKeeper`.
+
+    Errors are ignored, since the sessions don't belong to the caller.
+    """
+    while _RELEASED_SESSIONS:
+        try:
+            c_destroy_session, session_pointer, _ = _RELEASED_SESSIONS.pop()
+        except IndexError:  # emptied by another thread
+            break
+        c_destroy_session(session_pointer)
+
 
 class Session:
     """
@@ -83,6 +244,10 @@ class Session:
     A ``GMTVersionError`` exception will be raised if the GMT shared library
     reports a version older than the required minimum GMT version.
 
+    Inside a :func:`pygmt.session` block, entering a session doesn't create a
+    new GMT API session. Instead, it borrows the long-lived session of the
+    block, which avoids paying the setup cost for every call.
+
     The ``session_pointer`` attribute holds a ctypes pointer to the currently
     open session.
 
@@ -173,7 +338,13 @@ class Session:
         """
         Create a GMT API session and check the libgmt version.
 
-        Calls :meth:`pygmt.clib.Session.create`.
+        Calls :meth:`pygmt.clib.Session.create`. The global modern mode
+        session of PyGMT is started before the first session is created.
+
+        If there is an ambient session in the current thread (see
+        :func:`pygmt.session`), borrows its GMT API session instead. The
+        ambient session has already been checked so the version check is
+        skipped.
 
         Raises
         ------
@@ -182,10 +353,28 @@ class Session:
             ``Session.required_version``. Will destroy the session before
             raising the exception.
         """
+        ambient = get_ambient_session()
+        if (
+            ambient is not None
+            and ambient is not self
+            and getattr(ambient, "_session_pointer", None) is not None
+            and getattr(self, "_session_pointer", None) is None
+        ):
+            self._borrowed = True
+            self._lender = ambient
+            # Share the log of the ambient session but only use the messages
+            # emitted from now on to build the error messages. The earlier
+            # messages are left for the ambient session to report.
+            self._error_log = ambient._error_log
+            self._error_offset = len(ambient._error_log)
+            self.session_pointer = ambient.session_pointer
+            return self
+
+        _begin_global_session()
         self.create("pygmt-session")
-        # Need to store the version info because 'get_default' won't work after
-        # the session is destroyed.
-        version = self.info["version"]
+        # Only the version is needed for the check. The rest of the info
+        # dictionary is fetched on demand.
+        version = self.get_default("API_VERSION")
         if Version(version) < Version(self.required_version):
             self.destroy()
             raise GMTVersionError(
@@ -199,8 +388,14 @@ class Session:
         """
         Destroy the currently open GMT API session.
 
-        Calls :meth:`pygmt.clib.Session.destroy`.
+        Calls :meth:`pygmt.clib.Session.destroy`. A borrowed session is only
+        released and stays open for the ambient session.
         """
+        if getattr(self, "_borrowed", False):
+            self._borrowed = False
+            self._lender = None
+            self.session_pointer = None
+            return
         self.destroy()
 
     def __getitem__(self, name):
@@ -208,7 +403,9 @@ class Session:
         Get the value of a GMT constant (C enum) from gmt_resources.h.
 
         Used to set configuration values for other API calls. Wraps
-        ``GMT_Get_Enum``.
+        ``GMT_Get_Enum``. The values are looked up in a table resolved once per
+        loaded library (see ``CONSTANTS``), so this is only a dictionary read
+        in most cases.
 
         Parameters
         ----------
@@ -226,9 +423,33 @@ class Session:
         GMTCLibError
             If the constant doesn't exist.
         """
-        c_get_enum = self.get_libgmt_func(
-            "GMT_Get_Enum", argtypes=[ctp.c_void_p, ctp.c_char_p], restype=ctp.c_int
-        )
+        enums = self._enum_table()
+        value = enums.get(name)
+        if value is None:
+            value = self._get_enum(name)
+            enums[name] = value
+        return value
+
+    def _get_enum(self, name):
+        """
+        Get the value of a GMT constant by calling ``GMT_Get_Enum``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the constant.
+
+        Returns
+        -------
+        constant : int
+            Integer value of the constant.
+
+        Raises
+        ------
+        GMTCLibError
+            If the constant doesn't exist.
+        """
+        c_get_enum = self.get_libgmt_func("GMT_Get_Enum")
 
         # The C lib introduced the void API pointer to GMT_Get_Enum so that
         # it's consistent with other functions. It doesn't use the pointer so
@@ -244,11 +465,57 @@ class Session:
 
         return value
 
+    def _enum_table(self):
+        """
+        Get the table of constant values for the loaded library.
+
+        All constants in ``CONSTANTS`` are resolved in bulk the first time and
+        the table is shared by all sessions in the process. If the
+        ``PYGMT_CACHE_DIR`` environment variable is set, the table is also
+        stored on disk, keyed by the library build, so new processes don't
+        need to resolve the constants again.
+
+        Returns
+        -------
+        enums : dict
+            The constant names and values.
+        """
+        if not hasattr(self, "_libgmt"):
+            self._libgmt = get_libgmt()
+        key = getattr(self._libgmt, "_name", None)
+        enums = _ENUM_TABLES.get(key)
+        if enums is not None:
+            return enums
+
+        fingerprint = libgmt_fingerprint(self._libgmt)
+        cachedir = cache_dir()
+        cachefile = None
+        if cachedir is not None and fingerprint is not None:
+            cachefile = cachedir / "enums.json"
+            enums = read_json_cache(cachefile).get(fingerprint)
+        if not enums:
+            enums = {}
+            for name in CONSTANTS:
+                try:
+                    enums[name] = self._get_enum(name)
+                except GMTCLibError:
+                    # Not defined by this GMT version
+                    continue
+            if cachefile is not None:
+                content = read_json_cache(cachefile)
+                content[fingerprint] = enums
+                write_json_cache(cachefile, content)
+        _ENUM_TABLES[key] = enums
+        return enums
+
     def get_libgmt_func(self, name, argtypes=None, restype=None):
         """
         Get a ctypes function from the libgmt shared library.
 
-        Assigns the argument and return type conversions for the function.
+        The argument and return type conversions of the functions declared in
+        :mod:`pygmt.clib.prototypes` are bound once when the library is
+        loaded, so there's no need to pass them. If given, they are only
+        assigned when they differ from the current ones.
 
         Use this method to access a C function from libgmt.
 
@@ -281,11 +548,11 @@ class Session:
         <class 'ctypes.CDLL.__init__.<locals>._FuncPtr'>
         """
         if not hasattr(self, "_libgmt"):
-            self._libgmt = load_libgmt()
+            self._libgmt = get_libgmt()
         function = getattr(self._libgmt, name)
-        if argtypes is not None:
+        if argtypes is not None and function.argtypes != tuple(argtypes):
             function.argtypes = argtypes
-        if restype is not None:
+        if restype is not None and function.restype is not restype:
             function.restype = restype
         return function
 
@@ -329,15 +596,13 @@ class Session:
         except GMTCLibNoSessionError:
             pass
 
-        c_create_session = self.get_libgmt_func(
-            "GMT_Create_Session",
-            argtypes=[ctp.c_char_p, ctp.c_uint, ctp.c_uint, ctp.c_void_p],
-            restype=ctp.c_void_p,
-        )
+        _destroy_released_sessions()
+        c_create_session = self.get_libgmt_func("GMT_Create_Session")
 
         # Capture the output printed by GMT into this list. Will use it later
         # to generate error messages for the exceptions raised by API calls.
         self._error_log = []
+        self._error_offset = 0
 
         @ctp.CFUNCTYPE(ctp.c_int, ctp.c_void_p, ctp.c_char_p)
         def print_func(file_pointer, message):  # pylint: disable=unused-argument
@@ -376,11 +641,14 @@ class Session:
         """
         A string with all error messages emitted by the C API.
 
-        Only includes messages with the string ``"[ERROR]"`` in them.
+        Only includes messages with the string ``"[ERROR]"`` in them. A
+        borrowed session only includes the messages emitted since it borrowed
+        the GMT API session.
         """
         msg = ""
         if hasattr(self, "_error_log"):
-            msg = "\n".join(line for line in self._error_log if "[ERROR]" in line)
+            log = self._error_log[getattr(self, "_error_offset", 0) :]
+            msg = "\n".join(line for line in log if "[ERROR]" in line)
         return msg
 
     def destroy(self):
@@ -403,11 +671,25 @@ class Session:
         some of the configuration files might be left behind and can influence
         subsequent API calls.
 
+        If arrays still view memory owned by the session (see
+        :meth:`pygmt.clib.Session.virtualfile_to_grid`), the session is only
+        destroyed after the last of them is garbage collected, by the next
+        call to this method or to :meth:`pygmt.clib.Session.create`.
+
         Sets the ``session_pointer`` attribute to ``None``.
         """
-        c_destroy_session = self.get_libgmt_func(
-            "GMT_Destroy_Session", argtypes=[ctp.c_void_p], restype=ctp.c_int
-        )
+        c_destroy_session = self.get_libgmt_func("GMT_Destroy_Session")
+
+        keeper = getattr(self, "_keeper", None)
+        if keeper is not None:
+            self._keeper = None
+            keeper.release(
+                c_destroy_session,
+                self.session_pointer,
+                getattr(self, "_print_callback", None),
+            )
+            self.session_pointer = None
+            return
 
         status = c_destroy_session(self.session_pointer)
         if status:
@@ -416,6 +698,19 @@ class Session:
             )
 
         self.session_pointer = None
+        _destroy_released_sessions()
+
+    def _memory_keeper(self):
+        """
+        Get the :class:`_MemoryKeeper` of the GMT API session.
+
+        Borrowed sessions share the keeper of the ambient session, since they
+        share its memory.
+        """
+        owner = getattr(self, "_lender", None) or self
+        if getattr(owner, "_keeper", None) is None:
+            owner._keeper = _MemoryKeeper()  # pylint: disable=protected-access
+        return owner._keeper  # pylint: disable=protected-access
 
     def get_default(self, name):
         """
@@ -449,11 +744,7 @@ class Session:
         GMTCLibError
             If the parameter doesn't exist.
         """
-        c_get_default = self.get_libgmt_func(
-            "GMT_Get_Default",
-            argtypes=[ctp.c_void_p, ctp.c_char_p, ctp.c_char_p],
-            restype=ctp.c_int,
-        )
+        c_get_default = self.get_libgmt_func("GMT_Get_Default")
 
         # Make a string buffer to get a return value
         value = ctp.create_string_buffer(10000)
@@ -491,13 +782,10 @@ class Session:
         GMTCLibError
             If the returned status code of the function is non-zero.
         """
-        c_call_module = self.get_libgmt_func(
-            "GMT_Call_Module",
-            argtypes=[ctp.c_void_p, ctp.c_char_p, ctp.c_int, ctp.c_void_p],
-            restype=ctp.c_int,
-        )
+        c_call_module = self.get_libgmt_func("GMT_Call_Module")
 
         mode = self["GMT_MODULE_CMD"]
+        args = self._add_stream_binary_input(args)
         status = c_call_module(
             self.session_pointer, module.encode(), mode, args.encode()
         )
@@ -548,22 +836,7 @@ class Session:
             A ctypes pointer (an integer) to the allocated ``GMT_Dataset``
             object.
         """
-        c_create_data = self.get_libgmt_func(
-            "GMT_Create_Data",
-            argtypes=[
-                ctp.c_void_p,  # API
-                ctp.c_uint,  # family
-                ctp.c_uint,  # geometry
-                ctp.c_uint,  # mode
-                ctp.POINTER(ctp.c_uint64),  # dim
-                ctp.POINTER(ctp.c_double),  # range
-                ctp.POINTER(ctp.c_double),  # inc
-                ctp.c_uint,  # registration
-                ctp.c_int,  # pad
-                ctp.c_void_p,
-            ],  # data
-            restype=ctp.c_void_p,
-        )
+        c_create_data = self.get_libgmt_func("GMT_Create_Data")
 
         family_int = self._parse_constant(family, valid=FAMILIES, valid_modifiers=VIAS)
         mode_int = self._parse_constant(
@@ -733,6 +1006,92 @@ class Session:
                 ) from e
         return self[DTYPES[array.dtype.type]]
 
+    @property
+    def _time_vectors(self):
+        """
+        The datetime vectors converted to numbers by
+        :meth:`pygmt.clib.Session.put_vector`, keyed by dataset and column.
+        """
+        if not hasattr(self, "_time_vectors_"):
+            self._time_vectors_ = {}
+        return self._time_vectors_
+
+    @property
+    def _stream_files(self):
+        """
+        The number of columns of the open streams (see
+        :meth:`pygmt.clib.Session.virtualfile_from_stream`), keyed by file
+        name.
+        """
+        if not hasattr(self, "_stream_files_"):
+            self._stream_files_ = {}
+        return self._stream_files_
+
+    @property
+    def _string_blocks(self):
+        """
+        The strings referenced by GMT (see
+        :meth:`pygmt.clib.Session.put_strings`), keyed by dataset.
+        """
+        if not hasattr(self, "_string_blocks_"):
+            self._string_blocks_ = {}
+        return self._string_blocks_
+
+    def _time_system(self):
+        """
+        Get the ``TIME_EPOCH`` and ``TIME_UNIT`` GMT settings.
+        """
+        return self.get_default("TIME_EPOCH"), self.get_default("TIME_UNIT")
+
+    def _set_time_column(self, column):
+        """
+        Make GMT read a column of the input tables as absolute time.
+
+        ``GMT_Put_Vector`` sets the type of a column to absolute time when
+        given datetime strings. Putting a single datetime string in the same
+        column of a one-row dataset does this for the numbers passed by
+        :meth:`pygmt.clib.Session.put_vector`. Options given to a module
+        (e.g., ``-f``) still take precedence.
+
+        Raises
+        ------
+        GMTCLibError
+            If ``GMT_Put_Vector`` exits with status != 0.
+        """
+        c_put_vector = self.get_libgmt_func("GMT_Put_Vector")
+
+        dataset = self.create_data(
+            "GMT_IS_DATASET|GMT_VIA_VECTOR",
+            "GMT_IS_POINT",
+            mode="GMT_CONTAINER_ONLY",
+            dim=[column + 1, 1, 1, 0],
+        )
+        string = (ctp.c_char_p * 1)(b"1970-01-01T00:00:00")
+        status = c_put_vector(
+            self.session_pointer, dataset, column, self["GMT_DATETIME"], string
+        )
+        if status != 0:
+            raise GMTCLibError(f"Failed to set the type of column {column}.")
+
+    def _add_stream_binary_input(self, args):
+        """
+        Read a stream passed as the first argument as binary input
+        (``-bi<ncols>d``).
+
+        The wrappers pass their table input first, so a stream in that
+        position is the only table input of the module (``-bi`` applies to
+        all of them). Streams anywhere else aren't recognized and need a
+        ``-bi`` option from the caller. Does nothing if the arguments already
+        have a ``-bi`` option.
+        """
+        for fname, ncols in self._stream_files.items():
+            if args != fname and not args.startswith(fname + " "):
+                continue
+            if not re.search(r"(^|\s)-bi", args):
+                args += f" -bi{ncols}d"
+            break
+        return args
+
     def put_vector(self, dataset, column, vector):
         """
         Attach a numpy 1D array as a column on a GMT dataset.
@@ -744,7 +1103,12 @@ class Session:
         first. Use ``family='GMT_IS_DATASET|GMT_VIA_VECTOR'``.
 
         Not at all numpy dtypes are supported, only: float64, float32, int64,
-        int32, uint64, uint32, datetime64 and str_.
+        int32, int16, int8, uint64, uint32, uint16, uint8, datetime64 and
+        str_. Vectors are passed to GMT in their own type, without
+        conversion, except datetimes. These are converted to numbers in the
+        time system of GMT (``TIME_EPOCH`` and ``TIME_UNIT``). This avoids
+        formatting and parsing strings. The numbers are kept alive by the
+        session, and GMT is told to read the column as absolute time.
 
         .. warning::
             The numpy array must be C contiguous in memory. If it comes from a
@@ -769,21 +1133,18 @@ class Session:
             If given invalid input or ``GMT_Put_Vector`` exits with status !=
             0.
         """
-        c_put_vector = self.get_libgmt_func(
-            "GMT_Put_Vector",
-            argtypes=[ctp.c_void_p, ctp.c_void_p, ctp.c_uint, ctp.c_uint, ctp.c_void_p],
-            restype=ctp.c_int,
-        )
+        c_put_vector = self.get_libgmt_func("GMT_Put_Vector")
 
         gmt_type = self._check_dtype_and_dim(vector, ndim=1)
-        if gmt_type in (self["GMT_TEXT"], self["GMT_DATETIME"]):
+        if gmt_type == self["GMT_DATETIME"]:
+            vector = datetime_to_numeric(vector, *self._time_system())
+            gmt_type = self["GMT_DOUBLE"]
+            # GMT only keeps a pointer to the numbers
+            self._time_vectors[(getattr(dataset, "value", dataset), column)] = vector
+            self._set_time_column(column)
+        if gmt_type == self["GMT_TEXT"]:
             vector_pointer = (ctp.c_char_p * len(vector))()
-            if gmt_type == self["GMT_DATETIME"]:
-                vector_pointer[:] = np.char.encode(
-                    np.datetime_as_string(array_to_datetime(vector))
-                )
-            else:
-                vector_pointer[:] = np.char.encode(vector)
+            vector_pointer[:] = np.char.encode(vector)
         else:
             vector_pointer = vector.ctypes.data_as(ctp.c_void_p)
         status = c_put_vector(
@@ -820,7 +1181,10 @@ class Session:
             :meth:`pygmt.clib.Session.create_data`.
         family : str
             The family type of the dataset. Can be either ``GMT_IS_VECTOR`` or
-            ``GMT_IS_MATRIX``.
+            ``GMT_IS_MATRIX``, with either the ``GMT_IS_DUPLICATE`` (GMT copies
+            the strings) or ``GMT_IS_REFERENCE`` modifier. With
+            ``GMT_IS_REFERENCE``, GMT uses the encoded strings directly and the
+            session keeps them alive.
         strings : numpy 1d-array
             The array that will be attached to the dataset. Must be a 1d C
             contiguous array.
@@ -831,19 +1195,9 @@ class Session:
             If given invalid input or ``GMT_Put_Strings`` exits with status !=
             0.
         """
-        c_put_strings = self.get_libgmt_func(
-            "GMT_Put_Strings",
-            argtypes=[
-                ctp.c_void_p,
-                ctp.c_uint,
-                ctp.c_void_p,
-                ctp.POINTER(ctp.c_char_p),
-            ],
-            restype=ctp.c_int,
-        )
+        c_put_strings = self.get_libgmt_func("GMT_Put_Strings")
 
-        strings_pointer = (ctp.c_char_p * len(strings))()
-        strings_pointer[:] = np.char.encode(strings)
+        strings_pointer, block = strings_to_ctypes_array(strings)
 
         family_int = self._parse_constant(
             family, valid=FAMILIES, valid_modifiers=METHODS
@@ -856,6 +1210,10 @@ class Session:
             raise GMTCLibError(
                 f"Failed to put strings of type {strings.dtype} into dataset"
             )
+        if "GMT_IS_REFERENCE" in family:
+            # GMT only keeps the pointers to the strings
+            key = getattr(dataset, "value", dataset)
+            self._string_blocks[key] = (strings_pointer, block)
 
     def put_matrix(self, dataset, matrix, pad=0):
         """
@@ -868,7 +1226,8 @@ class Session:
         first. Use ``|GMT_VIA_MATRIX'`` in the family.
 
         Not at all numpy dtypes are supported, only: float64, float32, int64,
-        int32, uint64, and uint32.
+        int32, int16, int8, uint64, uint32, uint16, and uint8. The matrix is
+        passed to GMT in its own type, without conversion.
 
         .. warning::
             The numpy array must be C contiguous in memory. Use
@@ -893,11 +1252,7 @@ class Session:
             If given invalid input or ``GMT_Put_Matrix`` exits with status !=
             0.
         """
-        c_put_matrix = self.get_libgmt_func(
-            "GMT_Put_Matrix",
-            argtypes=[ctp.c_void_p, ctp.c_void_p, ctp.c_uint, ctp.c_int, ctp.c_void_p],
-            restype=ctp.c_int,
-        )
+        c_put_matrix = self.get_libgmt_func("GMT_Put_Matrix")
 
         gmt_type = self._check_dtype_and_dim(matrix, ndim=2)
         matrix_pointer = matrix.ctypes.data_as(ctp.c_void_p)
@@ -946,20 +1301,7 @@ class Session:
             For invalid input arguments or if the GMT API functions returns a
             non-zero status code.
         """
-        c_write_data = self.get_libgmt_func(
-            "GMT_Write_Data",
-            argtypes=[
-                ctp.c_void_p,
-                ctp.c_uint,
-                ctp.c_uint,
-                ctp.c_uint,
-                ctp.c_uint,
-                ctp.POINTER(ctp.c_double),
-                ctp.c_char_p,
-                ctp.c_void_p,
-            ],
-            restype=ctp.c_int,
-        )
+        c_write_data = self.get_libgmt_func("GMT_Write_Data")
 
         family_int = self._parse_constant(family, valid=FAMILIES, valid_modifiers=VIAS)
         geometry_int = self._parse_constant(geometry, valid=GEOMETRIES)
@@ -1042,24 +1384,9 @@ class Session:
         ...
         <vector memory>: N = 5 <0/4> <5/9>
         """
-        c_open_virtualfile = self.get_libgmt_func(
-            "GMT_Open_VirtualFile",
-            argtypes=[
-                ctp.c_void_p,
-                ctp.c_uint,
-                ctp.c_uint,
-                ctp.c_uint,
-                ctp.c_void_p,
-                ctp.c_char_p,
-            ],
-            restype=ctp.c_int,
-        )
+        c_open_virtualfile = self.get_libgmt_func("GMT_Open_VirtualFile")
 
-        c_close_virtualfile = self.get_libgmt_func(
-            "GMT_Close_VirtualFile",
-            argtypes=[ctp.c_void_p, ctp.c_char_p],
-            restype=ctp.c_int,
-        )
+        c_close_virtualfile = self.get_libgmt_func("GMT_Close_VirtualFile")
 
         family_int = self._parse_constant(family, valid=FAMILIES, valid_modifiers=VIAS)
         geometry_int = self._parse_constant(geometry, valid=GEOMETRIES)
@@ -1148,13 +1475,23 @@ class Session:
         arrays = vectors_to_arrays(vectors)
 
         columns = len(arrays)
-        # Find arrays that are of string dtype from column 3 onwards
-        # Assumes that first 2 columns contains coordinates like longitude
-        # latitude, or datetime string types.
+        # Find arrays that are of string dtype (or text categories) from
+        # column 3 onwards. Assumes that first 2 columns contains coordinates
+        # like longitude latitude, or datetime string types.
         for col, array in enumerate(arrays[2:]):
-            if pd.api.types.is_string_dtype(array.dtype):
+            if pd.api.types.is_string_dtype(array.dtype) or isinstance(
+                array.dtype, pd.CategoricalDtype
+            ):
                 columns = col + 2
                 break
+        # Text categories are passed as their codes in the numeric columns and
+        # as their labels in the trailing text columns
+        for col, array in enumerate(arrays):
+            if isinstance(array.dtype, pd.CategoricalDtype):
+                if col < columns:
+                    arrays[col] = categorical_to_codes(array)[0]
+                else:
+                    arrays[col] = np.asarray(array)
 
         rows = len(arrays[0])
         if not all(len(i) == rows for i in arrays):
@@ -1167,29 +1504,34 @@ class Session:
             family, geometry, mode="GMT_CONTAINER_ONLY", dim=[columns, rows, 1, 0]
         )
 
-        # Use put_vector for columns with numerical type data
+        # Use put_vector for columns with numerical (or datetime) type data
         for col, array in enumerate(arrays[:columns]):
             self.put_vector(dataset, column=col, vector=array)
+        key = getattr(dataset, "value", dataset)
 
-        # Use put_strings for last column(s) with string type data
-        # Have to use modifier "GMT_IS_DUPLICATE" to duplicate the strings
+        # Use put_strings for last column(s) with string type data, joined
+        # into a single column. GMT references the encoded strings (kept by
+        # the session until the virtual file is closed) instead of copying.
+        # A single column is passed as is (e.g., strings stored in Arrow are
+        # read from the Arrow buffers).
         string_arrays = arrays[columns:]
         if string_arrays:
-            if len(string_arrays) == 1:
-                strings = string_arrays[0]
-            elif len(string_arrays) > 1:
-                strings = np.apply_along_axis(
-                    func1d=" ".join, axis=0, arr=string_arrays
-                )
-            strings = np.asanyarray(a=strings, dtype=str)
+            strings = string_arrays[0]
+            if len(string_arrays) > 1:
+                strings = join_strings(string_arrays)
             self.put_strings(
-                dataset, family="GMT_IS_VECTOR|GMT_IS_DUPLICATE", strings=strings
+                dataset, family="GMT_IS_VECTOR|GMT_IS_REFERENCE", strings=strings
             )
 
-        with self.open_virtual_file(
-            family, geometry, "GMT_IN|GMT_IS_REFERENCE", dataset
-        ) as vfile:
-            yield vfile
+        try:
+            with self.open_virtual_file(
+                family, geometry, "GMT_IN|GMT_IS_REFERENCE", dataset
+            ) as vfile:
+                yield vfile
+        finally:
+            for col in range(columns):
+                self._time_vectors.pop((key, col), None)
+            self._string_blocks.pop(key, None)
 
     @contextmanager
     def virtualfile_from_matrix(self, matrix):
@@ -1274,6 +1616,102 @@ class Session:
         ) as vfile:
             yield vfile
 
+    @contextmanager
+    def virtualfile_from_stream(self, chunks):
+        """
+        Stream a table to a GMT module in chunks, with bounded memory.
+
+        Use this for tables that are too large to hold in memory at once
+        (e.g., large memory mapped arrays, split with
+        :func:`pygmt.helpers.iter_chunks`). Only one chunk is converted at a
+        time, while GMT reads the table.
+
+        Context manager (use in a ``with`` block). Yields a file name that you
+        can pass as an argument to a GMT module call. The file is a named pipe
+        (FIFO) that a background thread fills with the chunks, as binary
+        float64 records. On platforms without named pipes (Windows), the
+        chunks are written to a temporary file instead.
+
+        Pass the file name as the first argument of
+        :meth:`pygmt.clib.Session.call_module` (like the wrappers pass their
+        input table), which then adds the matching ``-bi<ncols>d`` option. The
+        stream must be the only table input of the module, because ``-bi``
+        applies to all of them.
+
+        GMT can read the pipe only once, so modules that read their input
+        twice (e.g., plotting without a ``region``, which makes GMT scan the
+        data for it) can't use streams.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The chunks of the table, each a 2d array, a
+            :class:`pandas.DataFrame` or a columnar table (see
+            :meth:`pygmt.clib.Session.virtualfile_from_data`) with the same
+            number of numeric columns. A 2d array is split into chunks of rows.
+
+        Yields
+        ------
+        fname : str
+            The name of the file. Pass this as a file name argument to a GMT
+            module.
+
+        Examples
+        --------
+
+        >>> from pygmt.helpers import GMTTempFile
+        >>> import numpy as np
+        >>> chunks = (np.arange(6).reshape((2, 3)) + 6 * i for i in range(3))
+        >>> with Session() as ses:
+        ...     with ses.virtualfile_from_stream(chunks) as fin:
+        ...         # Send the output to a file so that we can read it
+        ...         with GMTTempFile() as fout:
+        ...             ses.call_module("info", f"{fin} -C ->{fout.name}")
+        ...             print(fout.read().strip())
+        ...
+        0 12 1 13 2 14
+        """
+        if isinstance(chunks, np.ndarray):
+            chunks = iter_chunks(chunks)
+        chunks = iter(chunks)
+        try:
+            # The first chunk sets the number of columns for -bi
+            first = chunk_to_matrix(next(chunks))
+        except StopIteration as error:
+            raise GMTInvalidInput("The stream has no chunks.") from error
+        chunks = itertools.chain([first], chunks)
+        ncols = first.shape[1]
+
+        tmpdir = tempfile.mkdtemp(prefix="pygmt-stream-")
+        fname = os.path.join(tmpdir, "table.bin")
+        errors = []
+        writer = None
+        try:
+            if hasattr(os, "mkfifo"):
+                os.mkfifo(fname)
+                writer = threading.Thread(
+                    target=_write_stream,
+                    args=(fname, chunks, ncols, errors),
+                    daemon=True,
+                )
+                writer.start()
+            else:
+                _write_stream(fname, chunks, ncols, errors)
+                if errors:
+                    raise errors[0]
+            self._stream_files[fname] = ncols
+            yield fname
+            if writer is not None:
+                # GMT stopped reading before the end of the stream
+                _close_stream(fname, writer)
+            if errors:
+                raise errors[0]
+        finally:
+            self._stream_files.pop(fname, None)
+            if writer is not None and writer.is_alive():
+                _close_stream(fname, writer)
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
     @contextmanager
     def virtualfile_from_grid(self, grid):
         """
@@ -1294,9 +1732,14 @@ class Session:
         :meth:`pygmt.clib.Session.put_matrix`, and
         :meth:`pygmt.clib.Session.open_virtual_file`
 
-        The grid data matrix must be C contiguous in memory. If it is not
-        (e.g., it is a slice of a larger array), the array will be copied to
-        make sure it is.
+        The grid data matrix must be C contiguous in memory, from North to
+        South. If it is not (e.g., the rows go from South to North or it is a
+        slice of a larger array), the array will be copied to make sure it is
+        (see :func:`pygmt.clib.conversion.dataarray_to_matrix`). Grids made
+        by :func:`pygmt.clib.conversion.padded_grid` (or
+        :meth:`pygmt.GMTDataArrayAccessor.padded`) are passed with their pad,
+        so that GMT uses their memory directly instead of making a padded
+        copy.
 
         Parameters
         ----------
@@ -1343,7 +1786,14 @@ class Session:
         # collected and the memory freed. Creating it in this context manager
         # guarantees that the copy will be around until the virtual file is
         # closed. The conversion is implicit in dataarray_to_matrix.
-        matrix, region, inc = dataarray_to_matrix(grid)
+        padded = padded_grid_buffer(grid)
+        if padded is not None:
+            matrix, pad = padded
+            region, inc = _grid_region_inc(grid)
+            inc = [abs(i) for i in inc]
+        else:
+            matrix, region, inc = dataarray_to_matrix(grid)
+            pad = 0
 
         family = "GMT_IS_GRID|GMT_VIA_MATRIX"
         geometry = "GMT_IS_SURFACE"
@@ -1355,7 +1805,7 @@ class Session:
             inc=inc,
             registration=_reg,
         )
-        self.put_matrix(gmt_grid, matrix)
+        self.put_matrix(gmt_grid, matrix, pad=pad)
         args = (family, geometry, "GMT_IN|GMT_IS_REFERENCE", gmt_grid)
         with self.open_virtual_file(*args) as vfile:
             yield vfile
@@ -1378,6 +1828,11 @@ class Session:
         data : str, xarray.DataArray, 2d array, or None
             Any raster or vector data format. This could be a file name, a
             raster grid, a vector matrix/arrays, or other supported data input.
+            Columnar tables (:class:`pyarrow.Table`, polars ``DataFrame`` and
+            numpy structured arrays) are passed without copying the columns
+            (unless they have missing values, which become NaN). Chunks of a
+            table wrapped in :class:`pygmt.helpers.TableChunks` are streamed
+            (see :meth:`pygmt.clib.Session.virtualfile_from_stream`).
         x/y/z : 1d arrays or None
             x, y and z columns as numpy arrays.
         extra_arrays : list of 1d arrays
@@ -1417,9 +1872,21 @@ class Session:
 
         if check_kind == "raster" and kind not in ("file", "grid"):
             raise GMTInvalidInput(f"Unrecognized data type for grid: {type(data)}")
-        if check_kind == "vector" and kind not in ("file", "matrix", "vectors"):
+        if check_kind == "vector" and kind not in (
+            "file",
+            "matrix",
+            "stream",
+            "vectors",
+        ):
             raise GMTInvalidInput(f"Unrecognized data type: {type(data)}")
 
+        if kind == "grid":
+            # Let GMT read the parts it needs from the file of an unchanged,
+            # lazily loaded grid, instead of loading all of it in memory
+            source = file_backed_grid_source(data)
+            if source is not None:
+                return dummy_context(source)
+
         # Decide which virtualfile_from_ function to use
         _virtualfile_from = {
             "file": dummy_context,
@@ -1428,11 +1895,12 @@ class Session:
             # converted to vectors instead, and using vectors allows for better
             # handling of string type inputs (e.g. for datetime data types)
             "matrix": self.virtualfile_from_vectors,
+            "stream": self.virtualfile_from_stream,
             "vectors": self.virtualfile_from_vectors,
         }[kind]
 
         # Ensure the data is an iterable (Python list or tuple)
-        if kind in ("file", "grid"):
+        if kind in ("file", "grid", "stream"):
             _data = (data,)
         elif kind == "vectors":
             _data = [np.atleast_1d(x), np.atleast_1d(y)]
@@ -1440,27 +1908,218 @@ class Session:
                 _data.append(np.atleast_1d(z))
             if extra_arrays:
                 _data.extend(extra_arrays)
-        elif kind == "matrix":  # turn 2D arrays into list of vectors
-            try:
-                # pandas.DataFrame and xarray.Dataset types
-                _data = [array for _, array in data.items()]
-            except AttributeError:
+        elif kind == "matrix":
+            # Columnar tables (Arrow, polars and numpy structured arrays) pass
+            # the buffers of their columns without copying. Structured arrays
+            # with packed fields of the same numeric type are a matrix.
+            matrix = structured_to_matrix(data)
+            columns = table_to_columns(data) if matrix is None else None
+            if matrix is not None:
+                _virtualfile_from = self.virtualfile_from_matrix
+                _data = (matrix,)
+            elif columns is not None:
+                _data = columns
+            else:  # turn 2D arrays into list of vectors
                 try:
-                    # Just use virtualfile_from_matrix for 2D numpy.ndarray
-                    # which are signed integer (i), unsigned integer (u) or
-                    # floating point (f) types
-                    assert data.ndim == 2 and data.dtype.kind in "iuf"
-                    _virtualfile_from = self.virtualfile_from_matrix
-                    _data = (data,)
-                except (AssertionError, AttributeError):
-                    # Python lists, tuples, and numpy ndarray types
-                    _data = np.atleast_2d(np.asanyarray(data).T)
+                    # pandas.DataFrame and xarray.Dataset types
+                    _data = [array for _, array in data.items()]
+                except AttributeError:
+                    try:
+                        # Just use virtualfile_from_matrix for 2D
+                        # numpy.ndarray which are signed integer (i), unsigned
+                        # integer (u) or floating point (f) types
+                        assert data.ndim == 2 and data.dtype.kind in "iuf"
+                        _virtualfile_from = self.virtualfile_from_matrix
+                        _data = (data,)
+                    except (AssertionError, AttributeError):
+                        # Python lists, tuples, and numpy ndarray types
+                        _data = np.atleast_2d(np.asanyarray(data).T)
 
         # Finally create the virtualfile from the data, to be passed into GMT
         file_context = _virtualfile_from(*_data)
 
         return file_context
 
+    @contextmanager
+    def virtualfile_out(self, kind="grid", fname=None):
+        """
+        Create a virtual file for storing the output of a GMT module.
+
+        The output is kept in memory and can be read with
+        :meth:`pygmt.clib.Session.read_virtualfile` (or converted with
+        :meth:`pygmt.clib.Session.virtualfile_to_grid`) before leaving the
+        context manager. If a file name is given, no virtual file is created
+        and the file name is used instead, so that wrappers can handle both
+        cases the same way.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of output. Either ``"grid"`` or ``"dataset"``.
+        fname : str or None
+            The name of the actual file to write the output to.
+
+        Yields
+        ------
+        vfname : str
+            The name of the virtual file (or ``fname``).
+
+        Examples
+        --------
+        >>> from pygmt.datasets import load_earth_relief
+        >>> grid = load_earth_relief()
+        >>> with Session() as lib:
+        ...     with lib.virtualfile_from_grid(grid) as fin:
+        ...         with lib.virtualfile_out(kind="grid") as fout:
+        ...             args = f"{fin} -R0/10/0/10 -G{fout}"
+        ...             lib.call_module("grdcut", args)
+        ...             result = lib.virtualfile_to_grid(fout)
+        ...
+        >>> result.shape
+        (10, 10)
+        """
+        if fname is not None:
+            yield fname
+            return
+
+        family, geometry = {
+            "grid": ("GMT_IS_GRID", "GMT_IS_SURFACE"),
+            "dataset": ("GMT_IS_DATASET", "GMT_IS_PLP"),
+        }[kind]
+        container = self.create_data(family, geometry, "GMT_IS_OUTPUT")
+        with self.open_virtual_file(family, geometry, "GMT_OUT", container) as vfile:
+            yield vfile
+
+    def read_virtualfile(self, vfname, kind="grid"):
+        """
+        Get the data container of an output virtual file.
+
+        Wraps ``GMT_Read_VirtualFile``. The memory is owned by the GMT API
+        session, so the data must be copied before the session is destroyed.
+
+        Parameters
+        ----------
+        vfname : str
+            The name of an output virtual file (see
+            :meth:`pygmt.clib.Session.virtualfile_out`).
+        kind : str
+            The kind of data in the virtual file. Either ``"grid"`` or
+            ``"dataset"``.
+
+        Returns
+        -------
+        pointer : ctypes.POINTER
+            A pointer to the ctypes structure of the data container (e.g.,
+            ``_GMT_GRID`` or ``_GMT_DATASET``).
+        """
+        c_read_virtualfile = self.get_libgmt_func("GMT_Read_VirtualFile")
+        pointer = c_read_virtualfile(self.session_pointer, vfname.encode())
+        if pointer is None:
+            raise GMTCLibError(
+                f"Failed to read virtual file '{vfname}':\n{self._error_message}"
+            )
+        dtype = {"grid": _GMT_GRID, "dataset": _GMT_DATASET}[kind]
+        return ctp.cast(pointer, ctp.POINTER(dtype))
+
+    def virtualfile_to_grid(self, vfname, outgrid=None, copy=True, dtype=None):
+        """
+        Convert the output grid of a GMT module to a DataArray.
+
+        The grid is built directly from the header and data returned by GMT,
+        without writing it to a file. The ``gmt`` accessor is filled with the
+        registration and grid type of the header.
+
+        Parameters
+        ----------
+        vfname : str
+            The name of the output virtual file (see
+            :meth:`pygmt.clib.Session.virtualfile_out`).
+        outgrid : str or None
+            The name of the file the output was written to instead of a virtual
+            file. If given, returns None.
+        copy : bool
+            If False, the DataArray is a view of the memory owned by GMT
+            instead of a copy. Only use it for short-lived grids: the whole
+            GMT API session (with every object registered in it) is kept alive
+            until the DataArray and all views of it are garbage collected,
+            which the ``nbytes`` of the grid doesn't account for. Inside
+            :func:`pygmt.session`, the memory is kept until the end of the
+            shared session at least. The view goes from South to North, so
+            passing it back to GMT copies it.
+        dtype : str or numpy.dtype or None
+            Convert the data to this type. Default is the type of the grids of
+            GMT (float32 unless GMT was built otherwise). The data isn't
+            copied (or converted) if it already has this type.
+
+        Returns
+        -------
+        grid : xarray.DataArray or None
+            The output grid or None if ``outgrid`` is set.
+        """
+        if outgrid is not None:
+            return None
+        owner = None if copy else self._memory_keeper()
+        grid = self.read_virtualfile(vfname, kind="grid").contents
+        dataarray = grid.to_dataarray(owner=owner)
+        if dtype is not None and dataarray.dtype != np.dtype(dtype):
+            registration, gtype = dataarray.gmt.registration, dataarray.gmt.gtype
+            dataarray = dataarray.astype(dtype)
+            dataarray.gmt.registration = registration
+            dataarray.gmt.gtype = gtype
+        return dataarray
+
+    def virtualfile_to_dataset(
+        self, vfname, outfile=None, column_names=None, header=None
+    ):
+        """
+        Convert the output table of a GMT module to a pandas.DataFrame.
+
+        The columns are copied straight from the GMT_DATASET returned by GMT,
+        without formatting and parsing text. Segment headers are dropped and
+        the trailing text of the records (if any) becomes the last column.
+
+        Parameters
+        ----------
+        vfname : str
+            The name of the output virtual file (see
+            :meth:`pygmt.clib.Session.virtualfile_out`).
+        outfile : str or None
+            The name of the file the output was written to instead of a virtual
+            file. If given, returns None.
+        column_names : list of str or None
+            The names of the columns. Default to integers.
+        header : int or None
+            Index of the table header line holding the column names (used if
+            ``column_names`` is None).
+
+        Returns
+        -------
+        table : pandas.DataFrame or None
+            The output table or None if ``outfile`` is set.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> x, y = np.arange(3), np.array([5, 6, 7])
+        >>> with Session() as lib:
+        ...     with lib.virtualfile_from_vectors(x, y) as fin:
+        ...         with lib.virtualfile_out(kind="dataset") as fout:
+        ...             lib.call_module("gmtconvert", f"{fin} -o1,0 ->{fout}")
+        ...             table = lib.virtualfile_to_dataset(
+        ...                 fout, column_names=["y", "x"]
+        ...             )
+        ...
+        >>> table
+             y    x
+        0  5.0  0.0
+        1  6.0  1.0
+        2  7.0  2.0
+        """
+        if outfile is not None:
+            return None
+        dataset = self.read_virtualfile(vfname, kind="dataset").contents
+        return dataset.to_dataframe(column_names=column_names, header=header)
+
     def extract_region(self):
         """
         Extract the WESN bounding box of the currently active figure.
@@ -1518,11 +2177,7 @@ class Session:
         >>> print(", ".join(["{:.2f}".format(x) for x in wesn]))
         -165.00, -150.00, 15.00, 25.00
         """
-        c_extract_region = self.get_libgmt_func(
-            "GMT_Extract_Region",
-            argtypes=[ctp.c_void_p, ctp.c_char_p, ctp.POINTER(ctp.c_double)],
-            restype=ctp.c_int,
-        )
+        c_extract_region = self.get_libgmt_func("GMT_Extract_Region")
 
         wesn = np.empty(4, dtype=np.float64)
         wesn_pointer = wesn.ctypes.data_as(ctp.POINTER(ctp.c_double))
@@ -1533,3 +2188,41 @@ class Session:
         if status != 0:
             raise GMTCLibError("Failed to extract region from current figure.")
         return wesn
+
+
+def _write_stream(fname, chunks, ncols, errors):
+    """
+    Write chunks of a table to a file (or pipe) as binary float64 records.
+
+    Errors are appended to *errors* instead of raised, since this runs in a
+    thread. Stops quietly if the reader closes the pipe.
+    """
+    try:
+        with open(fname, "wb") as stream:
+            for chunk in chunks:
+                matrix = chunk_to_matrix(chunk)
+                if matrix.shape[1] != ncols:
+                    raise GMTInvalidInput(
+                        f"All chunks must have {ncols} columns, "
+                        f"got {matrix.shape[1]}."
+                    )
+                stream.write(memoryview(matrix).cast("B"))
+    except BrokenPipeError:
+        pass
+    except Exception as error:  # pylint: disable=broad-except
+        errors.append(error)
+
+
+def _close_stream(fname, writer):
+    """
+    Stop the thread writing to a named pipe that nobody is reading anymore.
+
+    Opening and closing the reading end unblocks the writer (waiting to open
+    the pipe, or to write to it), which then gets a broken pipe.
+    """
+    while writer.is_alive():
+        try:
+            os.close(os.open(fname, os.O_RDONLY | os.O_NONBLOCK))
+        except OSError:
+            pass
+        writer.join(timeout=0.1)
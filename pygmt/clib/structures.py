@@ -0,0 +1,357 @@
+"""
+ctypes mirrors of the GMT data structures defined in ``gmt_resources.h``.
+
+Used to access the data containers returned by the GMT API (e.g., the output
+virtual files read with ``GMT_Read_VirtualFile``) without going through a file.
+"""
+import ctypes as ctp
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# Lengths of the fixed size strings in the grid header
+GMT_GRID_UNIT_LEN80 = 80
+GMT_GRID_TITLE_LEN80 = 80
+GMT_GRID_COMMAND_LEN320 = 320
+GMT_GRID_REMARK_LEN160 = 160
+
+
+class _GMT_GRID_HEADER(ctp.Structure):  # pylint: disable=invalid-name
+    """
+    The header of a GMT grid (``struct GMT_GRID_HEADER``).
+    """
+
+    _fields_ = [
+        ("n_columns", ctp.c_uint32),
+        ("n_rows", ctp.c_uint32),
+        ("registration", ctp.c_uint32),
+        ("wesn", ctp.c_double * 4),
+        ("z_min", ctp.c_double),
+        ("z_max", ctp.c_double),
+        ("inc", ctp.c_double * 2),
+        ("z_scale_factor", ctp.c_double),
+        ("z_add_offset", ctp.c_double),
+        ("x_units", ctp.c_char * GMT_GRID_UNIT_LEN80),
+        ("y_units", ctp.c_char * GMT_GRID_UNIT_LEN80),
+        ("z_units", ctp.c_char * GMT_GRID_UNIT_LEN80),
+        ("title", ctp.c_char * GMT_GRID_TITLE_LEN80),
+        ("command", ctp.c_char * GMT_GRID_COMMAND_LEN320),
+        ("remark", ctp.c_char * GMT_GRID_REMARK_LEN160),
+        ("type", ctp.c_uint),
+        ("bits", ctp.c_uint),
+        ("complex_mode", ctp.c_uint),
+        ("mx", ctp.c_uint),
+        ("my", ctp.c_uint),
+        ("nm", ctp.c_size_t),
+        ("size", ctp.c_size_t),
+        ("n_alloc", ctp.c_size_t),
+        ("trendmode", ctp.c_uint),
+        ("arrangement", ctp.c_uint),
+        ("n_bands", ctp.c_uint),
+        ("pad", ctp.c_uint * 4),
+        ("mem_layout", ctp.c_char * 4),
+        ("nan_value", ctp.c_float),
+        ("xy_off", ctp.c_double),
+        ("ProjRefPROJ4", ctp.c_char_p),
+        ("ProjRefWKT", ctp.c_char_p),
+        ("ProjRefEPSG", ctp.c_int),
+        ("hidden", ctp.c_void_p),
+    ]
+
+    @property
+    def gtype(self):
+        """
+        The grid type: 0 for Cartesian and 1 for geographic grids.
+
+        GMT labels the x and y units of geographic grids as longitude and
+        latitude.
+        """
+        return int(
+            self.x_units.decode().startswith("longitude")
+            or self.y_units.decode().startswith("latitude")
+        )
+
+    def coordinates(self):
+        """
+        The x and y coordinates of the grid nodes (or pixel centers).
+
+        Returns
+        -------
+        x, y : numpy.ndarray
+            The coordinates in ascending order.
+        """
+        west, east, south, north = self.wesn
+        xinc, yinc = self.inc
+        offset = 0.5 if self.registration == 1 else 0.0
+        x = west + (np.arange(self.n_columns) + offset) * xinc
+        y = south + (np.arange(self.n_rows) + offset) * yinc
+        # Make sure the last node falls exactly on the boundary
+        if offset == 0.0 and self.n_columns > 1:
+            x[-1] = east
+        if offset == 0.0 and self.n_rows > 1:
+            y[-1] = north
+        return x, y
+
+
+class _GMT_GRID(ctp.Structure):  # pylint: disable=invalid-name
+    """
+    A GMT grid (``struct GMT_GRID``).
+
+    Only the members shared by all supported GMT versions are declared. Always
+    use it through a pointer returned by the GMT API.
+    """
+
+    _fields_ = [
+        ("header", ctp.POINTER(_GMT_GRID_HEADER)),
+        ("data", ctp.POINTER(ctp.c_float)),
+    ]
+
+    def to_dataarray(self, owner=None):
+        """
+        Convert the grid to an :class:`xarray.DataArray`.
+
+        The data are stripped of the padding and flipped so that the
+        latitude/y coordinates are ascending, like grids read from netCDF
+        files. The registration and grid type are set in the ``gmt``
+        accessor.
+
+        Parameters
+        ----------
+        owner : object or None
+            The object keeping the GMT-owned memory alive. If given, the data
+            aren't copied: the array is a view of the GMT memory and holds a
+            reference to *owner*. Otherwise, the data are copied.
+
+        Returns
+        -------
+        grid : xarray.DataArray
+        """
+        header = self.header.contents
+        x, y = header.coordinates()
+        pad_west, pad_east, pad_south, pad_north = header.pad
+        # GMT stores the grid row by row from the top (north) row
+        padded = _as_array(self.data, shape=(header.my, header.mx), owner=owner)
+        data = padded[
+            header.my - pad_south - 1 : pad_north - 1 if pad_north else None : -1,
+            pad_west : header.mx - pad_east,
+        ]
+        if owner is None:
+            data = data.copy()
+
+        if header.gtype == 1:
+            dims = ("lat", "lon")
+        else:
+            dims = ("y", "x")
+        coords = {}
+        for dim, values, units, (vmin, vmax) in [
+            (dims[0], y, header.y_units, header.wesn[2:]),
+            (dims[1], x, header.x_units, header.wesn[:2]),
+        ]:
+            attrs = _parse_units(units.decode(), default=dim)
+            attrs["actual_range"] = np.array([vmin, vmax])
+            coords[dim] = (dim, values, attrs)
+        attrs = _parse_units(header.z_units.decode(), default="z")
+        attrs["actual_range"] = np.array([header.z_min, header.z_max])
+
+        grid = xr.DataArray(data, coords=coords, dims=dims, name="z", attrs=attrs)
+        grid.gmt.registration = header.registration
+        grid.gmt.gtype = header.gtype
+        return grid
+
+
+def _as_array(pointer, shape, owner=None):
+    """
+    Wrap the memory behind a ctypes pointer in a numpy array, without copying.
+
+    Parameters
+    ----------
+    pointer : ctypes.POINTER
+        Pointer to the first element.
+    shape : tuple of int
+        The shape of the array.
+    owner : object or None
+        An object to keep alive for as long as the array (or any view of it)
+        is. Set it if the memory is freed when *owner* is garbage collected.
+
+    Returns
+    -------
+    array : numpy.ndarray
+    """
+    size = int(np.prod(shape))
+    if size == 0 or not pointer:
+        return np.empty(shape, dtype=pointer._type_)
+    buffer = (pointer._type_ * size).from_address(ctp.addressof(pointer.contents))
+    # The array holds a reference to the ctypes buffer (through the buffer
+    # protocol) and the buffer holds a reference to the owner.
+    buffer._owner = owner  # pylint: disable=protected-access
+    return np.frombuffer(buffer, dtype=pointer._type_).reshape(shape)
+
+
+def _parse_units(units, default):
+    """
+    Split GMT units like ``"longitude [degrees_east]"`` into attributes.
+
+    Parameters
+    ----------
+    units : str
+        The units as stored in the grid header.
+    default : str
+        The long name to use if the units are empty.
+
+    Returns
+    -------
+    attrs : dict
+        The ``long_name`` and (if given) ``units`` attributes.
+    """
+    long_name, _, unit = units.partition("[")
+    attrs = {"long_name": long_name.strip() or default}
+    unit = unit.rstrip("]").strip()
+    if unit:
+        attrs["units"] = unit
+    return attrs
+
+
+class _GMT_DATASEGMENT(ctp.Structure):  # pylint: disable=invalid-name
+    """
+    A segment of a GMT table (``struct GMT_DATASEGMENT``).
+    """
+
+    _fields_ = [
+        ("n_rows", ctp.c_uint64),
+        ("n_columns", ctp.c_uint64),
+        ("min", ctp.POINTER(ctp.c_double)),
+        ("max", ctp.POINTER(ctp.c_double)),
+        ("data", ctp.POINTER(ctp.POINTER(ctp.c_double))),
+        ("label", ctp.c_char_p),
+        ("header", ctp.c_char_p),
+        ("text", ctp.POINTER(ctp.c_char_p)),
+    ]
+
+
+class _GMT_DATATABLE(ctp.Structure):  # pylint: disable=invalid-name
+    """
+    A GMT table (``struct GMT_DATATABLE``).
+    """
+
+    _fields_ = [
+        ("n_headers", ctp.c_uint),
+        ("n_columns", ctp.c_uint64),
+        ("n_segments", ctp.c_uint64),
+        ("n_records", ctp.c_uint64),
+        ("min", ctp.POINTER(ctp.c_double)),
+        ("max", ctp.POINTER(ctp.c_double)),
+        ("header", ctp.POINTER(ctp.c_char_p)),
+        ("segment", ctp.POINTER(ctp.POINTER(_GMT_DATASEGMENT))),
+    ]
+
+
+class _GMT_DATASET(ctp.Structure):  # pylint: disable=invalid-name
+    """
+    A GMT dataset made of tables of segments (``struct GMT_DATASET``).
+
+    Only the members shared by all supported GMT versions are declared. Always
+    use it through a pointer returned by the GMT API.
+    """
+
+    _fields_ = [
+        ("n_tables", ctp.c_uint64),
+        ("n_columns", ctp.c_uint64),
+        ("n_segments", ctp.c_uint64),
+        ("n_records", ctp.c_uint64),
+        ("min", ctp.POINTER(ctp.c_double)),
+        ("max", ctp.POINTER(ctp.c_double)),
+        ("table", ctp.POINTER(ctp.POINTER(_GMT_DATATABLE))),
+    ]
+
+    def _segments(self):
+        """
+        Iterate over all segments of all tables.
+        """
+        for i in range(self.n_tables):
+            table = self.table[i].contents
+            for j in range(table.n_segments):
+                yield table.segment[j].contents
+
+    def header(self, index):
+        """
+        Get one of the header lines of the first table, without the "#".
+
+        Parameters
+        ----------
+        index : int
+            The index of the header line.
+
+        Returns
+        -------
+        header : str or None
+            None if the table has no such header line.
+        """
+        if self.n_tables == 0:
+            return None
+        table = self.table[0].contents
+        if index >= table.n_headers:
+            return None
+        return table.header[index].decode().lstrip("#").strip()
+
+    def to_vectors(self):
+        """
+        Copy the columns of all segments into 1d arrays.
+
+        Segment headers are dropped. The trailing text of the records (if
+        any) becomes an extra column of strings.
+
+        Returns
+        -------
+        vectors : list of 1d arrays
+            The numerical columns as float64 arrays, followed by the trailing
+            text as an object array if present.
+        """
+        segments = [segment for segment in self._segments() if segment.n_rows > 0]
+        vectors = []
+        for col in range(self.n_columns):
+            columns = [
+                np.ctypeslib.as_array(segment.data[col], shape=(segment.n_rows,))
+                for segment in segments
+            ]
+            vectors.append(
+                np.concatenate(columns) if columns else np.empty(0, dtype=np.float64)
+            )
+        if any(segment.text for segment in segments):
+            text = []
+            for segment in segments:
+                if segment.text:
+                    strings = segment.text[: segment.n_rows]
+                    text.extend(b"" if s is None else s for s in strings)
+                else:
+                    text.extend([b""] * segment.n_rows)
+            vectors.append(
+                np.char.decode(np.array(text, dtype=np.bytes_)).astype(object)
+            )
+        return vectors
+
+    def to_dataframe(self, column_names=None, header=None):
+        """
+        Convert the dataset to a :class:`pandas.DataFrame`.
+
+        Parameters
+        ----------
+        column_names : list of str or None
+            The names of the columns.
+        header : int or None
+            Index of the table header line holding the column names (used if
+            ``column_names`` is None).
+
+        Returns
+        -------
+        table : pandas.DataFrame
+        """
+        vectors = self.to_vectors()
+        table = pd.DataFrame(dict(enumerate(vectors)), copy=False)
+        if column_names is None and header is not None:
+            names = self.header(header)
+            if names is not None:
+                column_names = names.split()
+        if column_names is not None:
+            table.columns = column_names
+        return table
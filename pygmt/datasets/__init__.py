@@ -2,7 +2,23 @@
 #
 # Load sample data included with GMT (downloaded from the GMT cache server).
 
+from pygmt.datasets.cache import (
+    cached_files_size,
+    earth_relief_tiles,
+    evict_cached_files,
+    list_cached_files,
+    pin_earth_relief,
+    prefetch_earth_relief,
+    set_cache_budget,
+    unpin_earth_relief,
+)
 from pygmt.datasets.earth_relief import load_earth_relief
+from pygmt.datasets.memo import (
+    GridMemo,
+    disable_earth_relief_memo,
+    earth_relief_memo,
+    enable_earth_relief_memo,
+)
 from pygmt.datasets.samples import (
     load_fractures_compilation,
     load_japan_quakes,
@@ -0,0 +1,740 @@
+"""
+Functions to manage the local copies of the remote datasets downloaded from
+the GMT data server.
+
+GMT keeps every remote file (e.g., the Earth relief tiles) in the ``server``
+directory of the GMT user directory and never removes them. The functions
+here list these files, keep their total size under a disk budget by removing
+the least recently used tiles, pin the tiles of regions that must never be
+removed, and download the tiles of a region ahead of time (concurrently).
+Non-tiled grids (e.g., ``earth_relief_01d_g.grd``) are never removed, since
+lazily loaded grids read them on demand.
+
+The budget and the pinned tiles are stored in a small JSON file in the
+``server`` directory so that they are shared by all processes using it.
+"""
+import functools
+import math
+import os
+import shutil
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from pygmt.clib import Session
+from pygmt.exceptions import GMTCLibError, GMTInvalidInput
+from pygmt.helpers.caching import read_json_cache, write_json_cache
+
+# Name of the file storing the budget and pinned tiles in the server directory
+STATE_FILE = "pygmt_cache.json"
+
+# Seconds to wait for the data server (to connect or for the next bytes of a
+# tile) before giving up on a tile. The PYGMT_DOWNLOAD_TIMEOUT environment
+# variable overrides it.
+DOWNLOAD_TIMEOUT = 30
+
+# Size (in degrees) of the square tiles of the tiled Earth relief grids
+TILE_SIZES = {
+    "05m": 90,
+    "04m": 90,
+    "03m": 90,
+    "02m": 90,
+    "01m": 30,
+    "30s": 15,
+    "15s": 15,
+    "03s": 1,
+    "01s": 1,
+}
+
+
+def server_dir():
+    """
+    Get the directory where GMT stores the files downloaded from its server.
+
+    Returns
+    -------
+    directory : pathlib.Path
+        ``$GMT_USERDIR/server`` (``~/.gmt/server`` by default).
+    """
+    userdir = os.environ.get("GMT_USERDIR") or os.path.join("~", ".gmt")
+    return Path(userdir).expanduser() / "server"
+
+
+def _state_file(directory):
+    """
+    The JSON file storing the budget and pinned tiles of a server directory.
+    """
+    return Path(directory or server_dir()) / STATE_FILE
+
+
+def _is_dataset_file(path):
+    """
+    Tell the remote data files apart from the bookkeeping files of GMT and
+    PyGMT (e.g., ``gmt_hash_server.txt``) in the server directory.
+    """
+    return path.name != STATE_FILE and not (
+        path.name.startswith("gmt_") and path.suffix == ".txt"
+    )
+
+
+def _is_tile(path):
+    """
+    Tell the tiles of the tiled grids apart from the other remote files.
+
+    Tiles are stored in a directory named after their grid (e.g.,
+    ``earth_relief_05m_p/N00E000.earth_relief_05m_p.nc``).
+    """
+    parts = _stem(path).split(".", maxsplit=1)
+    return len(parts) == 2 and parts[1] == Path(path).parent.name
+
+
+def _stem(path):
+    """
+    The name of a file without the directory and the extension.
+
+    Tiles are downloaded as JPEG2000 files and converted to netCDF, so the
+    extension varies. E.g., ``N00E000.earth_relief_05m_p``.
+    """
+    return os.path.basename(path).rsplit(".", maxsplit=1)[0]
+
+
+def list_cached_files(directory=None):
+    """
+    List the remote files downloaded from the GMT data server.
+
+    Parameters
+    ----------
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    files : pandas.DataFrame
+        One row per file with the columns ``path``, ``size`` (in bytes),
+        ``last_used`` (a datetime), ``pinned`` and ``tile`` (bools), sorted
+        from the least to the most recently used file.
+    """
+    directory = Path(directory or server_dir())
+    pinned = set(read_json_cache(_state_file(directory)).get("pinned", []))
+    rows = []
+    if directory.is_dir():
+        for path in directory.rglob("*"):
+            if not path.is_file() or not _is_dataset_file(path):
+                continue
+            stat = path.stat()
+            rows.append(
+                (
+                    str(path),
+                    stat.st_size,
+                    max(stat.st_atime, stat.st_mtime),
+                    _stem(path) in pinned,
+                    _is_tile(path),
+                )
+            )
+    files = pd.DataFrame(rows, columns=["path", "size", "last_used", "pinned", "tile"])
+    files["size"] = files["size"].astype("int64")
+    files["last_used"] = pd.to_datetime(files["last_used"], unit="s")
+    files["pinned"] = files["pinned"].astype(bool)
+    files["tile"] = files["tile"].astype(bool)
+    return files.sort_values("last_used", kind="stable", ignore_index=True)
+
+
+def cached_files_size(directory=None):
+    """
+    Get the total size of the remote files downloaded from the GMT server.
+
+    Parameters
+    ----------
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    size : int
+        The size in bytes.
+    """
+    return int(list_cached_files(directory)["size"].sum())
+
+
+def set_cache_budget(budget, directory=None):
+    """
+    Set the maximum total size of the remote files downloaded from the GMT
+    server.
+
+    The least recently used tiles are removed right away to fit the budget
+    and again every time :func:`pygmt.datasets.load_earth_relief` or
+    :func:`prefetch_earth_relief` download tiles. Pinned tiles and non-tiled
+    files are never removed (but count towards the budget).
+
+    Parameters
+    ----------
+    budget : int or None
+        The budget in bytes. None removes the budget.
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    removed : list of str
+        The files removed to fit the budget.
+    """
+    if budget is not None and budget < 0:
+        raise GMTInvalidInput(f"Invalid cache budget '{budget}'.")
+    state_file = _state_file(directory)
+    state = read_json_cache(state_file)
+    state["budget"] = budget
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json_cache(state_file, state)
+    return evict_cached_files(directory=directory)
+
+
+def evict_cached_files(budget=None, directory=None):
+    """
+    Remove the least recently used tiles until the remote files fit in a
+    budget.
+
+    Pinned tiles are never removed, and neither are the files that aren't
+    tiles (e.g., the low resolution grids, which lazily loaded grids may be
+    reading). GMT downloads the removed tiles again when they are needed.
+
+    Parameters
+    ----------
+    budget : int or None
+        The budget in bytes. Default is the budget set with
+        :func:`set_cache_budget` (if any).
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    removed : list of str
+        The removed files.
+    """
+    if budget is None:
+        budget = read_json_cache(_state_file(directory)).get("budget")
+    if budget is None:
+        return []
+    files = list_cached_files(directory)
+    excess = files["size"].sum() - budget
+    removed = []
+    removable = files["tile"] & ~files["pinned"]
+    for path, size in files.loc[removable, ["path", "size"]].itertuples(index=False):
+        if excess <= 0:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        excess -= size
+        removed.append(path)
+    return removed
+
+
+def _region_bounds(region):
+    """
+    Get the bounds of a region given as 4 numbers.
+
+    Parameters
+    ----------
+    region : str or list
+        The region [*xmin*, *xmax*, *ymin*, *ymax*] (or *xmin/xmax/ymin/ymax*).
+
+    Returns
+    -------
+    bounds : tuple of float or None
+        The west, east, south and north bounds, or None if the region is
+        something else GMT accepts (e.g., ``"g"``, a country code like
+        ``"JP"`` or ``"-10/10/-5/5+r"``).
+
+    Examples
+    --------
+
+    >>> _region_bounds("-10/10/-5/5")
+    (-10.0, 10.0, -5.0, 5.0)
+    >>> _region_bounds("JP") is None
+    True
+    >>> _region_bounds("-10/10/-5/5+r") is None
+    True
+    """
+    if isinstance(region, str):
+        region = region.split("/")
+    try:
+        bounds = tuple(float(value) for value in region)
+    except (TypeError, ValueError):
+        return None
+    if len(bounds) != 4:
+        return None
+    return bounds
+
+
+def earth_relief_tiles(region, resolution, registration=None, use_srtm=False):
+    """
+    Get the names of the Earth relief tiles covering a region.
+
+    Parameters
+    ----------
+    region : str or list
+        The region [*xmin*, *xmax*, *ymin*, *ymax*] (or *xmin/xmax/ymin/ymax*)
+        in degrees.
+    resolution : str
+        One of the tiled resolutions of
+        :func:`pygmt.datasets.load_earth_relief` (``'05m'`` to ``'01s'``).
+    registration : str or None
+        ``'pixel'`` or ``'gridline'``. Default is None, for the registration
+        used by GMT when it isn't given.
+    use_srtm : bool
+        Get the original land-only SRTM tiles (``'03s'`` and ``'01s'``).
+
+    Returns
+    -------
+    tiles : list of str
+        The remote tile names (e.g., ``'@N00E000.earth_relief_05m_p.jp2'``).
+
+    Examples
+    --------
+
+    >>> earth_relief_tiles([-10, 10, 0, 10], "01m", registration="gridline")
+    ['@N00W030.earth_relief_01m_g.jp2', '@N00E000.earth_relief_01m_g.jp2']
+    """
+    if resolution not in TILE_SIZES:
+        raise GMTInvalidInput(f"Invalid tiled Earth relief resolution '{resolution}'.")
+    if registration is None:
+        registration = "gridline" if resolution in ("03s", "01s") else "pixel"
+    if registration not in ("pixel", "gridline"):
+        raise GMTInvalidInput(f"Invalid grid registration: '{registration}'.")
+    prefix = "earth_relief_"
+    if use_srtm and resolution in ("03s", "01s"):
+        prefix = "srtm_relief_"
+    dataset = f"{prefix}{resolution}_{registration[0]}"
+
+    bounds = _region_bounds(region)
+    if bounds is None:
+        raise GMTInvalidInput(
+            f"Invalid region '{region}': must be the 4 numbers xmin/xmax/ymin/ymax."
+        )
+    west, east, south, north = bounds
+    size = TILE_SIZES[resolution]
+    tiles = []
+    lat = math.floor(max(south, -90) / size) * size
+    while lat < min(north, 90):
+        lon = math.floor(west / size) * size
+        while lon < east and lon < west + 360:
+            lon_tile = (lon + 180) % 360 - 180
+            name = (
+                f"@{'N' if lat >= 0 else 'S'}{abs(lat):02d}"
+                f"{'E' if lon_tile >= 0 else 'W'}{abs(lon_tile):03d}.{dataset}.jp2"
+            )
+            if name not in tiles:
+                tiles.append(name)
+            lon += size
+        lat += size
+    return tiles
+
+
+def _update_pins(tiles, pin, directory):
+    """
+    Add (or remove) tiles to the pinned tiles.
+    """
+    state_file = _state_file(directory)
+    state = read_json_cache(state_file)
+    pinned = set(state.get("pinned", []))
+    stems = {_stem(tile.lstrip("@")) for tile in tiles}
+    pinned = pinned | stems if pin else pinned - stems
+    state["pinned"] = sorted(pinned)
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json_cache(state_file, state)
+
+
+def pin_earth_relief(
+    region, resolution, registration=None, use_srtm=False, directory=None
+):
+    """
+    Protect the Earth relief tiles of a region from being removed to fit the
+    budget.
+
+    The tiles don't need to be downloaded yet (see
+    :func:`prefetch_earth_relief`).
+
+    Parameters
+    ----------
+    region : str or list
+        The region [*xmin*, *xmax*, *ymin*, *ymax*] in degrees.
+    resolution : str
+        One of the tiled resolutions (``'05m'`` to ``'01s'``).
+    registration : str or None
+        ``'pixel'`` or ``'gridline'``.
+    use_srtm : bool
+        Pin the original land-only SRTM tiles.
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    tiles : list of str
+        The pinned tile names.
+    """
+    tiles = earth_relief_tiles(region, resolution, registration, use_srtm)
+    _update_pins(tiles, pin=True, directory=directory)
+    return tiles
+
+
+def unpin_earth_relief(
+    region, resolution, registration=None, use_srtm=False, directory=None
+):
+    """
+    Allow the pinned Earth relief tiles of a region to be removed again.
+
+    Parameters
+    ----------
+    region : str or list
+        The region [*xmin*, *xmax*, *ymin*, *ymax*] in degrees.
+    resolution : str
+        One of the tiled resolutions (``'05m'`` to ``'01s'``).
+    registration : str or None
+        ``'pixel'`` or ``'gridline'``.
+    use_srtm : bool
+        Unpin the original land-only SRTM tiles.
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+
+    Returns
+    -------
+    tiles : list of str
+        The unpinned tile names.
+    """
+    tiles = earth_relief_tiles(region, resolution, registration, use_srtm)
+    _update_pins(tiles, pin=False, directory=directory)
+    return tiles
+
+
+def _touch_tiles(tiles, directory=None):
+    """
+    Mark the downloaded tiles as just used.
+
+    Many file systems don't update the access time of the files on every read
+    so the least recently used tiles are tracked explicitly. Only the paths
+    of the given tiles are touched, without listing the server directory.
+
+    Parameters
+    ----------
+    tiles : list of str
+        The remote tile names (see :func:`earth_relief_tiles`).
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+    """
+    directory = Path(directory or server_dir())
+    now = time.time()
+    for tile in tiles:
+        subdir, stem = _tile_location(tile)
+        path = directory / subdir / f"{stem}.nc"
+        try:
+            os.utime(path, (now, os.stat(path).st_mtime))
+        except OSError:
+            pass
+
+
+def _data_server_url():
+    """
+    Get the URL of the GMT data server set by ``GMT_DATA_SERVER``.
+
+    GMT is only asked once per process (for each value of the
+    ``GMT_DATA_SERVER`` environment variable).
+
+    Returns
+    -------
+    url : str
+        E.g., ``https://oceania.generic-mapping-tools.org``.
+    """
+    return _resolve_data_server(os.environ.get("GMT_DATA_SERVER"))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_data_server(server):
+    """
+    Get the URL of a GMT data server.
+
+    Parameters
+    ----------
+    server : str or None
+        The ``GMT_DATA_SERVER`` environment variable. If not set, the
+        ``GMT_DATA_SERVER`` GMT default is used.
+
+    Returns
+    -------
+    url : str
+    """
+    if not server:
+        with Session() as lib:
+            server = lib.get_default("GMT_DATA_SERVER")
+    if "://" not in server:  # a server name, e.g., "oceania"
+        server = f"https://{server}.generic-mapping-tools.org"
+    return server.rstrip("/")
+
+
+def _download_timeout(timeout=None):
+    """
+    Get the timeout of the tile downloads, in seconds.
+
+    Parameters
+    ----------
+    timeout : float or None
+        The timeout. Default is the ``PYGMT_DOWNLOAD_TIMEOUT`` environment
+        variable if set, or :data:`DOWNLOAD_TIMEOUT`.
+
+    Returns
+    -------
+    timeout : float
+    """
+    if timeout is None:
+        timeout = os.environ.get("PYGMT_DOWNLOAD_TIMEOUT") or DOWNLOAD_TIMEOUT
+    try:
+        timeout = float(timeout)
+    except ValueError as error:
+        raise GMTInvalidInput(f"Invalid download timeout '{timeout}'.") from error
+    if timeout <= 0:
+        raise GMTInvalidInput(f"Invalid download timeout '{timeout}'.")
+    return timeout
+
+
+def _tile_location(tile):
+    """
+    Get the directory of a tile relative to the server directory and its name.
+
+    Parameters
+    ----------
+    tile : str
+        The remote tile name (e.g., ``'@N00E000.earth_relief_05m_p.jp2'``).
+
+    Returns
+    -------
+    subdir, stem : str
+        E.g., ``'earth/earth_relief/earth_relief_05m_p'`` and
+        ``'N00E000.earth_relief_05m_p'``.
+    """
+    stem = _stem(tile.lstrip("@"))
+    dataset = stem.split(".", maxsplit=1)[1]
+    return f"earth/earth_relief/{dataset}", stem
+
+
+def _download_tile(tile, server, directory, timeout=DOWNLOAD_TIMEOUT):
+    """
+    Download a tile unless it is already available locally.
+
+    Parameters
+    ----------
+    tile : str
+        The remote tile name.
+    server : str
+        The URL of the data server.
+    directory : pathlib.Path
+        The GMT server directory.
+    timeout : float
+        Seconds to wait for the server before giving up.
+
+    Returns
+    -------
+    path : pathlib.Path or None
+        The local netCDF tile if it was already there, the downloaded JPEG2000
+        tile, or None if the tile isn't available on the server (or the
+        server timed out).
+    """
+    subdir, stem = _tile_location(tile)
+    tiledir = directory / subdir
+    ncfile = tiledir / f"{stem}.nc"
+    if ncfile.is_file() and ncfile.stat().st_size > 0:
+        return ncfile
+    jp2file = tiledir / f"{stem}.jp2"
+    tiledir.mkdir(parents=True, exist_ok=True)
+    # Download to a temporary name so that a partial download is never used
+    tmpfile = tiledir / f"{stem}.jp2.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with urllib.request.urlopen(
+            f"{server}/server/{subdir}/{stem}.jp2", timeout=timeout
+        ) as response, open(tmpfile, "wb") as output:
+            shutil.copyfileobj(response, output)
+        os.replace(tmpfile, jp2file)
+    except (OSError, ValueError):  # URLError and HTTPError are OSErrors
+        if tmpfile.exists():
+            tmpfile.unlink()
+        return None
+    return jp2file
+
+
+def _download_tiles(tiles, server, directory, max_workers, timeout=DOWNLOAD_TIMEOUT):
+    """
+    Download the tiles that aren't available locally yet, concurrently.
+
+    Parameters
+    ----------
+    tiles : list of str
+        The remote tile names.
+    server : str
+        The URL of the data server.
+    directory : pathlib.Path
+        The GMT server directory.
+    max_workers : int
+        The maximum number of concurrent downloads.
+    timeout : float
+        Seconds to wait for the server before giving up on a tile.
+
+    Returns
+    -------
+    paths : list of pathlib.Path
+        The local tiles, either netCDF tiles that were already there or the
+        downloaded JPEG2000 tiles. Tiles missing from the server are skipped.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths = executor.map(
+            functools.partial(
+                _download_tile, server=server, directory=directory, timeout=timeout
+            ),
+            tiles,
+        )
+        return [path for path in paths if path is not None]
+
+
+def _convert_tiles(paths):
+    """
+    Convert the downloaded JPEG2000 tiles to the netCDF tiles used by GMT.
+
+    GMT does the same conversion after downloading a tile itself. The
+    JPEG2000 tiles are removed afterwards, also if a conversion fails.
+
+    Parameters
+    ----------
+    paths : list of pathlib.Path
+        The local tiles. Those that are netCDF already are left alone.
+
+    Returns
+    -------
+    paths : list of pathlib.Path
+        The netCDF tiles.
+    """
+    ncfiles = []
+    try:
+        with Session() as lib:
+            for path in paths:
+                if path.suffix == ".jp2":
+                    ncfile = path.with_suffix(".nc")
+                    try:
+                        lib.call_module(
+                            "grdconvert",
+                            f"{path} -G{ncfile}=ns -Vq --IO_NC4_DEFLATION_LEVEL=9",
+                        )
+                    except GMTCLibError:
+                        # Don't leave a partial netCDF tile for GMT to use
+                        _remove_file(ncfile)
+                        raise
+                    path = ncfile
+                ncfiles.append(path)
+    finally:
+        # The JPEG2000 tiles are only needed for the conversion, also if it
+        # failed (GMT downloads the tiles it still needs again)
+        for path in paths:
+            if path.suffix == ".jp2":
+                _remove_file(path)
+    return ncfiles
+
+
+def _remove_file(path):
+    """
+    Remove a file, if it exists.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _prefetch_tiles(tiles, max_workers=8, server=None, directory=None, timeout=None):
+    """
+    Download (or validate) tiles concurrently and convert them for GMT.
+
+    Parameters
+    ----------
+    tiles : list of str
+        The remote tile names.
+    max_workers : int
+        The maximum number of concurrent downloads.
+    server : str or None
+        The URL of the data server. Default is the ``GMT_DATA_SERVER``.
+    directory : str or None
+        The GMT server directory. Default is ``$GMT_USERDIR/server``.
+    timeout : float or None
+        Seconds to wait for the server before giving up on a tile. Default is
+        the ``PYGMT_DOWNLOAD_TIMEOUT`` environment variable or
+        :data:`DOWNLOAD_TIMEOUT`.
+
+    Returns
+    -------
+    paths : list of str
+        The local netCDF tiles.
+    """
+    timeout = _download_timeout(timeout)
+    if server is None:
+        server = _data_server_url()
+    directory = Path(directory or server_dir())
+    paths = _download_tiles(
+        tiles, server.rstrip("/"), directory, max_workers, timeout=timeout
+    )
+    return [str(path) for path in _convert_tiles(paths)]
+
+
+def prefetch_earth_relief(
+    region,
+    resolution,
+    registration=None,
+    use_srtm=False,
+    max_workers=8,
+    server=None,
+    timeout=None,
+):
+    """
+    Download the Earth relief tiles of a region ahead of time.
+
+    The tiles that aren't available locally yet are downloaded concurrently
+    from the GMT data server and converted to the netCDF tiles that GMT
+    reads, like GMT does when it downloads them one after another. Tiles that
+    don't exist on the server (e.g., land-only SRTM tiles over the oceans)
+    are skipped. Unlike GMT, the downloads don't check the hash table of the
+    server: tiles already downloaded are used as they are. If converting the
+    tiles fails, the downloaded files are removed and GMT downloads the tiles
+    it needs itself. The cache budget (see :func:`set_cache_budget`) is
+    enforced afterwards.
+
+    Parameters
+    ----------
+    region : str or list
+        The region [*xmin*, *xmax*, *ymin*, *ymax*] in degrees.
+    resolution : str
+        One of the tiled resolutions (``'05m'`` to ``'01s'``).
+    registration : str or None
+        ``'pixel'`` or ``'gridline'``.
+    use_srtm : bool
+        Download the original land-only SRTM tiles.
+    max_workers : int
+        The maximum number of concurrent downloads.
+    server : str or None
+        The URL of the data server (``file://`` URLs work too). Default is
+        the server set by the ``GMT_DATA_SERVER`` GMT default.
+    timeout : float or None
+        Seconds to wait for the server (to connect or for the next bytes of a
+        tile) before giving up on a tile, which GMT then downloads itself when
+        needed. Default is the ``PYGMT_DOWNLOAD_TIMEOUT`` environment variable
+        if set, or 30 seconds.
+
+    Returns
+    -------
+    paths : list of str
+        The local paths of the tiles.
+    """
+    tiles = earth_relief_tiles(region, resolution, registration, use_srtm)
+    paths = _prefetch_tiles(
+        tiles, max_workers=max_workers, server=server, timeout=timeout
+    )
+    _touch_tiles(tiles)
+    evict_cached_files()
+    return paths
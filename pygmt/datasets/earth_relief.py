@@ -4,21 +4,43 @@ load as :class:`xarray.DataArray`.
 
 The grids are available in various resolutions.
 """
+import importlib.util
+import os
+import tempfile
+import weakref
+
 import xarray as xr
-from pygmt.exceptions import GMTInvalidInput
+from pygmt.clib.conversion import register_file_backed_grid
+from pygmt.datasets.cache import (
+    _prefetch_tiles,
+    _region_bounds,
+    _touch_tiles,
+    earth_relief_tiles,
+    evict_cached_files,
+)
+from pygmt.datasets.memo import earth_relief_memo
+from pygmt.exceptions import GMTCLibError, GMTInvalidInput
 from pygmt.helpers import kwargs_to_strings
 from pygmt.src import grdcut, which
 
 
 @kwargs_to_strings(region="sequence")
-def load_earth_relief(resolution="01d", region=None, registration=None, use_srtm=False):
+def load_earth_relief(
+    resolution="01d", region=None, registration=None, use_srtm=False, lazy=False
+):
     r"""
     Load Earth relief grids (topography and bathymetry) in various resolutions.
 
     The grids are downloaded to a user data directory
     (usually ``~/.gmt/server/earth/earth_relief/``) the first time you invoke
     this function. Afterwards, it will load the grid from the data directory.
-    So you'll need an internet connection the first time around.
+    So you'll need an internet connection the first time around. See
+    :func:`pygmt.datasets.set_cache_budget` to limit the disk space used by
+    the tiles of the high resolution grids. The missing tiles of a region are
+    downloaded concurrently first (see
+    :func:`pygmt.datasets.prefetch_earth_relief`), giving up on a tile if the
+    server doesn't answer within the ``PYGMT_DOWNLOAD_TIMEOUT`` environment
+    variable (30 seconds by default).
 
     These grids can also be accessed by passing in the file name
     **@earth_relief**\_\ *res*\[_\ *reg*] to any grid plotting/processing
@@ -57,6 +79,15 @@ def load_earth_relief(resolution="01d", region=None, registration=None, use_srtm
         arc-second (i.e., ``'15s'``). If True, will only load the original
         land-only SRTM tiles.
 
+    lazy : bool
+        If True, don't read the grid into memory. The returned grid is backed
+        by a netCDF file and only the parts that are accessed are read (in
+        chunks if :mod:`dask` is installed). If ``region`` is given, the
+        subregion is first cut to a temporary file, removed with the grid
+        and the arrays indexed from it.
+        Passed unchanged to a PyGMT function or method, the grid is given to
+        GMT as the file so that GMT only reads what it needs too.
+
     Returns
     -------
     grid : :class:`xarray.DataArray`
@@ -119,6 +150,14 @@ def load_earth_relief(resolution="01d", region=None, registration=None, use_srtm
             f"resolution '{resolution}' is not supported."
         )
 
+    # Serve repeated loads from the memo (if enabled) without calling GMT
+    memo = None if lazy else earth_relief_memo()
+    if memo is not None:
+        memo_key = (resolution, _region_key(region), registration, use_srtm)
+        grid = memo.get(memo_key)
+        if grid is not None:
+            return grid
+
     # Choose earth relief data prefix
     earth_relief_prefix = "earth_relief_"
     if use_srtm and resolution in land_only_srtm_resolutions:
@@ -133,11 +172,43 @@ def load_earth_relief(resolution="01d", region=None, registration=None, use_srtm
                 f"'region' is required for Earth relief resolution '{resolution}'."
             )
         fname = which(f"@earth_relief_{resolution}{reg}", download="a")
-        with xr.open_dataarray(fname, engine="netcdf4") as dataarray:
-            grid = dataarray.load()
-            _ = grid.gmt  # load GMTDataArray accessor information
+        if lazy:
+            grid = _open_lazy(fname)
+        else:
+            with xr.open_dataarray(fname, engine="netcdf4") as dataarray:
+                grid = dataarray.load()
+                _ = grid.gmt  # load GMTDataArray accessor information
     else:
-        grid = grdcut(f"@{earth_relief_prefix}{resolution}{reg}", region=region)
+        # Only regions given as 4 numbers have known tiles (GMT works out the
+        # others, e.g., "JP" or "-10/10/-5/5+r")
+        tiles = None
+        if resolution in tiled_resolutions and _region_bounds(region) is not None:
+            tiles = earth_relief_tiles(region, resolution, registration, use_srtm)
+            # Download the missing tiles concurrently so that GMT only has to
+            # assemble local tiles. GMT still downloads (one by one) any tile
+            # that failed here.
+            try:
+                _prefetch_tiles(tiles)
+            except GMTCLibError:
+                pass
+        if lazy:
+            fd, fname = tempfile.mkstemp(prefix="pygmt-", suffix=".nc")
+            os.close(fd)
+            grdcut(
+                f"@{earth_relief_prefix}{resolution}{reg}",
+                region=region,
+                outgrid=fname,
+            )
+            grid = _open_lazy(fname)
+            grid.encoding["pygmt_temporary_file"] = _TemporaryGridFile(fname)
+        else:
+            grid = grdcut(f"@{earth_relief_prefix}{resolution}{reg}", region=region)
+        if tiles is not None:
+            # Keep the local tiles within the budget (if any), starting with
+            # the least recently used ones. Without a budget, only the tiles
+            # of the region are touched and the cache isn't listed.
+            _touch_tiles(tiles)
+            evict_cached_files()
 
     # Add some metadata to the grid
     grid.name = "elevation"
@@ -148,7 +219,91 @@ def load_earth_relief(resolution="01d", region=None, registration=None, use_srtm
     # Remove the actual range because it gets outdated when indexing the grid,
     # which causes problems when exporting it to netCDF for usage on the
     # command-line.
-    grid.attrs.pop("actual_range")
+    grid.attrs.pop("actual_range", None)
     for coord in grid.coords:
-        grid[coord].attrs.pop("actual_range")
+        grid[coord].attrs.pop("actual_range", None)
+    if memo is not None:
+        memo.put(memo_key, grid)
+        # Return a read-only view, like the next calls will
+        cached = memo.get(memo_key)
+        if cached is not None:
+            grid = cached
+    return grid
+
+
+def _region_key(region):
+    """
+    Normalize a region string (as built by ``kwargs_to_strings``) so that
+    equivalent regions (e.g., ``[0, 1, 0, 1]`` and ``"0/1/0/1.0"``) share the
+    same memo entries.
+    """
+    if region is None:
+        return None
+    try:
+        return tuple(float(value) for value in region.split("/"))
+    except ValueError:
+        return region
+
+
+def _open_lazy(fname):
+    """
+    Open a grid file without reading the data into memory.
+
+    Uses dask (with the chunks of the netCDF file) if it is installed, or the
+    lazy indexing of xarray otherwise. Either way, only the parts of the grid
+    that are accessed are read.
+
+    Parameters
+    ----------
+    fname : str
+        The netCDF grid file.
+
+    Returns
+    -------
+    grid : xarray.DataArray
+        The grid, registered as backed by *fname*.
+    """
+    chunks = {} if importlib.util.find_spec("dask") else None
+    grid = xr.open_dataarray(fname, engine="netcdf4", chunks=chunks)
+    _ = grid.gmt  # load GMTDataArray accessor information
+    register_file_backed_grid(grid, fname)
     return grid
+
+
+class _TemporaryGridFile:
+    """
+    The temporary file of a lazy grid, removed once no array refers to it.
+
+    Kept in the ``encoding`` of the grid, which xarray passes on to the arrays
+    indexed from the grid (e.g., ``grid.sel(...)``) and ignores when writing
+    files. These arrays keep reading the file after the grid itself is gone.
+    Copies of the grid share the same object. Results that drop the encoding
+    (e.g., ``grid + 1``) are computed right away, unless the grid is backed by
+    dask. Compute these before the grid and the arrays indexed from it are
+    gone.
+
+    Parameters
+    ----------
+    fname : str
+        The temporary netCDF grid file.
+    """
+
+    def __init__(self, fname):
+        self.fname = fname
+        weakref.finalize(self, _remove_file, fname)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _remove_file(fname):
+    """
+    Remove a file, if it can be removed.
+    """
+    try:
+        os.remove(fname)
+    except OSError:
+        pass
@@ -0,0 +1,262 @@
+"""
+Opt-in memoization of the grids loaded by
+:func:`pygmt.datasets.load_earth_relief`.
+
+Two tiers: an in-memory LRU cache bounded by a byte budget, and a directory
+of already cut grids stored as uncompressed ``.npz`` files (fast to read,
+unlike netCDF) shared between processes.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+from pygmt.helpers.caching import cache_dir
+
+
+class GridMemo:
+    """
+    A two-tier (memory and disk) cache of grids.
+
+    The cached grids are read-only: they are returned as shallow copies
+    sharing the same data. Use :meth:`xarray.DataArray.copy` to get a grid
+    that can be modified.
+
+    Parameters
+    ----------
+    memory_budget : int
+        The maximum total size (in bytes) of the grids kept in memory. The
+        least recently used grids are dropped first.
+    directory : str or None
+        The directory of the disk tier. None disables the disk tier.
+    """
+
+    def __init__(self, memory_budget, directory=None):
+        self.memory_budget = memory_budget
+        self.directory = Path(directory) if directory is not None else None
+        self._grids = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _fname(self, key):
+        """
+        The file of the disk tier storing the grid of a key.
+        """
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.directory / f"{digest}.npz"
+
+    def get(self, key):
+        """
+        Get a cached grid.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the grid (any hashable with a stable ``repr``).
+
+        Returns
+        -------
+        grid : xarray.DataArray or None
+            None if the grid isn't cached.
+        """
+        with self._lock:
+            entry = self._grids.get(key)
+            if entry is not None:
+                self._grids.move_to_end(key)
+        if entry is None and self.directory is not None:
+            entry = _read_npz(self._fname(key))
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            return None
+        grid, registration, gtype = entry
+        grid = grid.copy(deep=False)
+        grid.gmt.registration = registration
+        grid.gmt.gtype = gtype
+        return grid
+
+    def put(self, key, grid):
+        """
+        Cache a grid.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the grid.
+        grid : xarray.DataArray
+            The grid, with the data in memory. The data isn't copied and
+            becomes read-only.
+        """
+        # The GMT metadata isn't kept by copies
+        registration, gtype = grid.gmt.registration, grid.gmt.gtype
+        grid = grid.copy(deep=False)
+        grid.values.flags.writeable = False
+        entry = (grid, registration, gtype)
+        self._remember(key, entry)
+        if self.directory is not None:
+            _write_npz(self._fname(key), entry)
+
+    def _remember(self, key, entry):
+        """
+        Add a grid to the memory tier, dropping the least recently used ones
+        to fit the budget.
+        """
+        nbytes = entry[0].nbytes
+        if nbytes > self.memory_budget:
+            return
+        with self._lock:
+            if key in self._grids:
+                self._nbytes -= self._grids.pop(key)[0].nbytes
+            self._grids[key] = entry
+            self._nbytes += nbytes
+            while self._nbytes > self.memory_budget:
+                _, (old, _, _) = self._grids.popitem(last=False)
+                self._nbytes -= old.nbytes
+
+    def clear(self, disk=False):
+        """
+        Empty the memory tier and, optionally, the disk tier.
+
+        Parameters
+        ----------
+        disk : bool
+            Also remove the files of the disk tier.
+        """
+        with self._lock:
+            self._grids.clear()
+            self._nbytes = 0
+        if disk and self.directory is not None:
+            for fname in self.directory.glob("*.npz"):
+                fname.unlink()
+
+
+def _read_npz(fname):
+    """
+    Read a grid stored by :func:`_write_npz`, or None if there isn't one.
+    """
+    try:
+        with np.load(fname) as npz:
+            data, x, y = npz["data"], npz["x"], npz["y"]
+            meta = json.loads(str(npz["meta"]))
+    except (OSError, KeyError, ValueError):
+        return None
+    data.flags.writeable = False
+    ydim, xdim = meta["dims"]
+    grid = xr.DataArray(
+        data,
+        coords={ydim: (ydim, y, meta["yattrs"]), xdim: (xdim, x, meta["xattrs"])},
+        dims=(ydim, xdim),
+        name=meta["name"],
+        attrs=meta["attrs"],
+    )
+    return grid, meta["registration"], meta["gtype"]
+
+
+def _write_npz(fname, entry):
+    """
+    Atomically store a 2d grid in an uncompressed .npz file.
+
+    Errors are ignored since the cache is only an optimization.
+    """
+    grid, registration, gtype = entry
+    ydim, xdim = grid.dims
+    meta = {
+        "dims": [ydim, xdim],
+        "name": grid.name,
+        "attrs": grid.attrs,
+        "xattrs": grid[xdim].attrs,
+        "yattrs": grid[ydim].attrs,
+        "registration": int(registration),
+        "gtype": int(gtype),
+    }
+    tmpname = fname.with_name(f"{fname.stem}.{os.getpid()}.tmp.npz")
+    try:
+        np.savez(
+            tmpname,
+            data=grid.values,
+            x=grid[xdim].values,
+            y=grid[ydim].values,
+            meta=np.array(json.dumps(meta, default=_to_json)),
+        )
+        os.replace(tmpname, fname)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+
+
+def _to_json(value):
+    """
+    Convert numpy scalars and arrays in the grid attributes to JSON types.
+
+    Raises a TypeError for other types, like :func:`json.dumps` does.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# The memo used by load_earth_relief (None if disabled)
+_EARTH_RELIEF_MEMO = {"memo": None}
+
+
+def enable_earth_relief_memo(memory_budget=512 * 2 ** 20, directory="default"):
+    """
+    Memoize the grids loaded by :func:`pygmt.datasets.load_earth_relief`.
+
+    Once enabled, loading the same grid again (same ``resolution``,
+    ``region``, ``registration`` and ``use_srtm``) returns a cached copy
+    without calling GMT. Grids loaded with ``lazy=True`` aren't cached.
+
+    The cached grids are read-only. Use :meth:`xarray.DataArray.copy` to
+    modify them.
+
+    Parameters
+    ----------
+    memory_budget : int
+        The maximum total size (in bytes) of the grids kept in memory
+        [Default is 512 MiB].
+    directory : str or None
+        The directory where the grids are also stored on disk. The default
+        is the ``earth_relief`` subdirectory of the ``PYGMT_CACHE_DIR``
+        directory if that environment variable is set. None disables the
+        disk tier.
+    """
+    if directory == "default":
+        directory = cache_dir("earth_relief")
+    _EARTH_RELIEF_MEMO["memo"] = GridMemo(memory_budget, directory=directory)
+
+
+def disable_earth_relief_memo(clear_disk=False):
+    """
+    Stop memoizing the grids loaded by
+    :func:`pygmt.datasets.load_earth_relief`.
+
+    Parameters
+    ----------
+    clear_disk : bool
+        Also remove the grids stored on disk.
+    """
+    memo = _EARTH_RELIEF_MEMO["memo"]
+    if memo is not None:
+        memo.clear(disk=clear_disk)
+    _EARTH_RELIEF_MEMO["memo"] = None
+
+
+def earth_relief_memo():
+    """
+    Get the memo of :func:`pygmt.datasets.load_earth_relief`.
+
+    Returns
+    -------
+    memo : :class:`GridMemo` or None
+        None if memoization isn't enabled.
+    """
+    return _EARTH_RELIEF_MEMO["memo"]
@@ -1,9 +1,160 @@
 """
 Functions to load sample data.
 """
+import json
+import os
+import zipfile
+
+import numpy as np
 import pandas as pd
 from pygmt.src import which
 
+# Bump to invalidate the parsed tables cached next to the sample files (e.g.,
+# when a reader changes)
+_SIDECAR_VERSION = 1
+
+
+def _load_sample(remote, reader):
+    """
+    Download (if needed) a sample file and load it with a reader, caching the
+    parsed table.
+
+    All sample loaders should go through this function. See
+    :func:`_cached_read`.
+
+    Parameters
+    ----------
+    remote : str
+        The name of the remote file (e.g., ``"@tut_ship.xyz"``).
+    reader : function
+        Parses the downloaded file (given its name) into a
+        :class:`pandas.DataFrame`.
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        The data table.
+    """
+    return _cached_read(which(remote, download="c"), reader)
+
+
+def _cached_read(fname, reader):
+    """
+    Read a table with a reader, through a binary sidecar file.
+
+    Parsing text tables is slow, so the columns of the parsed table are saved
+    next to the file (as numpy arrays in ``<fname>.pygmt.npz``) and read from
+    there as long as the size and modification time of the file (and the name
+    of the reader) are the same. The sidecar is loaded without pickle, so it
+    can't run code, text columns are stored as unicode arrays and
+    timezone-aware datetimes as UTC datetimes with the name of their timezone.
+    Tables with other column types (or indexes) aren't cached. The sidecar is
+    only an optimization: failing to write it (e.g., in a read-only
+    directory) is ignored.
+
+    Parameters
+    ----------
+    fname : str
+        The name of the file.
+    reader : function
+        Parses the file (given its name) into a :class:`pandas.DataFrame`.
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        The data table (a new copy on each call).
+    """
+    stat = os.stat(fname)
+    stamp = [_SIDECAR_VERSION, reader.__qualname__, stat.st_size, stat.st_mtime_ns]
+    sidecar = f"{fname}.pygmt.npz"
+    try:
+        with np.load(sidecar, allow_pickle=False) as cache:
+            if json.loads(str(cache["stamp"])) == stamp:
+                return _columns_to_frame(cache)
+    except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+        pass
+    data = reader(fname)
+    columns = _frame_to_columns(data)
+    if columns is None:
+        return data
+    tmpname = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmpname, "wb") as cache:
+            np.savez(cache, stamp=np.array(json.dumps(stamp)), **columns)
+        os.replace(tmpname, sidecar)
+    except OSError:
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+    return data
+
+
+def _frame_to_columns(data):
+    """
+    Convert a table to the arrays saved in a sidecar file.
+
+    Returns None if the table can't be saved without pickle (columns other
+    than numbers, datetimes or text, or an index that isn't the default).
+    """
+    if not data.index.equals(pd.RangeIndex(len(data))):
+        return None
+    try:
+        names = json.dumps(data.columns.tolist())
+    except TypeError:
+        return None
+    columns = {"names": np.array(names)}
+    for i, (_, column) in enumerate(data.items()):
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            timezone = str(column.dt.tz)
+            if _datetime_tz_dtype(timezone) != column.dtype:
+                return None
+            columns[f"values_{i}"] = column.dt.tz_convert(None).to_numpy()
+            columns[f"timezone_{i}"] = np.array(timezone)
+            continue
+        if column.dtype.kind in "biufcmM":
+            columns[f"values_{i}"] = column.to_numpy()
+            continue
+        if column.dtype != object:
+            return None
+        missing = column.isna().to_numpy()
+        if not all(isinstance(value, str) for value in column[~missing]):
+            return None
+        columns[f"values_{i}"] = column.fillna("").to_numpy(dtype=str)
+        columns[f"missing_{i}"] = missing
+    return columns
+
+
+def _datetime_tz_dtype(timezone):
+    """
+    Get the dtype of the datetimes in a timezone given by name.
+
+    Returns None if pandas doesn't know the name.
+    """
+    try:
+        return pd.DatetimeTZDtype(tz=timezone)
+    except (KeyError, ValueError):
+        return None
+
+
+def _columns_to_frame(cache):
+    """
+    Convert the arrays loaded from a sidecar file back to a table.
+    """
+    columns = {}
+    for i, name in enumerate(json.loads(str(cache["names"]))):
+        values = cache[f"values_{i}"]
+        if values.dtype.kind == "U":
+            values = values.astype(object)
+            values[cache[f"missing_{i}"]] = np.nan
+        if f"timezone_{i}" in cache:
+            timezone = str(cache[f"timezone_{i}"])
+            values = pd.Series(values).dt.tz_localize("UTC").dt.tz_convert(timezone)
+        columns[i] = values
+    data = pd.DataFrame(columns)
+    data.columns = json.loads(str(cache["names"]))
+    return data
+
 
 def load_japan_quakes():
     """
@@ -22,7 +173,13 @@ def load_japan_quakes():
         The data table. Columns are year, month, day, latitude, longitude,
         depth (in km), and magnitude of the earthquakes.
     """
-    fname = which("@tut_quakes.ngdc", download="c")
+    return _load_sample("@tut_quakes.ngdc", _read_japan_quakes)
+
+
+def _read_japan_quakes(fname):
+    """
+    Parse the ``@tut_quakes.ngdc`` file.
+    """
     data = pd.read_csv(fname, header=1, sep=r"\s+")
     data.columns = [
         "year",
@@ -52,7 +209,13 @@ def load_ocean_ridge_points():
     data : pandas.DataFrame
         The data table. Columns are longitude and latitude.
     """
-    fname = which("@ridge.txt", download="c")
+    return _load_sample("@ridge.txt", _read_ocean_ridge_points)
+
+
+def _read_ocean_ridge_points(fname):
+    """
+    Parse the ``@ridge.txt`` file.
+    """
     data = pd.read_csv(
         fname, sep=r"\s+", names=["longitude", "latitude"], skiprows=1, comment=">"
     )
@@ -75,7 +238,13 @@ def load_sample_bathymetry():
     data : pandas.DataFrame
         The data table. Columns are longitude, latitude, and bathymetry.
     """
-    fname = which("@tut_ship.xyz", download="c")
+    return _load_sample("@tut_ship.xyz", _read_sample_bathymetry)
+
+
+def _read_sample_bathymetry(fname):
+    """
+    Parse the ``@tut_ship.xyz`` file.
+    """
     data = pd.read_csv(
         fname, sep="\t", header=None, names=["longitude", "latitude", "bathymetry"]
     )
@@ -98,9 +267,7 @@ def load_usgs_quakes():
         The data table. Use ``print(data.describe())`` to see the available
         columns.
     """
-    fname = which("@usgs_quakes_22.txt", download="c")
-    data = pd.read_csv(fname)
-    return data
+    return _load_sample("@usgs_quakes_22.txt", pd.read_csv)
 
 
 def load_fractures_compilation():
@@ -120,6 +287,12 @@ def load_fractures_compilation():
         The data table. Use ``print(data.describe())`` to see the available
         columns.
     """
-    fname = which("@fractures_06.txt", download="c")
+    return _load_sample("@fractures_06.txt", _read_fractures_compilation)
+
+
+def _read_fractures_compilation(fname):
+    """
+    Parse the ``@fractures_06.txt`` file.
+    """
     data = pd.read_csv(fname, header=None, sep=r"\s+", names=["azimuth", "length"])
     return data[["length", "azimuth"]]
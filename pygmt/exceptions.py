@@ -46,6 +46,16 @@ class GMTVersionError(GMTError):
     """
 
 
+class GMTCopyWarning(ResourceWarning):
+    """
+    Warned when data has to be copied before being passed to GMT.
+
+    Like all resource warnings, it is ignored by default. Enable it with
+    ``warnings.simplefilter("always", GMTCopyWarning)`` (or ``python -W
+    always::ResourceWarning``) to find the copies.
+    """
+
+
 class GMTImageComparisonFailure(AssertionError):
     """
     Raised when a comparison between two images fails.
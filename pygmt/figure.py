@@ -2,7 +2,9 @@
 Define the Figure class that handles all plotting.
 """
 import base64
+import errno
 import os
+import shutil
 from tempfile import TemporaryDirectory
 
 try:
@@ -18,6 +20,7 @@ from pygmt.helpers import (
     fmt_docstring,
     kwargs_to_strings,
     launch_external_viewer,
+    shared_memory_dir,
     unique_name,
     use_alias,
 )
@@ -202,6 +205,11 @@ class Figure:
         This method implements a matplotlib-like interface for
         :meth:`pygmt.Figure.psconvert`.
 
+        The figure can also be written to a file-like object (e.g.,
+        :class:`io.BytesIO`), in the format given by the extension of its
+        ``name`` (if it has one) or as PNG. See :meth:`pygmt.Figure.to_bytes`.
+        KML isn't supported for file-like objects.
+
         Supported formats: PNG (``.png``), JPEG (``.jpg``), PDF (``.pdf``),
         BMP (``.bmp``), TIFF (``.tif``), EPS (``.eps``), and KML (``.kml``).
         The KML output generates a companion PNG file.
@@ -211,9 +219,10 @@ class Figure:
 
         Parameters
         ----------
-        fname : str
+        fname : str or file-like object
             The desired figure file name, including the extension. See the list
-            of supported formats and their extensions above.
+            of supported formats and their extensions above. Or a binary
+            file-like object with a ``write`` method.
         transparent : bool
             If True, will use a transparent background for the figure. Only
             valid for PNG format.
@@ -231,6 +240,22 @@ class Figure:
             Set raster resolution in dpi. Default is 720 for PDF, 300 for
             others.
         """
+        if hasattr(fname, "write"):
+            if show:
+                raise GMTInvalidInput("Can't show a figure saved to a file object.")
+            name = getattr(fname, "name", None)
+            ext = os.path.splitext(name)[1][1:] if isinstance(name, str) else ""
+            fname.write(
+                self.to_bytes(
+                    fmt=ext or "png",
+                    transparent=transparent,
+                    crop=crop,
+                    anti_alias=anti_alias,
+                    **kwargs,
+                )
+            )
+            return
+
         # All supported formats
         fmts = dict(png="g", pdf="f", jpg="j", bmp="b", eps="e", tif="t", kml="g")
 
@@ -255,6 +280,94 @@ class Figure:
         if show:
             launch_external_viewer(fname)
 
+    def to_bytes(self, fmt="png", dpi=None, **kwargs):
+        r"""
+        Render the figure to an image in memory.
+
+        Useful to serve figures (e.g., from a web application) without saving
+        them. GMT can only write images to files, so the image is rendered in
+        a temporary directory in shared memory (``/dev/shm``, if available)
+        and read back. If that directory can't be used (e.g., shared memory is
+        too small for the image), the default temporary directory is used
+        instead. Nothing is left on disk.
+
+        KML isn't supported because GMT writes it with a companion PNG file.
+
+        Parameters
+        ----------
+        fmt : str
+            The image format, as a file extension that
+            :meth:`pygmt.Figure.savefig` recognizes (e.g., ``"png"``,
+            ``"pdf"`` or ``"jpg"``).
+        dpi : int
+            The image resolution (dots per inch). Default is 720 for PDF, 300
+            for others.
+        kwargs : dict
+            Any other arguments that :meth:`pygmt.Figure.savefig` accepts (like
+            ``transparent``, ``crop`` or ``anti_alias``).
+
+        Returns
+        -------
+        image : bytes
+            The content of the image file.
+
+        Examples
+        --------
+
+        >>> fig = Figure()
+        >>> fig.basemap(region=[0, 10, 0, 10], projection="X5c", frame=True)
+        >>> fig.to_bytes(fmt="png", dpi=100)[:8]
+        b'\x89PNG\r\n\x1a\n'
+        """
+        if fmt == "kml":
+            raise GMTInvalidInput("Can't render KML (with a companion PNG) to bytes.")
+        if dpi is not None:
+            kwargs["dpi"] = dpi
+        tmpdir = shared_memory_dir()
+        if tmpdir is not None:
+            try:
+                return self._render_bytes(tmpdir, fmt, **kwargs)
+            except OSError:
+                # Shared memory can be small (e.g., 64 MB in Docker), too
+                # small for large images. Try again on disk.
+                pass
+        return self._render_bytes(None, fmt, **kwargs)
+
+    def _render_bytes(self, tmpdir, fmt, **kwargs):
+        """
+        Save the figure in a temporary directory and read the image back.
+
+        Parameters
+        ----------
+        tmpdir : str or None
+            The parent of the temporary directory (None for the default).
+        fmt : str
+            The image format.
+        kwargs : dict
+            The arguments for :meth:`pygmt.Figure.savefig`.
+
+        Returns
+        -------
+        image : bytes
+            The content of the image file.
+
+        Raises
+        ------
+        OSError
+            If the temporary directory can't be used, or if GMT fails to save
+            the figure because the directory is full.
+        """
+        with TemporaryDirectory(prefix=f"{self._name}-bytes-", dir=tmpdir) as tmpdir:
+            fname = os.path.join(tmpdir, f"{self._name}.{fmt}")
+            try:
+                self.savefig(fname, **kwargs)
+            except GMTError as error:
+                if shutil.disk_usage(tmpdir).free < 2 ** 20:
+                    raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC)) from error
+                raise
+            with open(fname, "rb") as image:
+                return image.read()
+
     def show(self, dpi=300, width=500, method=None):
         """
         Display a preview of the figure.
@@ -377,12 +490,10 @@ class Figure:
             If ``as_bytes=False``, this is the file name of the preview image
             file. Else, it is the file content loaded as a bytes string.
         """
+        if as_bytes:
+            return self.to_bytes(fmt=fmt, dpi=dpi, **kwargs)
         fname = os.path.join(self._preview_dir.name, f"{self._name}.{fmt}")
         self.savefig(fname, dpi=dpi, **kwargs)
-        if as_bytes:
-            with open(fname, "rb") as image:
-                preview = image.read()
-            return preview
         return fname
 
     def _repr_png_(self):
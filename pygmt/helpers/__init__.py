@@ -7,12 +7,14 @@ from pygmt.helpers.decorators import (
     kwargs_to_strings,
     use_alias,
 )
-from pygmt.helpers.tempfile import GMTTempFile, unique_name
+from pygmt.helpers.tempfile import GMTTempFile, shared_memory_dir, unique_name
 from pygmt.helpers.utils import (
+    TableChunks,
     args_in_kwargs,
     build_arg_string,
     data_kind,
     dummy_context,
     is_nonstr_iter,
+    iter_chunks,
     launch_external_viewer,
 )
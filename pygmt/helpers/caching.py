@@ -0,0 +1,85 @@
+"""
+Utilities for PyGMT's optional on-disk cache.
+"""
+import json
+import os
+from pathlib import Path
+
+
+def cache_dir(subdir=None):
+    """
+    Return the directory used by PyGMT to persist small caches on disk.
+
+    The on-disk cache is opt-in: it is only enabled if the ``PYGMT_CACHE_DIR``
+    environment variable is set. The directory (and the optional
+    subdirectory) is created if it doesn't exist yet.
+
+    Parameters
+    ----------
+    subdir : str or None
+        Name of a subdirectory inside the cache directory.
+
+    Returns
+    -------
+    path : pathlib.Path or None
+        The cache directory or ``None`` if the on-disk cache is disabled or the
+        directory can't be created.
+    """
+    base = os.environ.get("PYGMT_CACHE_DIR", "")
+    if not base:
+        return None
+    path = Path(base).expanduser()
+    if subdir is not None:
+        path = path / subdir
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+
+def read_json_cache(fname):
+    """
+    Read a JSON cache file, returning an empty dict if it is missing or broken.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        The cache file.
+
+    Returns
+    -------
+    content : dict
+    """
+    try:
+        with open(fname, encoding="utf-8") as cachefile:
+            content = json.load(cachefile)
+    except (OSError, ValueError):
+        return {}
+    return content if isinstance(content, dict) else {}
+
+
+def write_json_cache(fname, content):
+    """
+    Atomically write a dict to a JSON cache file.
+
+    Errors are silently ignored since the cache is only an optimization.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        The cache file.
+    content : dict
+        The JSON serializable content to write.
+    """
+    fname = Path(fname)
+    tmpname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmpname, "w", encoding="utf-8") as cachefile:
+            json.dump(content, cachefile)
+        os.replace(tmpname, fname)
+    except OSError:
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
@@ -32,10 +32,10 @@ COMMON_OPTIONS = {
         timestamp : bool or str
             Draw GMT time stamp logo on plot.""",
     "CPT": r"""
-        cmap : str
-           File name of a CPT file or a series of comma-separated colors
-           (e.g., *color1*,\ *color2*,\ *color3*) to build a linear continuous
-           CPT from those colors automatically.""",
+        cmap : str or :class:`pygmt.Palette`
+           File name of a CPT file, an in-memory palette or a series of
+           comma-separated colors (e.g., *color1*,\ *color2*,\ *color3*) to
+           build a linear continuous CPT from those colors automatically.""",
     "G": """\
         color : str or 1d array
             Select color or pattern for filling of symbols or polygons. Default
@@ -23,6 +23,24 @@ def unique_name():
     return uuid.uuid4().hex
 
 
+def shared_memory_dir():
+    """
+    Get a directory in shared memory (tmpfs) for short-lived temporary files.
+
+    Files written there never hit the disk.
+
+    Returns
+    -------
+    dirname : str or None
+        ``/dev/shm`` if it exists and is writable, otherwise None (i.e., use
+        the default temporary directory).
+    """
+    dirname = "/dev/shm"
+    if os.path.isdir(dirname) and os.access(dirname, os.W_OK):
+        return dirname
+    return None
+
+
 class GMTTempFile:
     """
     Context manager for creating closed temporary files.
@@ -23,6 +23,8 @@ def data_kind(data, x=None, y=None, z=None):
     * a file name provided as 'data'
     * an xarray.DataArray provided as 'data'
     * a matrix provided as 'data'
+    * chunks of a table (a stream, see :class:`pygmt.helpers.TableChunks`)
+      provided as 'data'
     * 1D arrays x and y (and z, optionally)
 
     Arguments should be ``None`` if not used. If doesn't fit any of these
@@ -30,8 +32,9 @@ def data_kind(data, x=None, y=None, z=None):
 
     Parameters
     ----------
-    data : str, xarray.DataArray, 2d array, or None
-       Data file name, xarray.DataArray or numpy array.
+    data : str, xarray.DataArray, 2d array, TableChunks or None
+       Data file name, xarray.DataArray, numpy array or the chunks of a table
+       (:class:`pygmt.helpers.TableChunks`).
     x/y : 1d arrays or None
         x and y columns as numpy arrays.
     z : 1d array or None
@@ -41,7 +44,8 @@ def data_kind(data, x=None, y=None, z=None):
     Returns
     -------
     kind : str
-        One of: ``'file'``, ``'grid'``, ``'matrix'``, ``'vectors'``.
+        One of: ``'file'``, ``'grid'``, ``'matrix'``, ``'stream'``,
+        ``'vectors'``.
 
     Examples
     --------
@@ -56,6 +60,8 @@ def data_kind(data, x=None, y=None, z=None):
     'file'
     >>> data_kind(data=xr.DataArray(np.random.rand(4, 3)))
     'grid'
+    >>> data_kind(data=TableChunks([np.zeros((5, 2)), np.ones((5, 2))]))
+    'stream'
     """
     if data is None and x is None and y is None:
         raise GMTInvalidInput("No input data provided.")
@@ -68,6 +74,8 @@ def data_kind(data, x=None, y=None, z=None):
         kind = "file"
     elif isinstance(data, xr.DataArray):
         kind = "grid"
+    elif isinstance(data, TableChunks):
+        kind = "stream"
     elif data is not None:
         kind = "matrix"
     else:
@@ -102,6 +110,74 @@ def dummy_context(arg):
     yield arg
 
 
+class TableChunks:
+    """
+    The chunks of a table, to be streamed to a GMT module.
+
+    Wrap an iterable over chunks of rows of a table (2d arrays,
+    :class:`pandas.DataFrame` or columnar tables) to pass it as the table of
+    the PyGMT functions that accept streams (e.g.,
+    :func:`pygmt.blockmean` or :func:`pygmt.surface`). Other iterators
+    (e.g., open files) aren't taken as streams. See also :func:`iter_chunks`.
+
+    Parameters
+    ----------
+    chunks : iterable
+        The chunks of the table, with the same number of columns. They are
+        only iterated over once.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> chunks = TableChunks(np.zeros((2, 3)) + i for i in range(3))
+    >>> [chunk.sum() for chunk in chunks]
+    [0.0, 6.0, 12.0]
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+
+def iter_chunks(array, rows=1_000_000):
+    """
+    Split a 2d array into blocks of rows.
+
+    Use it to stream a large (e.g., memory mapped) table to a GMT module
+    without loading all of it at once (e.g.,
+    ``pygmt.blockmean(table=iter_chunks(table), ...)``). The blocks are views
+    of the array.
+
+    Parameters
+    ----------
+    array : 2d array
+        The table, e.g., a :class:`numpy.memmap`.
+    rows : int
+        The number of rows in each block (except the last).
+
+    Returns
+    -------
+    chunks : :class:`pygmt.helpers.TableChunks`
+        The blocks of rows.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> [chunk.shape for chunk in iter_chunks(np.zeros((5, 3)), rows=2)]
+    [(2, 3), (2, 3), (1, 3)]
+    """
+    return TableChunks(
+        array[start : start + rows] for start in range(0, array.shape[0], rows)
+    )
+
+
 def build_arg_string(kwargs):
     """
     Transform keyword arguments into a GMT argument string.
@@ -0,0 +1,121 @@
+"""
+Define the Palette class that holds a color palette table (CPT) in memory.
+"""
+import os
+import tempfile
+import weakref
+
+from pygmt.helpers import shared_memory_dir
+
+
+class Palette:
+    """
+    A GMT color palette table (CPT) held in memory.
+
+    Palettes are created by :func:`pygmt.makecpt` and :func:`pygmt.grd2cpt`
+    with ``palette=True``. They can be passed as ``cmap`` to any method that
+    accepts a CPT (e.g., :meth:`pygmt.Figure.grdimage`,
+    :meth:`pygmt.Figure.plot`, :meth:`pygmt.Figure.colorbar` or
+    :meth:`pygmt.Figure.grdview`). Unlike the current CPT of the session, a
+    palette isn't replaced by the next call to :func:`pygmt.makecpt` and can
+    be built once and reused for any number of figures.
+
+    The palette is kept as the text of the CPT, and the CPT still goes through
+    files: :func:`pygmt.makecpt` and :func:`pygmt.grd2cpt` write it to a
+    temporary file to read it back, and the palette is written to a private
+    temporary file (in shared memory if available) the first time it is used.
+    This file is reused until the palette is garbage collected. GMT can also
+    pass CPTs in memory (as ``GMT_IS_PALETTE`` virtual files), but these are
+    GMT structures owned by the session that created them, while each PyGMT
+    function or method call uses a new session, and PyGMT has no bindings to
+    read these structures back into Python.
+
+    Parameters
+    ----------
+    cpt : str
+        The content of the CPT file.
+
+    Examples
+    --------
+
+    >>> palette = Palette("0 black 1 white\\n")
+    >>> print(palette.cpt)
+    0 black 1 white
+    <BLANKLINE>
+    >>> os.path.exists(palette.fname)
+    True
+    >>> str(palette) == palette.fname
+    True
+    """
+
+    def __init__(self, cpt):
+        self.cpt = cpt
+        self._fname = None
+
+    @classmethod
+    def read(cls, fname):
+        """
+        Read a palette from a CPT file.
+
+        Parameters
+        ----------
+        fname : str
+            The CPT file name.
+
+        Returns
+        -------
+        palette : :class:`pygmt.Palette`
+        """
+        with open(fname) as cptfile:
+            return cls(cptfile.read())
+
+    @property
+    def fname(self):
+        """
+        The name of the temporary CPT file holding the palette.
+
+        The file is written on first access and removed when the palette is
+        garbage collected.
+        """
+        if self._fname is None:
+            fd, fname = tempfile.mkstemp(
+                prefix="pygmt-", suffix=".cpt", dir=shared_memory_dir()
+            )
+            with os.fdopen(fd, "w") as cptfile:
+                cptfile.write(self.cpt)
+            weakref.finalize(self, _remove, fname)
+            self._fname = fname
+        return self._fname
+
+    def save(self, fname):
+        """
+        Save the palette to a CPT file.
+
+        Parameters
+        ----------
+        fname : str
+            The CPT file name.
+        """
+        with open(fname, "w") as cptfile:
+            cptfile.write(self.cpt)
+
+    def __fspath__(self):
+        return self.fname
+
+    def __str__(self):
+        # Used when building the GMT arguments (e.g., -C<fname>)
+        return self.fname
+
+    def __repr__(self):
+        nlines = len(self.cpt.splitlines())
+        return f"<pygmt.Palette with {nlines} lines>"
+
+
+def _remove(fname):
+    """
+    Remove the temporary file of a palette, if it still exists.
+    """
+    try:
+        os.remove(fname)
+    except OSError:
+        pass
@@ -1,7 +1,14 @@
 """
 Modern mode session management modules.
 """
+import atexit
+from contextlib import contextmanager
+
 from pygmt.clib import Session
+from pygmt.clib.session import get_ambient_session, set_ambient_session
+
+# State of the global modern mode session
+_MODERN_MODE = {"active": False}
 
 
 def begin():
@@ -17,6 +24,7 @@ def begin():
         lib.call_module("begin", prefix)
         # pygmt relies on GMT modern mode with GMT_COMPATIBILITY at version 6
         lib.call_module("set", "GMT_COMPATIBILITY 6")
+    _MODERN_MODE["active"] = True
 
 
 def end():
@@ -30,3 +38,65 @@ def end():
     """
     with Session() as lib:
         lib.call_module("end", "")
+    _MODERN_MODE["active"] = False
+
+
+def begin_global_session():
+    """
+    Start the global modern mode session used by PyGMT.
+
+    Called by :class:`pygmt.clib.Session` right before the first GMT API
+    session of the process is created, so that importing PyGMT doesn't create
+    a session. Registers :func:`pygmt.end` to run when Python shuts down.
+    """
+    begin()
+    atexit.register(_end_global_session)
+
+
+def _end_global_session():
+    """
+    Terminate the global modern mode session if it's still active.
+    """
+    if _MODERN_MODE["active"]:
+        end()
+
+
+@contextmanager
+def session():
+    """
+    Reuse a single GMT API session for all PyGMT calls inside a block.
+
+    By default, every PyGMT function and :class:`pygmt.Figure` method creates
+    and destroys its own GMT API session. Inside this context manager, they
+    all share one long-lived session (per thread) instead, so the session
+    setup cost is only paid once. Use it around pipelines that make many
+    calls in a row.
+
+    Nested blocks reuse the outermost session.
+
+    Yields
+    ------
+    lib : :class:`pygmt.clib.Session`
+        The shared session.
+
+    Examples
+    --------
+
+    >>> import pygmt
+    >>> from pygmt.clib import Session
+    >>> with pygmt.session() as shared:
+    ...     with Session() as lib:
+    ...         print(lib.session_pointer == shared.session_pointer)
+    ...
+    True
+    """
+    ambient = get_ambient_session()
+    if ambient is not None:
+        yield ambient
+        return
+    with Session() as lib:
+        set_ambient_session(lib)
+        try:
+            yield lib
+        finally:
+            set_ambient_session(None)
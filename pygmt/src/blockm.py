@@ -1,15 +1,15 @@
 """
 blockm - Block average (x,y,z) data tables by mean or median estimation.
 """
-import pandas as pd
+import numpy as np
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import (
-    GMTTempFile,
     build_arg_string,
     data_kind,
     dummy_context,
     fmt_docstring,
+    iter_chunks,
     kwargs_to_strings,
     use_alias,
 )
@@ -42,32 +42,36 @@ def _blockm(block_method, table, outfile, **kwargs):
     """
 
     kind = data_kind(table)
-    with GMTTempFile(suffix=".csv") as tmpfile:
-        with Session() as lib:
-            if kind == "matrix":
-                if not hasattr(table, "values"):
-                    raise GMTInvalidInput(f"Unrecognized data type: {type(table)}")
-                file_context = lib.virtualfile_from_matrix(table.values)
-            elif kind == "file":
-                if outfile is None:
-                    raise GMTInvalidInput("Please pass in a str to 'outfile'")
-                file_context = dummy_context(table)
-            else:
+    with Session() as lib:
+        if kind == "matrix" and isinstance(table, np.memmap):
+            # Read memory mapped arrays in chunks of rows
+            file_context = lib.virtualfile_from_stream(iter_chunks(table))
+        elif kind == "matrix" and isinstance(table, np.ndarray):
+            file_context = lib.virtualfile_from_matrix(table)
+        elif kind == "matrix":
+            if not hasattr(table, "values"):
                 raise GMTInvalidInput(f"Unrecognized data type: {type(table)}")
-
-            with file_context as infile:
-                if outfile is None:
-                    outfile = tmpfile.name
-                arg_str = " ".join([infile, build_arg_string(kwargs), "->" + outfile])
+            file_context = lib.virtualfile_from_matrix(table.values)
+        elif kind == "stream":
+            file_context = lib.virtualfile_from_stream(table)
+        elif kind == "file":
+            if outfile is None:
+                raise GMTInvalidInput("Please pass in a str to 'outfile'")
+            file_context = dummy_context(table)
+        else:
+            raise GMTInvalidInput(f"Unrecognized data type: {type(table)}")
+
+        with file_context as infile:
+            # Output to an in-memory table if outfile is not set
+            with lib.virtualfile_out(kind="dataset", fname=outfile) as outtable:
+                arg_str = " ".join([infile, build_arg_string(kwargs), "->" + outtable])
                 lib.call_module(module=block_method, args=arg_str)
-
-        # Read temporary csv output to a pandas table
-        if outfile == tmpfile.name:  # if user did not set outfile, return pd.DataFrame
-            result = pd.read_csv(tmpfile.name, sep="\t", names=table.columns)
-        elif outfile != tmpfile.name:  # return None if outfile set, output in outfile
-            result = None
-
-    return result
+                # Return a pd.DataFrame, or None if outfile is set
+                return lib.virtualfile_to_dataset(
+                    vfname=outtable,
+                    outfile=outfile,
+                    column_names=getattr(table, "columns", None),
+                )
 
 
 @fmt_docstring
@@ -95,10 +99,14 @@ def blockmean(table, outfile=None, **kwargs):
 
     Parameters
     ----------
-    table : pandas.DataFrame or str
-        Either a pandas dataframe with (x, y, z) or (longitude, latitude,
-        elevation) values in the first three columns, or a file name to an
-        ASCII data table.
+    table : pandas.DataFrame, 2d array, str or TableChunks
+        Either a pandas dataframe or a 2d numpy array (a
+        :class:`numpy.memmap` is read in chunks of rows) with (x, y, z) or
+        (longitude, latitude, elevation) values in the first three columns, or
+        a file name to an ASCII data table. Tables too large for memory can
+        also be streamed in chunks of rows, wrapped in
+        :class:`pygmt.helpers.TableChunks` (e.g., from
+        :func:`pygmt.helpers.iter_chunks`).
 
     spacing : str
         *xinc*\[\ *unit*\][**+e**\|\ **n**]
@@ -156,10 +164,14 @@ def blockmedian(table, outfile=None, **kwargs):
 
     Parameters
     ----------
-    table : pandas.DataFrame or str
-        Either a pandas dataframe with (x, y, z) or (longitude, latitude,
-        elevation) values in the first three columns, or a file name to an
-        ASCII data table.
+    table : pandas.DataFrame, 2d array, str or TableChunks
+        Either a pandas dataframe or a 2d numpy array (a
+        :class:`numpy.memmap` is read in chunks of rows) with (x, y, z) or
+        (longitude, latitude, elevation) values in the first three columns, or
+        a file name to an ASCII data table. Tables too large for memory can
+        also be streamed in chunks of rows, wrapped in
+        :class:`pygmt.helpers.TableChunks` (e.g., from
+        :func:`pygmt.helpers.iter_chunks`).
 
     spacing : str
         *xinc*\[\ *unit*\][**+e**\|\ **n**]
@@ -4,7 +4,15 @@ grd2cpt - Create a CPT from a grid file.
 
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
-from pygmt.helpers import build_arg_string, fmt_docstring, kwargs_to_strings, use_alias
+from pygmt.helpers import (
+    GMTTempFile,
+    build_arg_string,
+    dummy_context,
+    fmt_docstring,
+    kwargs_to_strings,
+    use_alias,
+)
+from pygmt.palette import Palette
 
 
 @fmt_docstring
@@ -29,13 +37,14 @@ from pygmt.helpers import build_arg_string, fmt_docstring, kwargs_to_strings, us
     Z="continuous",
 )
 @kwargs_to_strings(G="sequence", L="sequence", R="sequence", T="sequence")
-def grd2cpt(grid, **kwargs):
+def grd2cpt(grid, palette=False, **kwargs):
     r"""
     Make GMT color palette tables from a grid file.
 
     This is a module that will help you make static color palette tables
     (CPTs). By default, the CPT will simply be saved to the current session,
-    but you can use ``output`` to save it to a file. The CPT is based on an
+    but you can use ``output`` to save it to a file or ``palette`` to get it
+    as an in-memory :class:`pygmt.Palette`. The CPT is based on an
     existing dynamic master CPT of your choice, and the mapping from data value
     to colors is through the data's cumulative distribution function (CDF), so
     that the colors are histogram equalized. Thus if the grid(s) and the
@@ -126,6 +135,10 @@ def grd2cpt(grid, **kwargs):
         Optional parameter to set the file name with extension .cpt to store
         the generated CPT file. If not given or False (default), saves the CPT
         as the session current CPT.
+    palette : bool
+        If True, return the CPT as a :class:`pygmt.Palette` instead of saving
+        it as the session current CPT. Can't be used together with
+        ``output``.
     reverse : str
         Set this to True or c [Default] to reverse the sense of color
         progression in the master CPT. Set this to z to reverse the sign of
@@ -159,12 +172,23 @@ def grd2cpt(grid, **kwargs):
         range. Note that ``cyclic=True`` cannot be set together with
         ``categorical=True``.
     {V}
+
+    Returns
+    -------
+    palette : :class:`pygmt.Palette` or None
+        The CPT if ``palette=True``, otherwise None.
     """
     if "W" in kwargs and "Ww" in kwargs:
         raise GMTInvalidInput("Set only categorical or cyclic to True, not both.")
+    if palette and "H" in kwargs:
+        raise GMTInvalidInput("Set only one of palette or output, not both.")
     with Session() as lib:
         file_context = lib.virtualfile_from_data(check_kind="raster", data=grid)
-        with file_context as infile:
+        with file_context as infile, (
+            GMTTempFile(suffix=".cpt") if palette else dummy_context(None)
+        ) as tmpfile:
+            if palette:  # write the CPT to a temporary file to read it back
+                kwargs["H"] = tmpfile.name
             if "H" not in kwargs.keys():  # if no output is set
                 arg_str = " ".join([infile, build_arg_string(kwargs)])
             elif "H" in kwargs.keys():  # if output is set
@@ -175,3 +199,6 @@ def grd2cpt(grid, **kwargs):
                     [infile, build_arg_string(kwargs), f"-H > {outfile}"]
                 )
             lib.call_module("grd2cpt", arg_str)
+            if palette:
+                return Palette(tmpfile.read(keep_tabs=True))
+    return None
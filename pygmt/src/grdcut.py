@@ -2,15 +2,8 @@
 grdcut - Extract subregion from a grid.
 """
 
-import xarray as xr
 from pygmt.clib import Session
-from pygmt.helpers import (
-    GMTTempFile,
-    build_arg_string,
-    fmt_docstring,
-    kwargs_to_strings,
-    use_alias,
-)
+from pygmt.helpers import build_arg_string, fmt_docstring, kwargs_to_strings, use_alias
 
 
 @fmt_docstring
@@ -25,7 +18,7 @@ from pygmt.helpers import (
     f="coltypes",
 )
 @kwargs_to_strings(R="sequence")
-def grdcut(grid, **kwargs):
+def grdcut(grid, output_dtype=None, **kwargs):
     r"""
     Extract subregion from a grid.
 
@@ -78,6 +71,10 @@ def grdcut(grid, **kwargs):
 
     {V}
     {f}
+    output_dtype : str or numpy.dtype or None
+        The data type of the returned grid (e.g., ``"float32"``). Default is
+        the data type of the grids of GMT (usually float32).
+        Ignored if ``outgrid`` is set.
 
     Returns
     -------
@@ -88,21 +85,16 @@ def grdcut(grid, **kwargs):
         - None if ``outgrid`` is set (grid output will be stored in file set by
           ``outgrid``)
     """
-    with GMTTempFile(suffix=".nc") as tmpfile:
-        with Session() as lib:
-            file_context = lib.virtualfile_from_data(check_kind="raster", data=grid)
-            with file_context as infile:
-                if "G" not in kwargs.keys():  # if outgrid is unset, output to tempfile
-                    kwargs.update({"G": tmpfile.name})
-                outgrid = kwargs["G"]
+    with Session() as lib:
+        file_context = lib.virtualfile_from_data(check_kind="raster", data=grid)
+        outgrid = kwargs.get("G")
+        with file_context as infile:
+            # Output to an in-memory grid if outgrid is unset
+            with lib.virtualfile_out(kind="grid", fname=outgrid) as outfile:
+                kwargs["G"] = outfile
                 arg_str = " ".join([infile, build_arg_string(kwargs)])
                 lib.call_module("grdcut", arg_str)
-
-        if outgrid == tmpfile.name:  # if user did not set outgrid, return DataArray
-            with xr.open_dataarray(outgrid) as dataarray:
-                result = dataarray.load()
-                _ = result.gmt  # load GMTDataArray accessor information
-        else:
-            result = None  # if user sets an outgrid, return None
-
-        return result
+                # Return a DataArray if outgrid is unset, otherwise None
+                return lib.virtualfile_to_grid(
+                    vfname=outfile, outgrid=outgrid, dtype=output_dtype
+                )
@@ -1,16 +1,9 @@
 """
 grdtrack - Sample grids at specified (x,y) locations.
 """
-import pandas as pd
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
-from pygmt.helpers import (
-    GMTTempFile,
-    build_arg_string,
-    data_kind,
-    fmt_docstring,
-    use_alias,
-)
+from pygmt.helpers import build_arg_string, data_kind, fmt_docstring, use_alias
 
 
 @fmt_docstring
@@ -69,33 +62,28 @@ def grdtrack(points, grid, newcolname=None, outfile=None, **kwargs):
     if data_kind(points) == "matrix" and newcolname is None:
         raise GMTInvalidInput("Please pass in a str to 'newcolname'")
 
-    with GMTTempFile(suffix=".csv") as tmpfile:
-        with Session() as lib:
-            # Choose how data will be passed into the module
-            table_context = lib.virtualfile_from_data(check_kind="vector", data=points)
-            # Store the xarray.DataArray grid in virtualfile
-            grid_context = lib.virtualfile_from_data(check_kind="raster", data=grid)
-
-            # Run grdtrack on the temporary (csv) points table
-            # and (netcdf) grid virtualfile
-            with table_context as csvfile:
-                with grid_context as grdfile:
+    try:
+        column_names = points.columns.to_list() + [newcolname]
+    except AttributeError:  # 'str' object has no attribute 'columns'
+        column_names = None
+
+    with Session() as lib:
+        # Choose how data will be passed into the module
+        table_context = lib.virtualfile_from_data(check_kind="vector", data=points)
+        # Store the xarray.DataArray grid in virtualfile
+        grid_context = lib.virtualfile_from_data(check_kind="raster", data=grid)
+
+        # Run grdtrack on the points table and grid virtualfiles, and output
+        # to an in-memory table if outfile is not set
+        with table_context as csvfile:
+            with grid_context as grdfile:
+                with lib.virtualfile_out(kind="dataset", fname=outfile) as outtable:
                     kwargs.update({"G": grdfile})
-                    if outfile is None:  # Output to tmpfile if outfile is not set
-                        outfile = tmpfile.name
                     arg_str = " ".join(
-                        [csvfile, build_arg_string(kwargs), "->" + outfile]
+                        [csvfile, build_arg_string(kwargs), "->" + outtable]
                     )
                     lib.call_module(module="grdtrack", args=arg_str)
-
-        # Read temporary csv output to a pandas table
-        if outfile == tmpfile.name:  # if user did not set outfile, return pd.DataFrame
-            try:
-                column_names = points.columns.to_list() + [newcolname]
-                result = pd.read_csv(tmpfile.name, sep="\t", names=column_names)
-            except AttributeError:  # 'str' object has no attribute 'columns'
-                result = pd.read_csv(tmpfile.name, sep="\t", header=None, comment=">")
-        elif outfile != tmpfile.name:  # return None if outfile set, output in outfile
-            result = None
-
-    return result
+                    # Return a pd.DataFrame, or None if outfile is set
+                    return lib.virtualfile_to_dataset(
+                        vfname=outtable, outfile=outfile, column_names=column_names
+                    )
@@ -61,8 +61,8 @@ def grdview(self, grid, **kwargs):
     zscale/zsize : float or str
         Set z-axis scaling or z-axis size.
     {B}
-    cmap : str
-        The name of the color palette table to use.
+    cmap : str or :class:`pygmt.Palette`
+        The name of the color palette table to use, or an in-memory palette.
     drapegrid : str or xarray.DataArray
         The file name or a DataArray of the image grid to be draped on top
         of the relief provided by grid. [Default determines colors from
@@ -3,7 +3,15 @@ makecpt - Make GMT color palette tables.
 """
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
-from pygmt.helpers import build_arg_string, fmt_docstring, kwargs_to_strings, use_alias
+from pygmt.helpers import (
+    GMTTempFile,
+    build_arg_string,
+    dummy_context,
+    fmt_docstring,
+    kwargs_to_strings,
+    use_alias,
+)
+from pygmt.palette import Palette
 
 
 @fmt_docstring
@@ -25,13 +33,14 @@ from pygmt.helpers import build_arg_string, fmt_docstring, kwargs_to_strings, us
     Z="continuous",
 )
 @kwargs_to_strings(T="sequence", G="sequence")
-def makecpt(**kwargs):
+def makecpt(palette=False, **kwargs):
     r"""
     Make GMT color palette tables.
 
     This is a module that will help you make static color palette tables
     (CPTs). By default, the CPT will simply be saved to the current session,
-    but you can use ``output`` to save it to a file. You define an equidistant
+    but you can use ``output`` to save it to a file or ``palette`` to get it
+    as an in-memory :class:`pygmt.Palette`. You define an equidistant
     set of contour intervals or pass your own z-table or list, and create a new
     CPT based on an existing master (dynamic) CPT. The resulting CPT can be
     reversed relative to the master cpt, and can be made continuous or
@@ -112,6 +121,10 @@ def makecpt(**kwargs):
         Optional. The file name with extension .cpt to store the generated CPT
         file. If not given or False (default), saves the CPT as the session
         current CPT.
+    palette : bool
+        If True, return the CPT as a :class:`pygmt.Palette` instead of saving
+        it as the session current CPT. Can't be used together with
+        ``output``.
     reverse : str
         Set this to True or **c**\ [Default] to reverse the sense of color
         progression in the master CPT. Set this to z to reverse the sign of
@@ -145,15 +158,28 @@ def makecpt(**kwargs):
         Produce a wrapped (cyclic) color table that endlessly repeats its
         range. Note that ``cyclic=True`` cannot be set together with
         ``categorical=True``.
+
+    Returns
+    -------
+    palette : :class:`pygmt.Palette` or None
+        The CPT if ``palette=True``, otherwise None.
     """
+    if palette and "H" in kwargs:
+        raise GMTInvalidInput("Set only one of palette or output, not both.")
     with Session() as lib:
         if "W" in kwargs and "Ww" in kwargs:
             raise GMTInvalidInput("Set only categorical or cyclic to True, not both.")
-        if "H" not in kwargs.keys():  # if no output is set
-            arg_str = build_arg_string(kwargs)
-        elif "H" in kwargs.keys():  # if output is set
-            outfile = kwargs.pop("H")
-            if not outfile or not isinstance(outfile, str):
-                raise GMTInvalidInput("'output' should be a proper file name.")
-            arg_str = " ".join([build_arg_string(kwargs), f"-H > {outfile}"])
-        lib.call_module(module="makecpt", args=arg_str)
+        with GMTTempFile(suffix=".cpt") if palette else dummy_context(None) as tmpfile:
+            if palette:  # write the CPT to a temporary file to read it back
+                kwargs["H"] = tmpfile.name
+            if "H" not in kwargs.keys():  # if no output is set
+                arg_str = build_arg_string(kwargs)
+            elif "H" in kwargs.keys():  # if output is set
+                outfile = kwargs.pop("H")
+                if not outfile or not isinstance(outfile, str):
+                    raise GMTInvalidInput("'output' should be a proper file name.")
+                arg_str = " ".join([build_arg_string(kwargs), f"-H > {outfile}"])
+            lib.call_module(module="makecpt", args=arg_str)
+            if palette:
+                return Palette(tmpfile.read(keep_tabs=True))
+    return None
@@ -2,11 +2,9 @@
 surface - Grids table data using adjustable tension continuous curvature
 splines.
 """
-import xarray as xr
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import (
-    GMTTempFile,
     build_arg_string,
     data_kind,
     dummy_context,
@@ -27,7 +25,7 @@ from pygmt.helpers import (
     r="registration",
 )
 @kwargs_to_strings(R="sequence")
-def surface(x=None, y=None, z=None, data=None, **kwargs):
+def surface(x=None, y=None, z=None, data=None, output_dtype=None, **kwargs):
     r"""
     Grids table data using adjustable tension continuous curvature splines.
 
@@ -51,8 +49,11 @@ def surface(x=None, y=None, z=None, data=None, **kwargs):
     ----------
     x/y/z : 1d arrays
         Arrays of x and y coordinates and values z of the data points.
-    data : str or 2d array
+    data : str, 2d array or TableChunks
         Either a data file name or a 2d numpy array with the tabular data.
+        Tables too large for memory can be streamed in chunks of rows, wrapped
+        in :class:`pygmt.helpers.TableChunks` (e.g., from
+        :func:`pygmt.helpers.iter_chunks`).
 
     spacing : str
         *xinc*\[\ *unit*\][**+e**\|\ **n**]\
@@ -72,6 +73,11 @@ def surface(x=None, y=None, z=None, data=None, **kwargs):
     {f}
     {r}
 
+    output_dtype : str or numpy.dtype or None
+        The data type of the returned grid (e.g., ``"float32"``). Default is
+        the data type of the grids of GMT (usually float32).
+        Ignored if ``outfile`` is set.
+
     Returns
     -------
     ret: xarray.DataArray or None
@@ -85,28 +91,25 @@ def surface(x=None, y=None, z=None, data=None, **kwargs):
     if kind == "vectors" and z is None:
         raise GMTInvalidInput("Must provide z with x and y.")
 
-    with GMTTempFile(suffix=".nc") as tmpfile:
-        with Session() as lib:
-            if kind == "file":
-                file_context = dummy_context(data)
-            elif kind == "matrix":
-                file_context = lib.virtualfile_from_matrix(data)
-            elif kind == "vectors":
-                file_context = lib.virtualfile_from_vectors(x, y, z)
-            else:
-                raise GMTInvalidInput("Unrecognized data type: {}".format(type(data)))
-            with file_context as infile:
-                if "G" not in kwargs.keys():  # if outfile is unset, output to tmpfile
-                    kwargs.update({"G": tmpfile.name})
-                outfile = kwargs["G"]
+    with Session() as lib:
+        if kind == "file":
+            file_context = dummy_context(data)
+        elif kind == "matrix":
+            file_context = lib.virtualfile_from_matrix(data)
+        elif kind == "stream":
+            file_context = lib.virtualfile_from_stream(data)
+        elif kind == "vectors":
+            file_context = lib.virtualfile_from_vectors(x, y, z)
+        else:
+            raise GMTInvalidInput("Unrecognized data type: {}".format(type(data)))
+        outfile = kwargs.get("G")
+        with file_context as infile:
+            # Output to an in-memory grid if outfile is unset
+            with lib.virtualfile_out(kind="grid", fname=outfile) as outgrid:
+                kwargs["G"] = outgrid
                 arg_str = " ".join([infile, build_arg_string(kwargs)])
                 lib.call_module(module="surface", args=arg_str)
-
-        if outfile == tmpfile.name:  # if user did not set outfile, return DataArray
-            with xr.open_dataarray(outfile) as dataarray:
-                result = dataarray.load()
-                _ = result.gmt  # load GMTDataArray accessor information
-        elif outfile != tmpfile.name:  # if user sets an outfile, return None
-            result = None
-
-    return result
+                # Return a DataArray if outfile is unset, otherwise None
+                return lib.virtualfile_to_grid(
+                    vfname=outgrid, outgrid=outfile, dtype=output_dtype
+                )
@@ -1,8 +1,81 @@
 """
 which - Find the full path to specified files.
 """
+import os
+
 from pygmt.clib import Session
-from pygmt.helpers import GMTTempFile, build_arg_string, fmt_docstring, use_alias
+from pygmt.helpers import (
+    GMTTempFile,
+    build_arg_string,
+    fmt_docstring,
+    is_nonstr_iter,
+    use_alias,
+)
+
+# Paths already resolved in this process, keyed by the file name, the
+# download option and where GMT looks for files (see _cache_key)
+_WHICH_CACHE = {}
+
+# Environment variables with the directories searched by GMT
+_SEARCH_DIRS = ("GMT_USERDIR", "GMT_DATADIR", "GMT_CACHEDIR")
+
+
+def clear_which_cache():
+    """
+    Forget all the file paths resolved by :func:`pygmt.which` so far.
+    """
+    _WHICH_CACHE.clear()
+
+
+def _cache_key(fname, download):
+    """
+    The key of a resolved path in the cache.
+
+    Relative names (and downloads to the current directory) depend on the
+    current directory and the directories searched by GMT, so these are part
+    of the key.
+
+    Parameters
+    ----------
+    fname : str
+        The file name given to :func:`pygmt.which`.
+    download : bool or str or None
+        The download option given to :func:`pygmt.which`.
+
+    Returns
+    -------
+    key : tuple
+    """
+    return (
+        fname,
+        download,
+        os.getcwd(),
+        tuple(os.environ.get(name) for name in _SEARCH_DIRS),
+    )
+
+
+def _cached_path(fname, download):
+    """
+    Get a previously resolved path, if the file is still there.
+
+    Parameters
+    ----------
+    fname : str
+        The file name given to :func:`pygmt.which`.
+    download : bool or str or None
+        The download option given to :func:`pygmt.which`.
+
+    Returns
+    -------
+    path : str or None
+        None if the file hasn't been resolved yet or has been removed since.
+    """
+    key = _cache_key(fname, download)
+    path = _WHICH_CACHE.get(key)
+    if path is not None and not os.path.exists(path):
+        del _WHICH_CACHE[key]
+        path = None
+    return path
 
 
 @fmt_docstring
@@ -21,14 +94,20 @@ def which(fname, **kwargs):
     to set the desired behavior. If *download* is not used (or False), the file
     will not be found.
 
+    Resolved absolute paths are cached for the rest of the Python session
+    (while the files exist, and for the same current directory and GMT
+    directories), so asking for the same file again doesn't call GMT. Pass a
+    list of file names to resolve (and download) all of them in a single call
+    to GMT.
+
     Full option list at :gmt-docs:`gmtwhich.html`
 
     {aliases}
 
     Parameters
     ----------
-    fname : str
-        The file name that you want to check.
+    fname : str or list
+        The file name that you want to check, or a list of file names.
     download : bool or str
         If the file is downloadable and not found, we will try to download the
         it. Use True or 'l' (default) to download to the current directory. Use
@@ -38,19 +117,49 @@ def which(fname, **kwargs):
 
     Returns
     -------
-    path : str
-        The path of the file, depending on the options used.
+    path : str or list
+        The path of the file, depending on the options used. A list of paths
+        (in the same order) if *fname* is a list.
 
     Raises
     ------
     FileNotFoundError
-        If the file is not found.
-    """
-    with GMTTempFile() as tmpfile:
-        arg_str = " ".join([fname, build_arg_string(kwargs), "->" + tmpfile.name])
-        with Session() as lib:
-            lib.call_module("which", arg_str)
-        path = tmpfile.read().strip()
-    if not path:
-        raise FileNotFoundError("File '{}' not found.".format(fname))
-    return path
+        If the file (or any of the files) is not found.
+
+    Examples
+    --------
+
+    >>> paths = which(["@tut_quakes.ngdc", "@tut_ship.xyz"], download="c")
+    >>> [os.path.basename(path) for path in paths]
+    ['tut_quakes.ngdc', 'tut_ship.xyz']
+    """
+    fnames = list(fname) if is_nonstr_iter(fname) else [fname]
+    download = kwargs.get("G")
+    paths = {name: _cached_path(name, download) for name in fnames}
+    missing = [name for name, path in paths.items() if path is None]
+    if missing:
+        with GMTTempFile() as tmpfile:
+            arg_str = " ".join(
+                [*missing, build_arg_string(kwargs), "->" + tmpfile.name]
+            )
+            with Session() as lib:
+                lib.call_module("which", arg_str)
+            output = tmpfile.read().strip()
+        # GMT prints one line per file found
+        found = output.splitlines() if len(missing) > 1 else [output]
+        if len(found) != len(missing):
+            # GMT doesn't report the files it can't find, so the paths can't
+            # be matched to the names anymore
+            raise FileNotFoundError(
+                "File(s) '{}' not found.".format("', '".join(missing))
+            )
+        for name, path in zip(missing, found):
+            path = path.strip()
+            if not path:
+                raise FileNotFoundError("File '{}' not found.".format(name))
+            if os.path.isabs(path):
+                _WHICH_CACHE[_cache_key(name, download)] = path
+            paths[name] = path
+    if is_nonstr_iter(fname):
+        return [paths[name] for name in fnames]
+    return paths[fname]
@@ -2,26 +2,29 @@
 x2sys_cross - Calculate crossovers between track data files.
 """
 import contextlib
+import functools
 import os
+import tempfile
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from pygmt.clib import Session
+from pygmt.clib.conversion import relative_time_to_datetime
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import (
-    GMTTempFile,
     build_arg_string,
     data_kind,
-    dummy_context,
     fmt_docstring,
     kwargs_to_strings,
+    shared_memory_dir,
     unique_name,
     use_alias,
 )
 
 
 @contextlib.contextmanager
-def tempfile_from_dftrack(track, suffix):
+def tempfile_from_dftrack(track, suffix, directory=None):
     """
     Saves pandas.DataFrame track table to a temporary tab-separated ASCII text
     file with a unique name (to prevent clashes when running x2sys_cross),
@@ -34,6 +37,9 @@ def tempfile_from_dftrack(track, suffix):
         and (optionally) time (t).
     suffix : str
         File extension, e.g. xyz, tsv, etc.
+    directory : str or None
+        The directory to write the file to. Default is the current working
+        directory.
 
     Yields
     ------
@@ -41,17 +47,110 @@ def tempfile_from_dftrack(track, suffix):
         A temporary tab-separated value file with a unique name holding the
         track data. E.g. 'track-1a2b3c4.tsv'.
     """
+    tmpfilename = f"track-{unique_name()[:7]}.{suffix}"
+    if directory is not None:
+        tmpfilename = os.path.join(directory, tmpfilename)
     try:
-        tmpfilename = f"track-{unique_name()[:7]}.{suffix}"
-        track.to_csv(
-            path_or_buf=tmpfilename,
-            sep="\t",
-            index=False,
-            date_format="%Y-%m-%dT%H:%M:%S.%fZ",
-        )
+        _format_datetimes(track).to_csv(path_or_buf=tmpfilename, sep="\t", index=False)
         yield tmpfilename
     finally:
-        os.remove(tmpfilename)
+        if os.path.exists(tmpfilename):
+            os.remove(tmpfilename)
+
+
+def _format_datetimes(track):
+    """
+    Format the datetime columns of a track as ISO 8601 strings in UTC.
+
+    Vectorized replacement of the (slow, row by row) ``date_format`` of
+    :meth:`pandas.DataFrame.to_csv`. Timezone-aware times are converted to
+    UTC. Missing times become empty strings. Other columns (including pandas
+    extension types) are left for :meth:`pandas.DataFrame.to_csv`.
+
+    Parameters
+    ----------
+    track : pandas.DataFrame
+        The track table.
+
+    Returns
+    -------
+    track : pandas.DataFrame
+        The table with the datetime columns replaced by strings (the input
+        table if it has no datetime columns).
+    """
+    columns = {}
+    for name, column in track.items():
+        if pd.api.types.is_datetime64_any_dtype(column):
+            if getattr(column.dtype, "tz", None) is not None:
+                column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+            times = column.to_numpy(dtype="datetime64[us]")
+            strings = np.char.add(np.datetime_as_string(times, unit="us"), "Z")
+            strings[np.isnat(times)] = ""
+            columns[name] = strings
+    if not columns:
+        return track
+    return track.assign(**columns)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_tag_suffix(tagfile, mtime_ns):  # pylint: disable=unused-argument
+    """
+    Read the file extension of the track files from an x2sys .tag file.
+
+    Cached for each version of the file (the modification time is part of the
+    cache key).
+
+    Parameters
+    ----------
+    tagfile : str
+        Path to the $X2SYS_HOME/TAGNAME/TAGNAME.tag file.
+    mtime_ns : int
+        The modification time of the file.
+
+    Returns
+    -------
+    suffix : str or None
+        The suffix (-E) or, if not set, the format (-D) of the tag.
+    """
+    lastline = (
+        Path(tagfile).read_text().strip().split("\n")[-1]
+    )  # e.g. "-Dxyz -Etsv -I1/1"
+    suffix = None
+    for item in sorted(lastline.split()):  # sort list alphabetically
+        if item.startswith(("-E", "-D")):  # prefer -Etsv over -Dxyz
+            suffix = item[2:]  # e.g. tsv (1st choice) or xyz (2nd choice)
+    return suffix
+
+
+def _tag_suffix(tag):
+    """
+    Get the file extension of the track files of an x2sys tag.
+
+    Parameters
+    ----------
+    tag : str
+        The x2sys TAG.
+
+    Returns
+    -------
+    suffix : str or None
+    """
+    tagfile = Path(os.environ["X2SYS_HOME"], tag, f"{tag}.tag")
+    return _read_tag_suffix(str(tagfile), tagfile.stat().st_mtime_ns)
+
+
+def _private_tmpdir():
+    """
+    Create a private temporary directory for the track files.
+
+    Uses the shared memory file system (/dev/shm) if available so that the
+    files are never written to disk.
+
+    Returns
+    -------
+    tmpdir : tempfile.TemporaryDirectory
+    """
+    return tempfile.TemporaryDirectory(prefix="pygmt-x2sys-", dir=shared_memory_dir())
 
 
 @fmt_docstring
@@ -191,50 +290,51 @@ def x2sys_cross(tracks=None, outfile=None, **kwargs):
           ``outfile``)
     """
     with Session() as lib:
-        file_contexts = []
-        for track in tracks:
-            kind = data_kind(track)
-            if kind == "file":
-                file_contexts.append(dummy_context(track))
-            elif kind == "matrix":
-                # find suffix (-E) of trackfiles used (e.g. xyz, csv, etc) from
-                # $X2SYS_HOME/TAGNAME/TAGNAME.tag file
-                lastline = (
-                    Path(os.environ["X2SYS_HOME"], kwargs["T"], f"{kwargs['T']}.tag")
-                    .read_text()
-                    .strip()
-                    .split("\n")[-1]
-                )  # e.g. "-Dxyz -Etsv -I1/1"
-                for item in sorted(lastline.split()):  # sort list alphabetically
-                    if item.startswith(("-E", "-D")):  # prefer -Etsv over -Dxyz
-                        suffix = item[2:]  # e.g. tsv (1st choice) or xyz (2nd choice)
-
-                # Save pandas.DataFrame track data to temporary file
-                file_contexts.append(tempfile_from_dftrack(track=track, suffix=suffix))
-            else:
-                raise GMTInvalidInput(f"Unrecognized data type: {type(track)}")
-
-        with GMTTempFile(suffix=".txt") as tmpfile:
-            with contextlib.ExitStack() as stack:
-                fnames = [stack.enter_context(c) for c in file_contexts]
-                if outfile is None:
-                    outfile = tmpfile.name
-                arg_str = " ".join([*fnames, build_arg_string(kwargs), "->" + outfile])
+        with contextlib.ExitStack() as stack:
+            fnames = []
+            tmpdir = None
+            for track in tracks:
+                kind = data_kind(track)
+                if kind == "file":
+                    fnames.append(track)
+                elif kind == "matrix":
+                    # Save pandas.DataFrame track data to a temporary file in a
+                    # private directory (not the working directory, which may
+                    # be shared), with the suffix (-E) of the track files
+                    # (e.g. xyz, csv, etc) given in the TAG.
+                    if tmpdir is None:
+                        tmpdir = stack.enter_context(_private_tmpdir())
+                    fnames.append(
+                        stack.enter_context(
+                            tempfile_from_dftrack(
+                                track=track,
+                                suffix=_tag_suffix(kwargs["T"]),
+                                directory=tmpdir,
+                            )
+                        )
+                    )
+                else:
+                    raise GMTInvalidInput(f"Unrecognized data type: {type(track)}")
+
+            # Output to an in-memory table if outfile isn't set
+            with lib.virtualfile_out(kind="dataset", fname=outfile) as outtable:
+                arg_str = " ".join([*fnames, build_arg_string(kwargs), "->" + outtable])
                 lib.call_module(module="x2sys_cross", args=arg_str)
-
-            # Read temporary csv output to a pandas table
-            if outfile == tmpfile.name:  # if outfile isn't set, return pd.DataFrame
-                # Read the tab-separated ASCII table
-                table = pd.read_csv(
-                    tmpfile.name,
-                    sep="\t",
-                    header=2,  # Column names are on 2nd row
-                    comment=">",  # Skip the 3rd row with a ">"
-                    parse_dates=[2, 3],  # Datetimes on 3rd and 4th column
+                # Column names are on the 3rd header line (e.g. "x y t_1 t_2")
+                table = lib.virtualfile_to_dataset(
+                    vfname=outtable, outfile=outfile, header=2
                 )
-                # Remove the "# " from "# x" in the first column
-                table = table.rename(columns={table.columns[0]: table.columns[0][2:]})
-            elif outfile != tmpfile.name:  # if outfile is set, output in outfile only
-                table = None
+        if table is None:  # if outfile is set, output in outfile only
+            return None
+
+        # The 3rd and 4th columns are absolute times (t_1/t_2), stored
+        # relative to TIME_EPOCH in units of TIME_UNIT, or dummy times
+        # (i_1/i_2) which are kept as numbers
+        time_columns = [col for col in table.columns[2:4] if col.startswith("t_")]
+        if time_columns:
+            epoch = lib.get_default("TIME_EPOCH")
+            unit = lib.get_default("TIME_UNIT")
+            for col in time_columns:
+                table[col] = relative_time_to_datetime(table[col], epoch, unit)
 
     return table
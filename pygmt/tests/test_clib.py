@@ -3,6 +3,7 @@
 Test the wrappers for the C API.
 """
 import os
+import warnings
 from contextlib import contextmanager
 
 import numpy as np
@@ -13,10 +14,12 @@ import xarray as xr
 from packaging.version import Version
 from pygmt import Figure, clib
 from pygmt.clib.conversion import dataarray_to_matrix
+from pygmt.clib.prototypes import PROTOTYPES
 from pygmt.clib.session import FAMILIES, VIAS
 from pygmt.exceptions import (
     GMTCLibError,
     GMTCLibNoSessionError,
+    GMTCopyWarning,
     GMTInvalidInput,
     GMTVersionError,
 )
@@ -80,6 +83,31 @@ def test_getitem():
         ses["A_WHOLE_LOT_OF_JUNK"]  # pylint: disable=pointless-statement
 
 
+def test_get_libgmt_func_prototypes():
+    """
+    Make sure the prototypes of the API functions are bound at load time.
+    """
+    ses = clib.Session()
+    for name, (argtypes, restype) in PROTOTYPES.items():
+        function = ses.get_libgmt_func(name)
+        assert function.argtypes == tuple(argtypes)
+        assert function.restype is restype
+
+
+def test_getitem_uses_enum_table():
+    """
+    Make sure known constants are read from the table without calling libgmt.
+    """
+    ses = clib.Session()
+    value = ses["GMT_IS_DATASET"]
+    with mock(ses, "GMT_Get_Enum", returns=-99999):
+        assert ses["GMT_IS_DATASET"] == value
+        for name in ["GMT_IS_GRID", "GMT_VIA_MATRIX", "GMT_MODULE_CMD"]:
+            assert ses[name] != -99999
+        with pytest.raises(GMTCLibError):
+            ses["A_WHOLE_LOT_OF_JUNK"]  # pylint: disable=pointless-statement
+
+
 def test_create_destroy_session():
     """
     Test that create and destroy session are called without errors.
@@ -134,6 +162,35 @@ def test_destroy_session_fails():
     ses.destroy()
 
 
+def test_destroy_session_kept_alive_by_views():
+    """
+    Destroy the session only after the last array viewing its memory is gone,
+    on the next session creation (not from the garbage collector).
+    """
+    ses = clib.Session()
+    ses.create("test-session")
+    calls = []
+    c_destroy_session = ses.get_libgmt_func("GMT_Destroy_Session")
+
+    def mock_destroy_session(session_pointer):
+        """
+        Record the call and destroy the session.
+        """
+        calls.append(session_pointer)
+        return c_destroy_session(session_pointer)
+
+    keeper = ses._memory_keeper()  # pylint: disable=protected-access
+    with mock(ses, "GMT_Destroy_Session", mock_func=mock_destroy_session):
+        ses.destroy()
+    with pytest.raises(GMTCLibNoSessionError):
+        ses.session_pointer  # pylint: disable=pointless-statement
+    assert not calls
+    del keeper
+    assert not calls
+    with clib.Session():
+        assert len(calls) == 1
+
+
 def test_call_module():
     """
     Run a command to see if call_module works.
@@ -473,6 +530,23 @@ def test_virtualfile_from_vectors_two_string_or_object_columns(dtype):
         assert output == expected
 
 
+def test_virtualfile_from_vectors_long_and_unicode_strings():
+    """
+    Test that joined string columns aren't truncated to the length of the
+    first row and that non-ASCII strings are passed as UTF-8.
+    """
+    x = np.arange(3)
+    strings1 = np.array(["a", "long label", "étiquette"])
+    strings2 = np.array([1, 2000, 3])
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, x, strings1, strings2) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", f"{vfile} ->{outfile.name}")
+                output = outfile.read(keep_tabs=True)
+    expected = "".join(f"{i}\t{i}\t{j} {k}\n" for i, j, k in zip(x, strings1, strings2))
+    assert output == expected
+
+
 def test_virtualfile_from_vectors_transpose():
     """
     Test transforming matrix columns to virtual file dataset.
@@ -717,6 +791,29 @@ def test_dataarray_to_matrix_negative_x_and_y_increment():
     npt.assert_allclose(actual=inc, desired=[abs(x[1] - x[0]), abs(y[1] - y[0])])
 
 
+def test_dataarray_to_matrix_north_to_south_no_copy():
+    """
+    Check that grids going from North to South are passed without copies and
+    that copies of other grids are reported.
+    """
+    data = np.arange(12.0).reshape(3, 4)
+    x = np.linspace(start=0, stop=3, num=4)
+    y = np.linspace(start=9, stop=5, num=3)
+    grid = xr.DataArray(data, coords=[("y", y), ("x", x)])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", GMTCopyWarning)
+        matrix, _, _ = dataarray_to_matrix(grid)
+    assert np.shares_memory(matrix, data)
+    npt.assert_allclose(actual=matrix, desired=data)
+
+    grid = grid.sortby("y")
+    with pytest.warns(GMTCopyWarning):
+        matrix, _, _ = dataarray_to_matrix(grid)
+    assert not np.shares_memory(matrix, grid.values)
+    assert matrix.flags.c_contiguous
+    npt.assert_allclose(actual=matrix, desired=data)
+
+
 def test_dataarray_to_matrix_dims_fails():
     """
     Check that it fails for > 2 dims.
@@ -0,0 +1,120 @@
+"""
+Test passing columnar tables (Arrow, polars, numpy structured arrays) to GMT.
+"""
+import numpy as np
+import numpy.testing as npt
+import pytest
+from pygmt import clib
+from pygmt.clib.conversion import structured_to_matrix, table_to_columns
+from pygmt.helpers import GMTTempFile
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+def info(data):
+    """
+    Run info on a table passed with virtualfile_from_data.
+    """
+    with clib.Session() as lib:
+        with lib.virtualfile_from_data(check_kind="vector", data=data) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("info", f"{vfile} -C ->{outfile.name}")
+                return outfile.read().split()
+
+
+def test_structured_array_columns():
+    """
+    The columns of a structured array are views of its fields.
+    """
+    data = np.zeros(5, dtype=[("x", "f8"), ("n", "i4"), ("z", "f4")])
+    data["x"] = np.arange(5)
+    columns = table_to_columns(data)
+    assert [column.dtype for column in columns] == ["f8", "i4", "f4"]
+    assert all(np.shares_memory(column, data) for column in columns)
+    npt.assert_allclose(columns[0], np.arange(5))
+
+
+def test_structured_array_matrix():
+    """
+    Structured arrays with packed fields of one type are viewed as a matrix.
+    """
+    data = np.rec.fromarrays([np.arange(4.0), np.arange(4.0) * 2], names="x,y")
+    matrix = structured_to_matrix(data)
+    assert matrix.shape == (4, 2)
+    assert np.shares_memory(matrix, data)
+    npt.assert_allclose(matrix[:, 1], [0, 2, 4, 6])
+    # A subset of the fields isn't packed
+    subset = np.zeros(3, dtype=[("x", "f8"), ("y", "f8"), ("z", "f8")])[["x", "z"]]
+    assert structured_to_matrix(subset) is None
+    assert len(table_to_columns(subset)) == 2
+
+
+def test_table_to_columns_other_types():
+    """
+    Anything that isn't a columnar table is left alone.
+    """
+    for data in (np.zeros((3, 2)), [[1, 2], [3, 4]], "table.txt", None):
+        assert table_to_columns(data) is None
+        assert structured_to_matrix(data) is None
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_arrow_table_columns():
+    """
+    Columns without nulls are zero-copy, nulls become NaN.
+    """
+    x = np.arange(6, dtype="float64")
+    table = pa.table(
+        {
+            "x": pa.chunked_array([x]),
+            "n": pa.array([1, None, 3, 4, 5, 6], type=pa.int32()),
+            "z": pa.chunked_array([x[:3], x[3:]]),
+        }
+    )
+    column_x, column_n, column_z = table_to_columns(table)
+    assert column_x.ctypes.data == table["x"].chunk(0).buffers()[1].address
+    assert column_n.dtype.kind == "f"
+    npt.assert_allclose(column_n, [1, np.nan, 3, 4, 5, 6])
+    npt.assert_allclose(column_z, x)
+
+
+@pytest.mark.skipif(pl is None, reason="requires polars")
+def test_polars_dataframe_columns():
+    """
+    Polars columns are passed through Arrow, nulls become NaN.
+    """
+    frame = pl.DataFrame({"x": [1.0, 2.0, 3.0], "y": [4, None, 6]})
+    column_x, column_y = table_to_columns(frame)
+    npt.assert_allclose(column_x, [1, 2, 3])
+    npt.assert_allclose(column_y, [4, np.nan, 6])
+
+
+def test_virtualfile_from_structured_array():
+    """
+    GMT gets the same table from a structured array as from a matrix.
+    """
+    matrix = np.arange(12.0).reshape((4, 3))
+    mixed = np.zeros(4, dtype=[("x", "f8"), ("y", "i4"), ("z", "f4")])
+    for i, name in enumerate(mixed.dtype.names):
+        mixed[name] = matrix[:, i]
+    packed = np.rec.fromarrays(matrix.T, names="x,y,z")
+    assert info(mixed) == info(matrix)
+    assert info(packed) == info(matrix)
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_virtualfile_from_arrow_table():
+    """
+    GMT gets the same table from an Arrow table as from a matrix.
+    """
+    matrix = np.arange(12.0).reshape((4, 3))
+    table = pa.table({name: matrix[:, i] for i, name in enumerate("xyz")})
+    assert info(table) == info(matrix)
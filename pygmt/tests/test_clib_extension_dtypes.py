@@ -0,0 +1,130 @@
+"""
+Test passing pandas extension types (nullable, categorical and Arrow strings)
+to GMT.
+"""
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+from pygmt import clib
+from pygmt.clib.conversion import (
+    categorical_to_codes,
+    strings_to_ctypes_array,
+    vectors_to_arrays,
+)
+from pygmt.helpers import GMTTempFile
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+@pytest.mark.parametrize("dtype", ["Int64", "UInt16", "Float32", "boolean"])
+def test_vectors_to_arrays_nullable(dtype):
+    """
+    Nullable vectors become float64 with NaN for the missing values.
+    """
+    vector = pd.Series([1, None, 0], dtype=dtype)
+    (array,) = vectors_to_arrays([vector])
+    assert array.dtype == np.float64
+    npt.assert_allclose(array, [1, np.nan, 0])
+
+
+def test_vectors_to_arrays_nullable_without_missing():
+    """
+    Nullable integers without missing values keep their type.
+    """
+    (array,) = vectors_to_arrays([pd.Series([1, 2, 3], dtype="Int32")])
+    assert array.dtype == np.int32
+    assert array.flags.c_contiguous
+
+
+def test_vectors_to_arrays_categorical():
+    """
+    Numeric categories become their values and text categories are kept.
+    """
+    numbers = pd.Series([10, 20, None, 10], dtype="category")
+    words = pd.Series(["b", "a", None, "b"], dtype="category")
+    numbers_array, words_array = vectors_to_arrays([numbers, words])
+    npt.assert_allclose(numbers_array, [10, 20, np.nan, 10])
+    assert isinstance(words_array, pd.Categorical)
+    codes, labels = categorical_to_codes(words_array)
+    npt.assert_allclose(codes, [1, 0, np.nan, 1])
+    assert labels.tolist() == ["a", "b"]
+
+
+def test_strings_to_ctypes_array_strided():
+    """
+    Strings that aren't contiguous in memory (slices with a step or columns of
+    a 2d array) are copied into the block.
+    """
+    strings = np.array([b"a", b"bc", b"def", b"g"])[::2]
+    pointers, block = strings_to_ctypes_array(strings)
+    assert pointers[:] == [b"a", b"def"]
+    assert block.shape == (2, 4)
+    table = np.array([["a", "x"], ["bc", "y"], ["def", "z"]], dtype="S")
+    pointers, _ = strings_to_ctypes_array(table[:, 0])
+    assert pointers[:] == [b"a", b"bc", b"def"]
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_strings_to_ctypes_array_arrow():
+    """
+    Arrow strings (also slices and several chunks) are read from the Arrow
+    buffers, with missing strings empty.
+    """
+    strings = pd.Series(["a", None, "héllo", "", "xyz"], dtype="string[pyarrow]")
+    (array,) = vectors_to_arrays([strings])
+    pointers, _ = strings_to_ctypes_array(array)
+    assert pointers[:] == [b"a", b"", "héllo".encode(), b"", b"xyz"]
+    pointers, _ = strings_to_ctypes_array(strings.iloc[2:])
+    assert pointers[:] == ["héllo".encode(), b"", b"xyz"]
+    chunked = pd.arrays.ArrowStringArray(pa.chunked_array([["a", "b"], ["cc"]]))
+    pointers, _ = strings_to_ctypes_array(chunked)
+    assert pointers[:] == [b"a", b"b", b"cc"]
+
+
+def test_virtualfile_from_vectors_nullable():
+    """
+    GMT gets NaN for the missing values of nullable vectors.
+    """
+    x = pd.Series([1, 2, None, 4], dtype="Int64")
+    y = pd.Series([5, 6, 7, 8], dtype="Int32")
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, y) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", f"{vfile} ->{outfile.name}")
+                output = outfile.read(keep_tabs=True)
+    assert output == "1\t5\n2\t6\nNaN\t7\n4\t8\n"
+
+
+@pytest.mark.skipif(pa is None, reason="requires pyarrow")
+def test_virtualfile_from_vectors_arrow_strings():
+    """
+    GMT gets the strings of an Arrow string column.
+    """
+    x = np.arange(3, dtype=np.int32)
+    strings = pd.Series(["a", "bc", "déf"], dtype="string[pyarrow]")
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, x, strings) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", f"{vfile} ->{outfile.name}")
+                output = outfile.read(keep_tabs=True)
+    assert output == "0\t0\ta\n1\t1\tbc\n2\t2\tdéf\n"
+
+
+def test_virtualfile_from_vectors_categorical():
+    """
+    GMT gets the codes of text categories in numeric columns and their labels
+    in the trailing text column.
+    """
+    x = np.arange(3, dtype=np.int32)
+    kinds = pd.Series(["b", "a", "b"], dtype="category")
+    labels = pd.Series(["one", "two", "one"], dtype="category")
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, kinds, labels) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", f"{vfile} ->{outfile.name}")
+                output = outfile.read(keep_tabs=True)
+    assert output == "0\t1\tone\n1\t0\ttwo\n2\t1\tone\n"
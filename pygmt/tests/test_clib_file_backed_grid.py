@@ -0,0 +1,72 @@
+"""
+Test passing unchanged, lazily loaded grids to GMT as files.
+"""
+import numpy as np
+import pytest
+import xarray as xr
+from pygmt.clib.conversion import file_backed_grid_source, register_file_backed_grid
+
+
+@pytest.fixture(name="fname")
+def fixture_fname(tmp_path):
+    """
+    A small netCDF grid file.
+    """
+    fname = str(tmp_path / "grid.nc")
+    xr.DataArray(
+        np.arange(12.0).reshape((3, 4)),
+        coords={"y": [0, 1, 2], "x": [0, 1, 2, 3]},
+        dims=("y", "x"),
+        name="z",
+    ).to_netcdf(fname)
+    return fname
+
+
+def open_registered(fname):
+    """
+    Open the grid lazily and register it as backed by the file.
+    """
+    grid = xr.open_dataarray(fname, engine="netcdf4")
+    register_file_backed_grid(grid, fname)
+    return grid
+
+
+def test_file_backed_grid_unchanged(fname):
+    """
+    Reading parts of the grid or changing the metadata keeps the file.
+    """
+    grid = open_registered(fname)
+    grid.name = "elevation"
+    grid.attrs["units"] = "m"
+    assert grid.sel(x=1).values.tolist() == [1, 5, 9]
+    assert file_backed_grid_source(grid) == fname
+    # Derived grids are in memory
+    assert file_backed_grid_source(grid.isel(x=slice(0, 2))) is None
+    assert file_backed_grid_source(grid + 1) is None
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda grid: grid.__setitem__((0, 0), 5),
+        lambda grid: grid.__iadd__(1),
+        lambda grid: grid.load(),
+        lambda grid: grid.values,
+        lambda grid: grid.coords.__setitem__("x", grid.x + 1),
+    ],
+)
+def test_file_backed_grid_changed(fname, change):
+    """
+    The file isn't used anymore once the grid is changed or loaded.
+    """
+    grid = open_registered(fname)
+    change(grid)
+    assert file_backed_grid_source(grid) is None
+
+
+def test_file_backed_grid_not_registered(fname):
+    """
+    Grids that aren't registered are never passed as files.
+    """
+    with xr.open_dataarray(fname, engine="netcdf4") as grid:
+        assert file_backed_grid_source(grid) is None
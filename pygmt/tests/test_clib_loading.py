@@ -9,7 +9,15 @@ import types
 from pathlib import PurePath
 
 import pytest
-from pygmt.clib.loading import check_libgmt, clib_full_names, clib_names, load_libgmt
+from pygmt.clib import loading
+from pygmt.clib.loading import (
+    check_libgmt,
+    clear_libgmt_cache,
+    clib_full_names,
+    clib_names,
+    get_libgmt,
+    load_libgmt,
+)
 from pygmt.exceptions import GMTCLibError, GMTCLibNotFoundError, GMTOSError
 
 
@@ -324,3 +332,49 @@ def test_clib_full_names_gmt_library_path_incorrect_path_included(
         # Windows: find_library() searches the library in PATH, so one more
         npath = 2 if sys.platform == "win32" else 1
         assert list(lib_fullpaths) == [gmt_lib_realpath] * npath + gmt_lib_names
+
+
+###############################################################################
+# Tests for get_libgmt
+def test_get_libgmt_is_cached(monkeypatch):
+    """
+    Make sure the library discovery runs only once per environment.
+    """
+    calls = []
+
+    def counting_clib_full_names(env=None):
+        calls.append(env)
+        return clib_full_names(env=env)
+
+    clear_libgmt_cache()
+    monkeypatch.delenv("PYGMT_CACHE_DIR", raising=False)
+    monkeypatch.setattr(loading, "clib_full_names", counting_clib_full_names)
+    libgmt = get_libgmt()
+    check_libgmt(libgmt)
+    assert get_libgmt() is libgmt
+    assert len(calls) == 1
+    # A different environment triggers a new discovery
+    monkeypatch.setenv("GMT_LIBRARY_PATH", "/not/a/real/path")
+    check_libgmt(get_libgmt())
+    assert len(calls) == 2
+    clear_libgmt_cache()
+
+
+def test_get_libgmt_disk_cache(monkeypatch, tmp_path):
+    """
+    Make sure the resolved library path is reused from the on-disk cache.
+    """
+    monkeypatch.setenv("PYGMT_CACHE_DIR", str(tmp_path))
+    clear_libgmt_cache()
+    libgmt = get_libgmt()
+    clear_libgmt_cache()
+    if loading._resolved_path(libgmt) is None:  # pylint: disable=protected-access
+        pytest.skip("GMT library was found in the default search path")
+    assert (tmp_path / "libgmt.json").exists()
+
+    def failing_clib_full_names(env=None):
+        raise AssertionError("The library discovery should have been skipped")
+
+    monkeypatch.setattr(loading, "clib_full_names", failing_clib_full_names)
+    check_libgmt(get_libgmt())
+    clear_libgmt_cache()
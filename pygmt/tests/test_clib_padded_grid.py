@@ -0,0 +1,81 @@
+"""
+Test passing grids stored in padded buffers to GMT.
+"""
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+from pygmt import clib
+from pygmt.clib.conversion import padded_grid, padded_grid_buffer
+from pygmt.helpers import GMTTempFile
+
+
+@pytest.fixture(name="grid")
+def fixture_grid():
+    """
+    A small grid with the rows going from South to North.
+    """
+    return xr.DataArray(
+        np.arange(12.0).reshape((3, 4)),
+        coords={"y": [0, 1, 2], "x": [0, 1, 2, 3]},
+        dims=("y", "x"),
+        name="z",
+        attrs={"units": "m"},
+    )
+
+
+def test_padded_grid(grid):
+    """
+    The padded grid has the same values, coordinates and metadata.
+    """
+    grid.gmt.registration = 1
+    padded = grid.gmt.padded()
+    assert padded.dtype == np.float32
+    xr.testing.assert_allclose(padded, grid)
+    assert padded.attrs == grid.attrs
+    assert padded.gmt.registration == 1
+    buffer, pad = padded_grid_buffer(padded)
+    assert pad == 2
+    assert buffer.shape == (7, 8)
+    assert buffer.flags.c_contiguous
+    # North to South in the buffer
+    npt.assert_allclose(buffer[2:-2, 2:-2], grid.values[::-1])
+    assert np.shares_memory(buffer, padded.values)
+
+
+def test_padded_grid_descending(grid):
+    """
+    Grids going from North to South and East to West are flipped in the
+    buffer.
+    """
+    grid = grid.isel(x=slice(None, None, -1), y=slice(None, None, -1))
+    buffer, pad = padded_grid_buffer(padded_grid(grid, pad=1))
+    assert pad == 1
+    npt.assert_allclose(buffer[1:-1, 1:-1], grid.values[:, ::-1])
+
+
+def test_padded_grid_changes(grid):
+    """
+    Changing values in place keeps the buffer, replacing the data doesn't.
+    """
+    padded = padded_grid(grid)
+    padded[0, 0] = -1
+    buffer, _ = padded_grid_buffer(padded)
+    assert buffer[-3, 2] == -1
+    padded.values = np.zeros(grid.shape, dtype=np.float32)
+    assert padded_grid_buffer(padded) is None
+    assert padded_grid_buffer(grid) is None
+
+
+def test_virtualfile_from_padded_grid(grid):
+    """
+    GMT gets the same grid with or without the pad.
+    """
+    outputs = []
+    for data in (grid, grid.gmt.padded()):
+        with clib.Session() as lib:
+            with lib.virtualfile_from_grid(data) as vfile:
+                with GMTTempFile() as outfile:
+                    lib.call_module("grdinfo", f"{vfile} -C ->{outfile.name}")
+                    outputs.append(outfile.read().split()[1:])
+    assert outputs[0] == outputs[1]
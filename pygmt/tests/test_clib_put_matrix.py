@@ -15,7 +15,7 @@ def test_put_matrix():
     """
     Check that assigning a numpy 2d array to a dataset works.
     """
-    dtypes = "float32 float64 int32 int64 uint32 uint64".split()
+    dtypes = "float32 float64 int8 int16 int32 int64 uint8 uint16 uint32 uint64".split()
     shape = (3, 4)
     for dtype in dtypes:
         with clib.Session() as lib:
@@ -61,7 +61,7 @@ def test_put_matrix_grid():
     """
     Check that assigning a numpy 2d array to an ASCII and NetCDF grid works.
     """
-    dtypes = "float32 float64 int32 int64 uint32 uint64".split()
+    dtypes = "float32 float64 int8 int16 int32 int64 uint8 uint16 uint32 uint64".split()
     wesn = [10, 15, 30, 40, 0, 0]
     inc = [1, 1]
     shape = ((wesn[3] - wesn[2]) // inc[1] + 1, (wesn[1] - wesn[0]) // inc[0] + 1)
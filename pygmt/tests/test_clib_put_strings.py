@@ -13,9 +13,11 @@ with clib.Session() as _lib:
     gmt_version = Version(_lib.info["version"])
 
 
-def test_put_strings():
+@pytest.mark.parametrize("method", ["GMT_IS_DUPLICATE", "GMT_IS_REFERENCE"])
+def test_put_strings(method):
     """
-    Check that assigning a numpy array of dtype str to a dataset works.
+    Check that assigning a numpy array of dtype str to a dataset works, with
+    GMT copying the strings or referencing them.
     """
     with clib.Session() as lib:
         dataset = lib.create_data(
@@ -29,9 +31,7 @@ def test_put_strings():
         strings = np.array(["a", "bc", "defg", "hijklmn", "opqrst"], dtype=str)
         lib.put_vector(dataset, column=lib["GMT_X"], vector=x)
         lib.put_vector(dataset, column=lib["GMT_Y"], vector=y)
-        lib.put_strings(
-            dataset, family="GMT_IS_VECTOR|GMT_IS_DUPLICATE", strings=strings
-        )
+        lib.put_strings(dataset, family=f"GMT_IS_VECTOR|{method}", strings=strings)
         # Turns out wesn doesn't matter for Datasets
         wesn = [0] * 6
         # Save the data to a file to see if it's being accessed correctly
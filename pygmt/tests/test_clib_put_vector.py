@@ -16,7 +16,7 @@ def test_put_vector():
     """
     Check that assigning a numpy array to a dataset works.
     """
-    dtypes = "float32 float64 int32 int64 uint32 uint64".split()
+    dtypes = "float32 float64 int8 int16 int32 int64 uint8 uint16 uint32 uint64".split()
     for dtype in dtypes:
         with clib.Session() as lib:
             dataset = lib.create_data(
@@ -176,6 +176,40 @@ def test_put_vector_invalid_dtype():
             lib.put_vector(dataset, column=1, vector=data)
 
 
+def test_put_vector_datetime():  # pylint: disable=protected-access
+    """
+    Check that datetimes are passed as numbers in the GMT time system and read
+    as absolute time by modules.
+    """
+    times = np.array(["2020-01-01", "2020-01-02T12:00:00"], dtype="datetime64[s]")
+    with clib.Session() as lib:
+        family = "GMT_IS_DATASET|GMT_VIA_VECTOR"
+        geometry = "GMT_IS_POINT"
+        dataset = lib.create_data(
+            family=family,
+            geometry=geometry,
+            mode="GMT_CONTAINER_ONLY",
+            dim=[2, 2, 1, 0],  # columns, rows, layers, dtype
+        )
+        lib.put_vector(dataset, column=lib["GMT_X"], vector=times)
+        lib.put_vector(dataset, column=lib["GMT_Y"], vector=np.arange(2.0))
+        # Default GMT time system: seconds since 1970-01-01T00:00:00
+        (numbers,) = lib._time_vectors.values()
+        npt.assert_allclose(numbers, [1577836800, 1577966400])
+        # No -f option needed to read the column as absolute time
+        with lib.open_virtual_file(family, geometry, "GMT_IN", dataset) as vfile:
+            with GMTTempFile() as tmp_file:
+                lib.call_module("info", f"{vfile} ->{tmp_file.name}")
+                output = tmp_file.read().strip()
+        assert output == (
+            "<vector memory>: N = 2 <2020-01-01T00:00:00/2020-01-02T12:00:00> <0/1>"
+        )
+        with lib.virtualfile_from_vectors(times, np.arange(2)) as vfile:
+            assert len(lib._time_vectors) == 2
+        # Only the vector put directly is still kept alive
+        assert len(lib._time_vectors) == 1
+
+
 def test_put_vector_wrong_column():
     """
     Check that it fails with an exception when giving an invalid column.
@@ -0,0 +1,150 @@
+"""
+Test streaming tables to GMT in chunks.
+"""
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+from pygmt import blockmean, clib
+from pygmt.exceptions import GMTInvalidInput
+from pygmt.helpers import GMTTempFile, TableChunks, data_kind, iter_chunks
+
+
+@pytest.fixture(name="table")
+def fixture_table():
+    """
+    A table with x, y and z columns.
+    """
+    rng = np.random.default_rng(seed=42)
+    return rng.uniform(low=0, high=10, size=(1000, 3))
+
+
+def info(lib, vfile):
+    """
+    Get the bounds of a table with GMT info.
+    """
+    with GMTTempFile() as outfile:
+        lib.call_module("info", f"{vfile} -C ->{outfile.name}")
+        return np.array(outfile.read().split(), dtype="float64")
+
+
+def test_virtualfile_from_stream(table):
+    """
+    GMT gets the whole table, streamed in chunks of different types.
+    """
+    chunks = [
+        table[:300],
+        pd.DataFrame(table[300:600], columns=["x", "y", "z"]),
+        table[600:].tolist(),
+    ]
+    with clib.Session() as lib:
+        with lib.virtualfile_from_stream(iter(chunks)) as vfile:
+            output = info(lib, vfile)
+    npt.assert_allclose(output[::2], table.min(axis=0))
+    npt.assert_allclose(output[1::2], table.max(axis=0))
+
+
+def test_virtualfile_from_stream_memmap(table, tmp_path):
+    """
+    Memory mapped arrays are split into chunks of rows.
+    """
+    fname = str(tmp_path / "table.bin")
+    table.tofile(fname)
+    data = np.memmap(fname, dtype="float64", mode="r", shape=table.shape)
+    with clib.Session() as lib:
+        with lib.virtualfile_from_data(data=iter_chunks(data, rows=64)) as vfile:
+            output = info(lib, vfile)
+    npt.assert_allclose(output[1::2], table.max(axis=0))
+
+
+def test_virtualfile_from_stream_unread(table):
+    """
+    Streams that GMT doesn't read (or stops reading) are closed and removed.
+    """
+    with clib.Session() as lib:
+        with lib.virtualfile_from_stream(table) as vfile:
+            assert os.path.exists(vfile)
+    assert not os.path.exists(vfile)
+
+
+def test_virtualfile_from_stream_fails():
+    """
+    Empty streams and chunks with different numbers of columns are errors.
+    """
+    with clib.Session() as lib:
+        with pytest.raises(GMTInvalidInput):
+            with lib.virtualfile_from_stream(iter([])):
+                pass
+        with pytest.raises(GMTInvalidInput):
+            chunks = iter([np.zeros((2, 3)), np.zeros((2, 2))])
+            with lib.virtualfile_from_stream(chunks) as vfile:
+                info(lib, vfile)
+
+
+def test_blockmean_stream(table):
+    """
+    Block averages of a streamed table are the same as of the whole table.
+    """
+    kwargs = dict(spacing="1", region=[0, 10, 0, 10])
+    expected = blockmean(table=pd.DataFrame(table), **kwargs)
+    output = blockmean(table=iter_chunks(table, rows=100), **kwargs)
+    npt.assert_allclose(output.values, expected.values)
+
+
+def test_stream_binary_input():
+    """
+    Only a stream passed first (like the wrappers do) is read as binary,
+    whatever the other arguments look like.
+    """
+    lib = clib.Session()
+    lib._stream_files["/tmp/stream/table.bin"] = 3  # pylint: disable=protected-access
+    for args, expected in [
+        ("/tmp/stream/table.bin -C", "/tmp/stream/table.bin -C -bi3d"),
+        (
+            '/tmp/stream/table.bin -B+t"A title" -G0/0/0',
+            '/tmp/stream/table.bin -B+t"A title" -G0/0/0 -bi3d',
+        ),
+        ("/tmp/stream/table.bin -bi3f", "/tmp/stream/table.bin -bi3f"),
+        ("table.txt /tmp/stream/table.bin -C", "table.txt /tmp/stream/table.bin -C"),
+        ("/tmp/stream/table.bin.txt -C", "/tmp/stream/table.bin.txt -C"),
+    ]:
+        # pylint: disable=protected-access
+        assert lib._add_stream_binary_input(args) == expected
+
+
+def test_blockmean_memmap(table, tmp_path):
+    """
+    Memory mapped arrays are block averaged in chunks.
+    """
+    fname = str(tmp_path / "table.bin")
+    table.tofile(fname)
+    data = np.memmap(fname, dtype="float64", mode="r", shape=table.shape)
+    kwargs = dict(spacing="1", region=[0, 10, 0, 10])
+    expected = blockmean(table=pd.DataFrame(table), **kwargs)
+    output = blockmean(table=data, **kwargs)
+    npt.assert_allclose(output.values, expected.values)
+
+
+def test_blockmean_ndarray(table):
+    """
+    In-memory arrays are passed as a matrix, with the same block averages.
+    """
+    kwargs = dict(spacing="1", region=[0, 10, 0, 10])
+    expected = blockmean(table=pd.DataFrame(table), **kwargs)
+    output = blockmean(table=table, **kwargs)
+    npt.assert_allclose(output.values, expected.values)
+
+
+def test_data_kind_stream(tmp_path):
+    """
+    Only chunks wrapped in TableChunks are streams, not any iterator.
+    """
+    assert data_kind(iter_chunks(np.zeros((5, 3)), rows=2)) == "stream"
+    assert data_kind(TableChunks([np.zeros((5, 3))])) == "stream"
+    assert data_kind(chunk for chunk in [np.zeros((5, 3))]) == "matrix"
+    fname = tmp_path / "table.txt"
+    fname.write_text("1 2 3\n")
+    with open(fname) as table:
+        assert data_kind(table) == "matrix"
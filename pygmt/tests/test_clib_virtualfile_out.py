@@ -0,0 +1,213 @@
+"""
+Test the output virtual files and the conversion of GMT data containers.
+"""
+import ctypes as ctp
+import gc
+import weakref
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+import xarray as xr
+from pygmt import clib
+from pygmt.clib.structures import (
+    _GMT_DATASEGMENT,
+    _GMT_DATASET,
+    _GMT_DATATABLE,
+    _GMT_GRID,
+    _GMT_GRID_HEADER,
+)
+from pygmt.datasets import load_earth_relief
+
+
+@pytest.fixture(scope="module", name="grid")
+def fixture_grid():
+    """
+    Load the grid data from the sample earth_relief file.
+    """
+    return load_earth_relief(registration="pixel")
+
+
+def test_virtualfile_out_fname():
+    """
+    Make sure the actual file name is used if given.
+    """
+    with clib.Session() as lib:
+        with lib.virtualfile_out(kind="grid", fname="outgrid.nc") as outfile:
+            assert outfile == "outgrid.nc"
+            assert lib.virtualfile_to_grid(outfile, outgrid="outgrid.nc") is None
+
+
+def test_virtualfile_to_grid(grid):
+    """
+    Make sure the output grid matches the input when cutting a subregion.
+    """
+    with clib.Session() as lib:
+        with lib.virtualfile_from_grid(grid) as infile:
+            with lib.virtualfile_out(kind="grid") as outfile:
+                lib.call_module("grdcut", f"{infile} -R0/10/-10/0 -G{outfile}")
+                result = lib.virtualfile_to_grid(outfile)
+    expected = grid.sel(lat=slice(-10, 0), lon=slice(0, 10))
+    assert result.dims == ("lat", "lon")
+    assert result.gmt.registration == 1
+    assert result.gmt.gtype == 1
+    npt.assert_allclose(result.lat, expected.lat)
+    npt.assert_allclose(result.lon, expected.lon)
+    npt.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["int16", "uint8"])
+def test_virtualfile_from_grid_native_dtype(grid, dtype):
+    """
+    Small integer grids are passed in their type and the output converted.
+    """
+    grid = grid.clip(0, 255).astype(dtype)
+    with clib.Session() as lib:
+        with lib.virtualfile_from_grid(grid) as infile:
+            with lib.virtualfile_out(kind="grid") as outfile:
+                lib.call_module("grdcut", f"{infile} -R0/10/-10/0 -G{outfile}")
+                result = lib.virtualfile_to_grid(outfile, dtype=dtype)
+    expected = grid.sel(lat=slice(-10, 0), lon=slice(0, 10))
+    assert result.dtype == dtype
+    assert result.gmt.registration == 1
+    npt.assert_array_equal(result, expected)
+
+
+def test_grid_to_dataarray():
+    """
+    Convert a padded GMT_GRID structure built by hand to a DataArray.
+    """
+    header = _GMT_GRID_HEADER(n_columns=4, n_rows=3, registration=0)
+    header.wesn[:] = [0, 3, 10, 12]
+    header.inc[:] = [1, 1]
+    header.z_min, header.z_max = 0, 11
+    header.z_units = b"elevation [m]"
+    header.pad[:] = [2, 2, 2, 2]
+    header.mx, header.my = 8, 7
+    padded = np.full((7, 8), np.nan, dtype=np.float32)
+    # GMT stores the rows from north to south
+    padded[2:5, 2:6] = np.arange(12, dtype=np.float32).reshape((3, 4))
+    grid = _GMT_GRID(
+        header=ctp.pointer(header),
+        data=padded.ctypes.data_as(ctp.POINTER(ctp.c_float)),
+    )
+    result = grid.to_dataarray()
+    assert isinstance(result, xr.DataArray)
+    assert result.dims == ("y", "x")
+    assert result.attrs["long_name"] == "elevation"
+    assert result.attrs["units"] == "m"
+    assert result.gmt.registration == 0
+    assert result.gmt.gtype == 0
+    npt.assert_allclose(result.x, [0, 1, 2, 3])
+    npt.assert_allclose(result.y, [10, 11, 12])
+    npt.assert_allclose(result, np.arange(12).reshape((3, 4))[::-1])
+
+
+def test_virtualfile_to_dataset():
+    """
+    Make sure the output table matches the input vectors.
+    """
+    x = np.arange(5, dtype=np.float64)
+    y = x ** 2
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(x, y) as infile:
+            with lib.virtualfile_out(kind="dataset") as outfile:
+                lib.call_module("gmtconvert", f"{infile} ->{outfile}")
+                result = lib.virtualfile_to_dataset(outfile, column_names=["x", "y"])
+    expected = pd.DataFrame({"x": x, "y": y})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_dataset_to_dataframe():
+    """
+    Convert a GMT_DATASET structure with two segments built by hand.
+    """
+    keep = []  # keep the ctypes buffers alive
+    segments = (ctp.POINTER(_GMT_DATASEGMENT) * 2)()
+    for i, (start, text) in enumerate([(0, b"a"), (3, b"b")]):
+        columns = (ctp.POINTER(ctp.c_double) * 2)()
+        for col in range(2):
+            values = (ctp.c_double * 3)(*range(start + col, start + col + 3))
+            keep.append(values)
+            columns[col] = ctp.cast(values, ctp.POINTER(ctp.c_double))
+        strings = (ctp.c_char_p * 3)(text, text, text)
+        keep.extend([columns, strings])
+        segment = _GMT_DATASEGMENT(
+            n_rows=3,
+            n_columns=2,
+            data=ctp.cast(columns, ctp.POINTER(ctp.POINTER(ctp.c_double))),
+            text=ctp.cast(strings, ctp.POINTER(ctp.c_char_p)),
+        )
+        keep.append(segment)
+        segments[i] = ctp.pointer(segment)
+    headers = (ctp.c_char_p * 1)(b"# x y name")
+    table = _GMT_DATATABLE(
+        n_headers=1,
+        n_columns=2,
+        n_segments=2,
+        n_records=6,
+        header=ctp.cast(headers, ctp.POINTER(ctp.c_char_p)),
+        segment=ctp.cast(segments, ctp.POINTER(ctp.POINTER(_GMT_DATASEGMENT))),
+    )
+    tables = (ctp.POINTER(_GMT_DATATABLE) * 1)(ctp.pointer(table))
+    dataset = _GMT_DATASET(
+        n_tables=1,
+        n_columns=2,
+        n_segments=2,
+        n_records=6,
+        table=ctp.cast(tables, ctp.POINTER(ctp.POINTER(_GMT_DATATABLE))),
+    )
+    assert dataset.header(0) == "x y name"
+    assert dataset.header(1) is None
+    result = dataset.to_dataframe(header=0)
+    assert list(result.columns) == ["x", "y", "name"]
+    npt.assert_allclose(result.x, [0, 1, 2, 3, 4, 5])
+    npt.assert_allclose(result.y, [1, 2, 3, 4, 5, 6])
+    assert list(result.name) == ["a"] * 3 + ["b"] * 3
+
+
+def test_grid_to_dataarray_view():
+    """
+    Make sure the DataArray views the grid memory and keeps its owner alive.
+    """
+
+    class Owner:  # pylint: disable=too-few-public-methods
+        """
+        Stand-in for the object freeing the grid memory.
+        """
+
+    header = _GMT_GRID_HEADER(n_columns=2, n_rows=2, registration=1)
+    header.wesn[:] = [0, 2, 0, 2]
+    header.inc[:] = [1, 1]
+    header.pad[:] = [1, 1, 1, 1]
+    header.mx, header.my = 4, 4
+    padded = np.zeros((4, 4), dtype=np.float32)
+    padded[1:3, 1:3] = [[2, 3], [0, 1]]
+    grid = _GMT_GRID(
+        header=ctp.pointer(header),
+        data=padded.ctypes.data_as(ctp.POINTER(ctp.c_float)),
+    )
+    owner = Owner()
+    alive = weakref.ref(owner)
+    result = grid.to_dataarray(owner=owner)
+    del owner
+    assert np.shares_memory(result.values, padded)
+    npt.assert_allclose(result, [[0, 1], [2, 3]])
+    assert alive() is not None
+    del result
+    gc.collect()
+    assert alive() is None
+
+
+def test_virtualfile_to_grid_no_copy(grid):
+    """
+    Make sure a grid that isn't copied outlives the session.
+    """
+    with clib.Session() as lib:
+        with lib.virtualfile_from_grid(grid) as infile:
+            with lib.virtualfile_out(kind="grid") as outfile:
+                lib.call_module("grdcut", f"{infile} -R0/10/-10/0 -G{outfile}")
+                result = lib.virtualfile_to_grid(outfile, copy=False)
+    expected = grid.sel(lat=slice(-10, 0), lon=slice(0, 10))
+    npt.assert_allclose(result, expected)
@@ -0,0 +1,278 @@
+"""
+Test the management of the local copies of the remote datasets.
+"""
+import os
+import socket
+import time
+
+import pytest
+from pygmt.datasets import (
+    cached_files_size,
+    earth_relief_tiles,
+    evict_cached_files,
+    list_cached_files,
+    pin_earth_relief,
+    set_cache_budget,
+    unpin_earth_relief,
+)
+from pygmt.datasets.cache import (
+    DOWNLOAD_TIMEOUT,
+    _convert_tiles,
+    _data_server_url,
+    _download_tile,
+    _download_tiles,
+    _download_timeout,
+    _resolve_data_server,
+    _touch_tiles,
+)
+from pygmt.exceptions import GMTCLibError, GMTInvalidInput
+
+
+@pytest.fixture(name="server")
+def fixture_server(tmp_path):
+    """
+    A fake GMT server directory with three 05m tiles used one after the other
+    and the GMT bookkeeping files.
+    """
+    tiledir = tmp_path / "earth" / "earth_relief" / "earth_relief_05m_p"
+    tiledir.mkdir(parents=True)
+    for i, tile in enumerate(["S90W180", "N00W180", "N00E000"]):
+        path = tiledir / f"{tile}.earth_relief_05m_p.nc"
+        path.write_bytes(b"0" * 100)
+        os.utime(path, (1000 + i, 1000 + i))
+    (tmp_path / "gmt_hash_server.txt").write_text("hashes")
+    return tmp_path
+
+
+@pytest.fixture(name="grid_file")
+def fixture_grid_file(server):
+    """
+    A non-tiled grid in the fake server directory, used before all tiles.
+    """
+    path = server / "earth" / "earth_relief" / "earth_relief_01d_g.grd"
+    path.write_bytes(b"0" * 50)
+    os.utime(path, (10, 10))
+    return path
+
+
+def test_list_cached_files(server):
+    """
+    List the cached files, from the least to the most recently used.
+    """
+    files = list_cached_files(directory=server)
+    assert [os.path.basename(path)[:7] for path in files.path] == [
+        "S90W180",
+        "N00W180",
+        "N00E000",
+    ]
+    assert files["size"].tolist() == [100, 100, 100]
+    assert not files["pinned"].any()
+    assert cached_files_size(directory=server) == 300
+    assert cached_files_size(directory=server / "missing") == 0
+
+
+def test_evict_cached_files(server):
+    """
+    Remove the least recently used files first, except the pinned ones.
+    """
+    pin_earth_relief([-180, -90, -90, -1], "05m", directory=server)
+    removed = evict_cached_files(budget=200, directory=server)
+    assert [os.path.basename(path)[:7] for path in removed] == ["N00W180"]
+    files = list_cached_files(directory=server)
+    assert files["pinned"].tolist() == [True, False]
+    unpin_earth_relief([-180, -90, -90, -1], "05m", directory=server)
+    assert evict_cached_files(budget=0, directory=server)
+    assert cached_files_size(directory=server) == 0
+
+
+def test_evict_cached_files_keeps_grids(server, grid_file):
+    """
+    Only tiles are removed, never the non-tiled grids (even if older).
+    """
+    files = list_cached_files(directory=server)
+    assert files["tile"].tolist() == [False, True, True, True]
+    removed = evict_cached_files(budget=0, directory=server)
+    assert len(removed) == 3
+    assert grid_file.exists()
+    assert cached_files_size(directory=server) == 50
+
+
+def test_set_cache_budget(server):
+    """
+    Make sure the budget is stored and enforced.
+    """
+    removed = set_cache_budget(200, directory=server)
+    assert len(removed) == 1
+    assert not evict_cached_files(directory=server)
+    assert not set_cache_budget(None, directory=server)
+    with pytest.raises(GMTInvalidInput):
+        set_cache_budget(-1, directory=server)
+
+
+def test_earth_relief_tiles():
+    """
+    Check the tiles covering a region, including across the dateline.
+    """
+    assert earth_relief_tiles("170/190/-1/1", "01m") == [
+        "@S30E150.earth_relief_01m_p.jp2",
+        "@S30W180.earth_relief_01m_p.jp2",
+        "@N00E150.earth_relief_01m_p.jp2",
+        "@N00W180.earth_relief_01m_p.jp2",
+    ]
+    assert earth_relief_tiles([135.5, 136.5, 35, 35.5], "03s", use_srtm=True) == [
+        "@N35E135.srtm_relief_03s_g.jp2",
+        "@N35E136.srtm_relief_03s_g.jp2",
+    ]
+    with pytest.raises(GMTInvalidInput):
+        earth_relief_tiles([0, 1, 0, 1], "01d")
+    with pytest.raises(GMTInvalidInput):
+        earth_relief_tiles([0, 1, 0, 1], "05m", registration="bogus")
+    for region in ["JP", "g", "-10/10/-5/5+r"]:
+        with pytest.raises(GMTInvalidInput):
+            earth_relief_tiles(region, "05m")
+
+
+def test_download_tiles_from_file_server(tmp_path):
+    """
+    Download tiles concurrently from a file-based stand-in for the server.
+    """
+    remote = tmp_path / "remote"
+    local = tmp_path / "local"
+    tiles = earth_relief_tiles([-60, 60, 0, 10], "01m")
+    assert len(tiles) == 4
+    # The server only has the first three tiles and the second is local already
+    for tile in tiles[:3]:
+        name = tile.lstrip("@")
+        path = remote / "server" / "earth" / "earth_relief" / "earth_relief_01m_p"
+        path.mkdir(parents=True, exist_ok=True)
+        (path / name).write_bytes(name.encode())
+    tiledir = local / "earth" / "earth_relief" / "earth_relief_01m_p"
+    tiledir.mkdir(parents=True)
+    (tiledir / tiles[1].lstrip("@").replace(".jp2", ".nc")).write_bytes(b"nc")
+
+    paths = _download_tiles(tiles, remote.as_uri(), local, max_workers=4)
+    assert [path.name for path in paths] == [
+        tiles[0].lstrip("@"),
+        tiles[1].lstrip("@").replace(".jp2", ".nc"),
+        tiles[2].lstrip("@"),
+    ]
+    assert paths[0].read_bytes() == tiles[0].lstrip("@").encode()
+    assert sorted(os.listdir(tiledir)) == sorted(path.name for path in paths)
+
+
+def test_download_tile_timeout(tmp_path):
+    """
+    Give up on a tile if the server doesn't answer in time.
+    """
+    with socket.socket() as stalled:
+        # Accepts connections (in the backlog) but never answers
+        stalled.bind(("127.0.0.1", 0))
+        stalled.listen()
+        server = "http://127.0.0.1:{}".format(stalled.getsockname()[1])
+        tile = earth_relief_tiles([0, 10, 0, 10], "05m")[0]
+        start = time.perf_counter()
+        assert _download_tile(tile, server, tmp_path, timeout=0.2) is None
+        assert time.perf_counter() - start < 5
+    assert not list(tmp_path.rglob("*.jp2*"))
+
+
+def test_download_timeout(monkeypatch):
+    """
+    The timeout comes from the argument, the environment or the default.
+    """
+    monkeypatch.delenv("PYGMT_DOWNLOAD_TIMEOUT", raising=False)
+    assert _download_timeout() == DOWNLOAD_TIMEOUT
+    assert _download_timeout(5) == 5
+    monkeypatch.setenv("PYGMT_DOWNLOAD_TIMEOUT", "2.5")
+    assert _download_timeout() == 2.5
+    for timeout in ("bogus", 0):
+        with pytest.raises(GMTInvalidInput):
+            _download_timeout(timeout)
+
+
+def test_convert_tiles_fails(tmp_path, monkeypatch):
+    """
+    Remove the downloaded and partially converted tiles if a conversion fails.
+    """
+
+    class FailingSession:
+        """
+        Stand-in for a session where grdconvert fails after writing a bit.
+        """
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def call_module(self, module, args):  # pylint: disable=no-self-use
+            """
+            Write a partial netCDF tile and fail.
+            """
+            ncfile = args.split("-G")[1].split("=")[0]
+            with open(ncfile, "wb") as output:
+                output.write(b"partial")
+            raise GMTCLibError(f"{module} failed")
+
+    monkeypatch.setattr("pygmt.datasets.cache.Session", FailingSession)
+    paths = [tmp_path / f"N00E0{i}0.earth_relief_01m_p.jp2" for i in range(3)]
+    for path in paths:
+        path.write_bytes(b"jp2")
+    with pytest.raises(GMTCLibError):
+        _convert_tiles(paths)
+    assert not os.listdir(tmp_path)
+
+
+def test_data_server_url(monkeypatch):
+    """
+    GMT is asked for the data server only once.
+    """
+    calls = []
+
+    class Session:
+        """
+        Stand-in for a session, counting the calls.
+        """
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def get_default(self, name):
+            """
+            Get the name of the data server.
+            """
+            calls.append(name)
+            return "oceania"
+
+    monkeypatch.setattr("pygmt.datasets.cache.Session", Session)
+    monkeypatch.delenv("GMT_DATA_SERVER", raising=False)
+    _resolve_data_server.cache_clear()
+    for _ in range(3):
+        assert _data_server_url() == "https://oceania.generic-mapping-tools.org"
+    assert calls == ["GMT_DATA_SERVER"]
+    monkeypatch.setenv("GMT_DATA_SERVER", "http://localhost:8000/")
+    assert _data_server_url() == "http://localhost:8000"
+    assert len(calls) == 1
+    _resolve_data_server.cache_clear()
+
+
+def test_touch_tiles(server, monkeypatch):
+    """
+    Only the tiles of the region are touched, without listing the cache.
+    """
+
+    def fail_listing(directory=None):
+        raise AssertionError("The cache shouldn't be listed.")
+
+    monkeypatch.setattr("pygmt.datasets.cache.list_cached_files", fail_listing)
+    _touch_tiles(earth_relief_tiles([0, 10, 0, 10], "05m"), directory=server)
+    # Without a budget, nothing is evicted (and the cache isn't listed)
+    assert evict_cached_files(directory=server) == []
+    monkeypatch.undo()
+    paths = list_cached_files(server)["path"].tolist()
+    assert os.path.basename(paths[-1]) == "N00E000.earth_relief_05m_p.nc"
+    assert os.path.getatime(paths[-1]) > 2000
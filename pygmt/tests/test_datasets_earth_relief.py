@@ -1,10 +1,17 @@
 """
 Test basic functionality for loading Earth relief datasets.
 """
+import gc
+import os
+
 import numpy as np
 import numpy.testing as npt
 import pytest
+import xarray as xr
+from pygmt import grdinfo
+from pygmt.clib.conversion import file_backed_grid_source
 from pygmt.datasets import load_earth_relief
+from pygmt.datasets.earth_relief import _TemporaryGridFile
 from pygmt.exceptions import GMTInvalidInput
 
 
@@ -46,6 +53,62 @@ def test_earth_relief_01d_with_region():
     npt.assert_allclose(data.max(), 805.5)
 
 
+def test_earth_relief_01d_lazy():
+    """
+    Test loading the earth relief 01d data lazily and passing it to GMT.
+    """
+    data = load_earth_relief(resolution="01d", registration="gridline", lazy=True)
+    assert not data.variable._in_memory  # pylint: disable=protected-access
+    assert data.gmt.registration == 0
+    assert data.gmt.gtype == 1
+    assert data.shape == (181, 361)
+    expected = load_earth_relief(resolution="01d", registration="gridline")
+    npt.assert_allclose(data.sel(lat=slice(-5, 5)), expected.sel(lat=slice(-5, 5)))
+    assert file_backed_grid_source(data).endswith("earth_relief_01d_g.grd")
+    # The grid is passed as a file to GMT
+    npt.assert_allclose(grdinfo(data, per_column="n").split()[4:6], [-8592.5, 5559])
+
+
+def test_earth_relief_01d_lazy_with_region():
+    """
+    Test loading low-resolution earth relief lazily with 'region'.
+    """
+    data = load_earth_relief(
+        resolution="01d", region=[-10, 10, -5, 5], registration="gridline", lazy=True
+    )
+    fname = file_backed_grid_source(data)
+    assert os.path.exists(fname)
+    assert data.shape == (11, 21)
+    npt.assert_allclose(data.max(), 805.5)
+    del data
+    gc.collect()
+    assert not os.path.exists(fname)
+
+
+def test_temporary_grid_file(tmp_path):
+    """
+    Lazy grid files are removed once the arrays indexed from the grid are gone
+    too.
+    """
+    fname = str(tmp_path / "grid.nc")
+    xr.DataArray(np.arange(12.0).reshape((3, 4)), dims=("y", "x")).to_netcdf(fname)
+    grid = xr.open_dataarray(fname, engine="netcdf4")
+    grid.encoding["pygmt_temporary_file"] = _TemporaryGridFile(fname)
+    subset = grid.isel(x=slice(0, 2))
+    copy = grid.copy(deep=True)
+    grid.to_netcdf(str(tmp_path / "copy.nc"))
+    del grid
+    gc.collect()
+    assert os.path.exists(fname)
+    npt.assert_allclose(subset.values, [[0, 1], [4, 5], [8, 9]])
+    del subset
+    gc.collect()
+    assert os.path.exists(fname)
+    del copy
+    gc.collect()
+    assert not os.path.exists(fname)
+
+
 def test_earth_relief_30m():
     """
     Test some properties of the earth relief 30m data.
@@ -75,6 +138,16 @@ def test_earth_relief_05m_with_region():
     assert data.sizes["lon"] == 481
 
 
+def test_earth_relief_05m_with_country_code_region():
+    """
+    Test loading a tiled earth relief grid with a region that isn't 4 numbers
+    (no tiles are prefetched).
+    """
+    data = load_earth_relief(resolution="05m", region="JP")
+    assert data.coords["lon"].data.min() < 130
+    assert data.coords["lat"].data.max() > 45
+
+
 def test_earth_relief_05m_without_region():
     """
     Test loading high-resolution earth relief without passing 'region'.
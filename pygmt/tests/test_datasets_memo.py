@@ -0,0 +1,111 @@
+"""
+Test the memoization of the Earth relief grids.
+"""
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+from pygmt.datasets import (
+    GridMemo,
+    disable_earth_relief_memo,
+    earth_relief_memo,
+    enable_earth_relief_memo,
+    load_earth_relief,
+)
+
+
+def make_grid(size=4, value=1.0):
+    """
+    A small geographic grid with some metadata.
+    """
+    grid = xr.DataArray(
+        np.full((size, size), value),
+        coords={"lat": np.arange(size), "lon": np.arange(size) + 0.5},
+        dims=("lat", "lon"),
+        name="elevation",
+        attrs={"units": "meters"},
+    )
+    grid.lon.attrs["units"] = "degrees_east"
+    grid.gmt.registration = 1
+    grid.gmt.gtype = 1
+    return grid
+
+
+def test_grid_memo_memory():
+    """
+    Cached grids are read-only copies that keep the GMT metadata.
+    """
+    memo = GridMemo(memory_budget=2 ** 20)
+    assert memo.get("key") is None
+    memo.put("key", make_grid())
+    grid = memo.get("key")
+    xr.testing.assert_identical(grid, make_grid())
+    assert grid.gmt.registration == 1
+    assert grid.gmt.gtype == 1
+    with pytest.raises(ValueError):
+        grid[0, 0] = 10
+    memo.clear()
+    assert memo.get("key") is None
+
+
+def test_grid_memo_budget():
+    """
+    The least recently used grids are dropped to fit the memory budget.
+    """
+    nbytes = make_grid().nbytes
+    memo = GridMemo(memory_budget=2 * nbytes)
+    memo.put("a", make_grid())
+    memo.put("b", make_grid())
+    memo.get("a")
+    memo.put("c", make_grid())
+    assert memo.get("a") is not None
+    assert memo.get("b") is None
+    assert memo.get("c") is not None
+    # Grids larger than the budget aren't kept in memory
+    memo.put("big", make_grid(size=8))
+    assert memo.get("big") is None
+
+
+def test_grid_memo_disk(tmp_path):
+    """
+    Grids stored on disk are found by a new memo.
+    """
+    GridMemo(memory_budget=0, directory=tmp_path).put("key", make_grid())
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    memo = GridMemo(memory_budget=2 ** 20, directory=tmp_path)
+    grid = memo.get("key")
+    xr.testing.assert_identical(grid, make_grid())
+    assert grid.gmt.registration == 1
+    assert grid.gmt.gtype == 1
+    memo.clear(disk=True)
+    assert not list(tmp_path.glob("*.npz"))
+    assert memo.get("key") is None
+
+
+def test_grid_memo_disk_unsupported_attrs(tmp_path):
+    """
+    Grids with attributes that can't be stored on disk are only kept in
+    memory.
+    """
+    grid = make_grid()
+    grid.attrs["history"] = {1, 2}
+    memo = GridMemo(memory_budget=2 ** 20, directory=tmp_path)
+    memo.put("key", grid)
+    assert not list(tmp_path.iterdir())
+    assert memo.get("key").attrs["history"] == {1, 2}
+
+
+def test_load_earth_relief_memo(tmp_path):
+    """
+    Memoized grids are returned without calling GMT, for equivalent regions.
+    """
+    enable_earth_relief_memo(directory=tmp_path)
+    try:
+        key = ("05m", (-10.0, 10.0, -5.0, 5.0), None, False)
+        earth_relief_memo().put(key, make_grid(value=42.0))
+        grid = load_earth_relief("05m", region=[-10, 10, -5, 5.0])
+        npt.assert_allclose(grid.values, 42.0)
+        assert grid.gmt.registration == 1
+    finally:
+        disable_earth_relief_memo()
+    assert earth_relief_memo() is None
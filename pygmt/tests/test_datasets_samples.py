@@ -1,6 +1,10 @@
 """
 Test basic functionality for loading sample datasets.
 """
+import os
+
+import numpy as np
+import pandas as pd
 from pygmt.datasets import (
     load_fractures_compilation,
     load_japan_quakes,
@@ -8,6 +12,7 @@ from pygmt.datasets import (
     load_sample_bathymetry,
     load_usgs_quakes,
 )
+from pygmt.datasets.samples import _cached_read
 
 
 def test_japan_quakes():
@@ -72,3 +77,85 @@ def test_fractures_compilation():
     assert summary.loc["max", "length"] == 984.652
     assert summary.loc["min", "azimuth"] == 0.0
     assert summary.loc["max", "azimuth"] == 360.0
+
+
+def test_cached_read(tmp_path):
+    """
+    Parsed tables are read from the sidecar until the file changes.
+    """
+    fname = tmp_path / "table.txt"
+    fname.write_text("1 2\n3 4\n")
+    calls = []
+
+    def reader(fname):
+        calls.append(fname)
+        return pd.read_csv(fname, sep=r"\s+", header=None, names=["x", "y"])
+
+    data = _cached_read(str(fname), reader)
+    assert os.path.exists(f"{fname}.pygmt.npz")
+    pd.testing.assert_frame_equal(_cached_read(str(fname), reader), data)
+    assert len(calls) == 1
+    # Changing the file invalidates the sidecar
+    fname.write_text("1 2\n3 4\n5 6\n")
+    assert _cached_read(str(fname), reader).shape == (3, 2)
+    assert len(calls) == 2
+
+
+def test_cached_read_text_columns(tmp_path):
+    """
+    Text columns (with missing values) and datetimes are read back from the
+    sidecar without pickle.
+    """
+    fname = tmp_path / "table.csv"
+    fname.write_text("time,magType,mag\n2018-01-01T00:00,mb,4.5\n2018-01-02T00:00,,5\n")
+
+    calls = []
+
+    def reader(fname):
+        calls.append(fname)
+        data = pd.read_csv(fname)
+        data["date"] = pd.to_datetime(data["time"])
+        return data
+
+    data = _cached_read(str(fname), reader)
+    with np.load(f"{fname}.pygmt.npz", allow_pickle=False) as cache:
+        assert cache["values_1"].dtype.kind == "U"
+    pd.testing.assert_frame_equal(_cached_read(str(fname), reader), data)
+    assert len(calls) == 1
+
+
+def test_cached_read_timezones(tmp_path):
+    """
+    Timezone-aware datetimes are read back from the sidecar, without
+    rewriting it.
+    """
+    fname = tmp_path / "table.csv"
+    fname.write_text("time\n2018-01-01T00:00:00Z\n2018-01-02T12:30:00Z\n")
+    calls = []
+
+    def reader(fname):
+        calls.append(fname)
+        data = pd.read_csv(fname, parse_dates=["time"])
+        data["local"] = data["time"].dt.tz_convert("Asia/Tokyo")
+        return data
+
+    data = _cached_read(str(fname), reader)
+    assert str(data["local"].dt.tz) == "Asia/Tokyo"
+    mtime = os.stat(f"{fname}.pygmt.npz").st_mtime_ns
+    pd.testing.assert_frame_equal(_cached_read(str(fname), reader), data)
+    assert len(calls) == 1
+    assert os.stat(f"{fname}.pygmt.npz").st_mtime_ns == mtime
+
+
+def test_cached_read_ignores_pickles(tmp_path):
+    """
+    Sidecars that need pickle to load are never unpickled.
+    """
+    fname = tmp_path / "table.txt"
+    fname.write_text("1 2\n")
+    with open(f"{fname}.pygmt.npz", "wb") as sidecar:
+        np.save(sidecar, np.array([{"x": 1}], dtype=object), allow_pickle=True)
+    data = _cached_read(
+        str(fname), lambda fname: pd.read_csv(fname, sep=r"\s+", header=None)
+    )
+    assert data.shape == (1, 2)
@@ -3,13 +3,15 @@ Test the behavior of the Figure class.
 
 Doesn't include the plotting commands which have their own test files.
 """
+import io
 import os
+from types import SimpleNamespace
 
 import numpy as np
 import numpy.testing as npt
 import pytest
 from pygmt import Figure, set_display
-from pygmt.exceptions import GMTInvalidInput
+from pygmt.exceptions import GMTCLibError, GMTInvalidInput
 
 
 def test_figure_region():
@@ -136,6 +138,83 @@ def test_figure_savefig():
     )
 
 
+def test_figure_to_bytes():
+    """
+    Render the figure in memory, with the same content as the saved file.
+    """
+    fig = Figure()
+    fig.basemap(region="10/70/-300/800", projection="X3i/5i", frame="af")
+    png = fig.to_bytes(fmt="png", dpi=100)
+    assert png.startswith(b"\x89PNG")
+    assert fig.to_bytes(fmt="pdf").startswith(b"%PDF")
+    fname = "test_figure_to_bytes.png"
+    fig.savefig(fname, dpi=100)
+    with open(fname, "rb") as image:
+        assert image.read() == png
+    os.remove(fname)
+
+
+def test_figure_to_bytes_shared_memory_fails(monkeypatch, tmp_path):
+    """
+    Render the figure on disk if it can't be rendered in shared memory.
+    """
+    missing = str(tmp_path / "missing")
+    monkeypatch.setattr("pygmt.figure.shared_memory_dir", lambda: missing)
+    fig = Figure()
+    fig.basemap(region="10/70/-300/800", projection="X3i/5i", frame="af")
+    assert fig.to_bytes(fmt="png", dpi=100).startswith(b"\x89PNG")
+    assert not os.path.exists(missing)
+
+
+def test_figure_to_bytes_gmt_fails(monkeypatch, tmp_path):
+    """
+    GMT errors aren't retried on disk, unless shared memory is full.
+    """
+    monkeypatch.setattr("pygmt.figure.shared_memory_dir", lambda: str(tmp_path))
+    fig = Figure()
+    fig.basemap(region="10/70/-300/800", projection="X3i/5i", frame="af")
+    calls = []
+
+    def savefig(fname, **kwargs):  # pylint: disable=unused-argument
+        calls.append(fname)
+        if len(calls) == 1:
+            raise GMTCLibError("Failed to write the image.")
+        with open(fname, "wb") as image:
+            image.write(b"image")
+
+    monkeypatch.setattr(fig, "savefig", savefig)
+    with pytest.raises(GMTCLibError):
+        fig.to_bytes(fmt="png")
+    assert len(calls) == 1
+    calls.clear()
+    full = SimpleNamespace(total=2 ** 20, used=2 ** 20, free=0)
+    monkeypatch.setattr("shutil.disk_usage", lambda path: full)
+    assert fig.to_bytes(fmt="png") == b"image"
+    assert len(calls) == 2
+    assert calls[0].startswith(str(tmp_path))
+    assert not calls[1].startswith(str(tmp_path))
+
+
+def test_figure_savefig_file_object():
+    """
+    Save the figure to file-like objects, in PNG or the format of their name.
+    """
+    fig = Figure()
+    fig.basemap(region="10/70/-300/800", projection="X3i/5i", frame="af")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, dpi=100)
+    assert buffer.getvalue() == fig.to_bytes(fmt="png", dpi=100)
+    buffer = io.BytesIO()
+    buffer.name = "figure.pdf"
+    fig.savefig(buffer)
+    assert buffer.getvalue().startswith(b"%PDF")
+    with pytest.raises(GMTInvalidInput):
+        fig.savefig(io.BytesIO(), show=True)
+    buffer.name = "figure.kml"
+    with pytest.raises(GMTInvalidInput):
+        fig.savefig(buffer)
+
+
 def test_figure_show():
     """
     Test that show creates the correct file name and deletes the temp dir.
@@ -4,7 +4,7 @@ Tests for grd2cpt.
 import os
 
 import pytest
-from pygmt import Figure, grd2cpt
+from pygmt import Figure, Palette, grd2cpt
 from pygmt.datasets import load_earth_relief
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import GMTTempFile
@@ -56,6 +56,15 @@ def test_grd2cpt_output_to_cpt_file(grid):
         assert os.path.getsize(cptfile.name) > 0
 
 
+def test_grd2cpt_palette(grid):
+    """
+    Return the generated static color palette table as an in-memory palette.
+    """
+    palette = grd2cpt(grid=grid, cmap="geo", palette=True)
+    assert isinstance(palette, Palette)
+    assert palette.cpt.strip()
+
+
 def test_grd2cpt_unrecognized_data_type():
     """
     Test that an error will be raised if an invalid data type is passed to
@@ -83,6 +83,18 @@ def test_grdcut_dataarray_in_dataarray_out(grid):
     assert outgrid.sizes["lon"] == 180
 
 
+def test_grdcut_output_dtype(grid):
+    """
+    grdcut keeps the float32 grid of GMT or converts it to output_dtype.
+    """
+    assert grdcut(grid.astype("int16"), region="0/180/0/90").dtype == "float32"
+    outgrid = grdcut(grid, region="0/180/0/90", output_dtype="float64")
+    assert outgrid.dtype == "float64"
+    assert outgrid.gmt.registration == 1
+    assert outgrid.gmt.gtype == 1
+    assert outgrid.data.max() == 5651.5
+
+
 def test_grdcut_fails():
     """
     Check that grdcut fails correctly.
@@ -0,0 +1,63 @@
+"""
+Test that importing pygmt is lazy.
+"""
+import subprocess
+import sys
+
+
+def run_python(code):
+    """
+    Run Python code in a fresh interpreter and return what it prints.
+    """
+    return subprocess.check_output([sys.executable, "-c", code], encoding="utf-8")
+
+
+def test_import_is_lazy():
+    """
+    Make sure "import pygmt" doesn't load the heavy dependencies or libgmt.
+    """
+    heavy = ["numpy", "pandas", "xarray", "pygmt.clib", "pygmt.src"]
+    output = run_python(
+        "import sys; import pygmt; "
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    assert output.strip() == ""
+
+
+def test_import_lazy_attributes():
+    """
+    Make sure the public API is available after a lazy import.
+    """
+    output = run_python(
+        "import pygmt; "
+        "print(pygmt.Figure.__name__, pygmt.which.__name__, "
+        "pygmt.datasets.__name__, 'grdcut' in dir(pygmt))"
+    )
+    assert output.split() == ["Figure", "which", "pygmt.datasets", "True"]
+
+
+def test_import_all():
+    """
+    Make sure "from pygmt import *" exports the public API.
+    """
+    output = run_python(
+        "from pygmt import *; print(Figure.__name__, grdcut.__name__, "
+        "show_versions.__name__, datasets.__name__)"
+    )
+    assert output.split() == ["Figure", "grdcut", "show_versions", "pygmt.datasets"]
+
+
+def test_import_registers_accessor():
+    """
+    Make sure the "gmt" accessor is available whatever the import order.
+    """
+    for code in [
+        "import xarray; import pygmt",
+        "import pygmt; import xarray; pygmt.Figure",
+        "import xarray; from pygmt.datasets import load_earth_relief",
+    ]:
+        output = run_python(f"{code}; print(hasattr(xarray.DataArray, 'gmt'))")
+        assert output.strip() == "True"
+    # No import hook on xarray
+    output = run_python("import sys, pygmt; print(len(sys.meta_path))")
+    assert output == run_python("import sys; print(len(sys.meta_path))")
@@ -5,7 +5,7 @@ import os
 
 import numpy as np
 import pytest
-from pygmt import Figure, makecpt
+from pygmt import Figure, Palette, makecpt
 from pygmt.datasets import load_earth_relief
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import GMTTempFile
@@ -88,6 +88,28 @@ def test_makecpt_output_cpt_file():
         assert os.path.exists(cptfile.name)
 
 
+def test_makecpt_palette(grid):
+    """
+    Return the static color palette table as an in-memory palette and reuse
+    it for several figures.
+    """
+    palette = makecpt(cmap="oleron", series=[-4500, 4500], palette=True)
+    assert isinstance(palette, Palette)
+    assert palette.cpt.splitlines()[-3].startswith("B")
+    for _ in range(2):
+        fig = Figure()
+        fig.grdimage(grid, projection="W0/10c", cmap=palette)
+        fig.colorbar(cmap=palette, frame=True)
+
+
+def test_makecpt_palette_and_output():
+    """
+    Use incorrect setting by asking for both a palette and an output file.
+    """
+    with pytest.raises(GMTInvalidInput):
+        makecpt(output="out.cpt", palette=True)
+
+
 def test_makecpt_blank_output():
     """
     Use incorrect setting by passing in blank file name to output parameter.
@@ -0,0 +1,39 @@
+"""
+Tests for the in-memory color palette tables.
+"""
+import gc
+import os
+
+from pygmt import Palette
+from pygmt.helpers import GMTTempFile
+
+CPT = "0\tblack\t1\twhite\nB\tblack\nF\twhite\nN\tgray\n"
+
+
+def test_palette_fname():
+    """
+    Make sure the palette is written to a file once and removed with it.
+    """
+    palette = Palette(CPT)
+    fname = palette.fname
+    assert fname.endswith(".cpt")
+    assert palette.fname == fname == str(palette) == os.fspath(palette)
+    with open(fname) as cptfile:
+        assert cptfile.read() == CPT
+    del palette
+    gc.collect()
+    assert not os.path.exists(fname)
+
+
+def test_palette_read_save():
+    """
+    Read a palette from a CPT file and save it to another one.
+    """
+    with GMTTempFile(suffix=".cpt") as infile, GMTTempFile(suffix=".cpt") as outfile:
+        with open(infile.name, "w") as cptfile:
+            cptfile.write(CPT)
+        palette = Palette.read(infile.name)
+        assert palette.cpt == CPT
+        assert repr(palette) == "<pygmt.Palette with 4 lines>"
+        palette.save(outfile.name)
+        assert outfile.read(keep_tabs=True) == CPT
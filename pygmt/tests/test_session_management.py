@@ -2,9 +2,14 @@
 Test the session management modules.
 """
 import os
+import threading
+import time
 
+import pytest
 from pygmt.clib import Session
-from pygmt.session_management import begin, end
+from pygmt.clib.session import _GLOBAL_SESSION, _begin_global_session
+from pygmt.exceptions import GMTCLibError, GMTCLibNoSessionError
+from pygmt.session_management import begin, end, session
 
 
 def test_begin_end():
@@ -55,3 +60,93 @@ def test_gmt_compat_6_is_applied(capsys):
         # Make sure no global "gmt.conf" in the current directory
         assert not os.path.exists("gmt.conf")
         begin()  # Restart the global session
+
+
+def test_session_is_shared():
+    """
+    Make sure sessions entered inside pygmt.session() borrow the shared one.
+    """
+    with session() as shared:
+        pointer = shared.session_pointer
+        with Session() as lib:
+            assert lib.session_pointer == pointer
+            lib.call_module("basemap", "-R10/70/-3/8 -JX4i/3i -Ba")
+        # Exiting a borrowed session doesn't destroy the shared one
+        with pytest.raises(GMTCLibNoSessionError):
+            lib.session_pointer  # pylint: disable=pointless-statement
+        assert shared.session_pointer == pointer
+        with session() as nested:
+            assert nested is shared
+    with pytest.raises(GMTCLibNoSessionError):
+        shared.session_pointer  # pylint: disable=pointless-statement
+    with Session() as lib:
+        assert lib.session_pointer != pointer
+
+
+def test_session_error_messages():
+    """
+    Make sure errors in a borrowed session only report their own messages,
+    without losing the messages of the shared session.
+    """
+    with session() as shared:
+        with Session() as lib:
+            with pytest.raises(GMTCLibError) as first:
+                lib.call_module("info", "bogus-file-1.txt")
+        with Session() as lib:
+            with pytest.raises(GMTCLibError) as second:
+                lib.call_module("info", "bogus-file-2.txt")
+        # pylint: disable=protected-access
+        assert "bogus-file-1.txt" in shared._error_message
+    assert "bogus-file-1.txt" in str(first.value)
+    assert "bogus-file-1.txt" not in str(second.value)
+
+
+def test_session_is_thread_local():
+    """
+    Make sure other threads don't borrow the shared session.
+    """
+    pointers = []
+
+    def worker():
+        with Session() as lib:
+            pointers.append(lib.session_pointer)
+
+    with session() as shared:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert pointers[0] != shared.session_pointer
+
+
+def test_begin_global_session_waits(monkeypatch):
+    """
+    Make sure other threads wait until the global session has started.
+    """
+    events = []
+    started = threading.Event()
+
+    def begin_global_session():
+        # Still pending for the checks of other threads
+        assert _GLOBAL_SESSION["pending"]
+        started.set()
+        # Sessions created while starting don't start it again
+        _begin_global_session()
+        time.sleep(0.1)
+        events.append("begin")
+
+    monkeypatch.setattr(
+        "pygmt.session_management.begin_global_session", begin_global_session
+    )
+    monkeypatch.setitem(_GLOBAL_SESSION, "pending", True)
+
+    def worker():
+        started.wait(timeout=5)
+        _begin_global_session()
+        events.append("worker")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    _begin_global_session()
+    thread.join()
+    assert events == ["begin", "worker"]
+    assert not _GLOBAL_SESSION["pending"]
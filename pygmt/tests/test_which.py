@@ -5,7 +5,8 @@ import os
 
 import pytest
 from pygmt import which
-from pygmt.helpers import unique_name
+from pygmt.helpers import GMTTempFile, unique_name
+from pygmt.src.which import _WHICH_CACHE, _cache_key, clear_which_cache
 
 
 def test_which():
@@ -25,3 +26,49 @@ def test_which_fails():
     bogus_file = unique_name()
     with pytest.raises(FileNotFoundError):
         which(bogus_file)
+
+
+def test_which_multiple():
+    """
+    Make sure which resolves a list of @files in one go, in the given order.
+    """
+    fnames = ["tut_quakes.ngdc", "tut_bathy.nc"]
+    cached_files = which([f"@{fname}" for fname in fnames], download="c")
+    assert [os.path.basename(cached_file) for cached_file in cached_files] == fnames
+    assert all(os.path.exists(cached_file) for cached_file in cached_files)
+
+
+def test_which_cache():
+    """
+    Make sure resolved paths are reused while the files exist.
+    """
+    clear_which_cache()
+    with GMTTempFile() as tmpfile:
+        _WHICH_CACHE[_cache_key("@bogus_file", "c")] = tmpfile.name
+        # Doesn't call GMT, which wouldn't find this file
+        assert which("@bogus_file", download="c") == tmpfile.name
+        assert which(["@bogus_file"], download="c") == [tmpfile.name]
+    # The file is gone so GMT is asked again
+    with pytest.raises(FileNotFoundError):
+        which("@bogus_file", download="c")
+    assert _cache_key("@bogus_file", "c") not in _WHICH_CACHE
+    clear_which_cache()
+
+
+def test_which_cache_depends_on_search_dirs(tmp_path, monkeypatch):
+    """
+    Paths resolved in another directory (or with other GMT directories) aren't
+    reused.
+    """
+    clear_which_cache()
+    with GMTTempFile() as tmpfile:
+        _WHICH_CACHE[_cache_key("bogus_file.txt", None)] = tmpfile.name
+        assert which("bogus_file.txt") == tmpfile.name
+        monkeypatch.setenv("GMT_USERDIR", str(tmp_path))
+        with pytest.raises(FileNotFoundError):
+            which("bogus_file.txt")
+        monkeypatch.delenv("GMT_USERDIR")
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            which("bogus_file.txt")
+    clear_which_cache()
@@ -13,6 +13,7 @@ from pygmt import x2sys_cross, x2sys_init
 from pygmt.datasets import load_sample_bathymetry
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import data_kind
+from pygmt.src.x2sys_cross import tempfile_from_dftrack
 
 
 @pytest.fixture(name="mock_x2sys_home")
@@ -89,8 +90,8 @@ def test_x2sys_cross_input_dataframe_output_dataframe(mock_x2sys_home, tracks):
         columns = list(output.columns)
         assert columns[:6] == ["x", "y", "i_1", "i_2", "dist_1", "dist_2"]
         assert columns[6:] == ["head_1", "head_2", "vel_1", "vel_2", "z_X", "z_M"]
-        assert output.dtypes["i_1"].type == np.object_
-        assert output.dtypes["i_2"].type == np.object_
+        assert output.dtypes["i_1"].type == np.float64
+        assert output.dtypes["i_2"].type == np.float64
 
     return output
 
@@ -207,3 +208,48 @@ def test_x2sys_cross_trackvalues(mock_x2sys_home):
         # Check mean of track 1 values (z_1) and track 2 values (z_2)
         npt.assert_allclose(output.z_1.mean(), -2420.569767)
         npt.assert_allclose(output.z_2.mean(), -2400.357549)
+
+
+def test_x2sys_cross_tempfile_from_dftrack():
+    """
+    Write a track with times to a temporary file in the given directory.
+    """
+    track = pd.DataFrame(
+        {
+            "x": [0.5, 1.0],
+            "y": [2.0, 3.0],
+            "t": pd.to_datetime(["2020-01-01T12:00:00.25", None]),
+        }
+    )
+    with TemporaryDirectory() as tmpdir:
+        with tempfile_from_dftrack(
+            track=track, suffix="tsv", directory=tmpdir
+        ) as fname:
+            assert os.path.dirname(fname) == tmpdir
+            assert fname.endswith(".tsv")
+            with open(fname) as trackfile:
+                lines = trackfile.read().splitlines()
+        assert not os.listdir(tmpdir)  # file is removed
+    assert lines == ["x\ty\tt", "0.5\t2.0\t2020-01-01T12:00:00.250000Z", "1.0\t3.0\t"]
+
+
+def test_x2sys_cross_tempfile_from_dftrack_extension_dtypes():
+    """
+    Write a track with pandas extension type and timezone-aware columns.
+    """
+    track = pd.DataFrame(
+        {
+            "x": pd.array([1, None], dtype="Int64"),
+            "t": pd.to_datetime(["2020-01-01T12:00:00", None]).tz_localize("Etc/GMT+2"),
+            "kind": pd.Categorical(["a", "b"]),
+            "name": pd.array(["ship", None], dtype="string"),
+        }
+    )
+    with tempfile_from_dftrack(track=track, suffix="tsv") as fname:
+        with open(fname) as trackfile:
+            lines = trackfile.read().splitlines()
+    assert lines == [
+        "x\tt\tkind\tname",
+        "1\t2020-01-01T14:00:00.000000Z\ta\tship",
+        "\t\tb\t",
+    ]